@@ -4,6 +4,8 @@ Configuration is loaded from configs/config.json via Workflows ResourceConfig.
 
 This project intentionally focuses on Deep Research planning/execution only.
 """
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -13,6 +15,333 @@ class ResearchCollections(BaseModel):
     research_collection: str = Field(..., description="Agent Data collection name for research sessions")
 
 
+class OxylabsClientSettings(BaseModel):
+    """Connection pool settings for the shared Oxylabs HTTP client."""
+
+    max_connections: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum number of concurrent connections to the Oxylabs API.",
+    )
+    max_keepalive_connections: int = Field(
+        default=16,
+        ge=0,
+        description="Maximum number of idle keep-alive connections kept in the pool.",
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="How long an idle pooled connection is kept open before being closed.",
+    )
+    request_timeout_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Default timeout for a single Oxylabs realtime request (includes rendering time).",
+    )
+
+
+class SerpCacheSettings(BaseModel):
+    """On-disk cache of parsed Google SERPs, shared across sessions."""
+
+    enabled: bool = True
+    path: str = Field(default=".cache/serp_cache.sqlite3", description="SQLite database file for cached SERPs.")
+    ttl_seconds: int = Field(default=86400, ge=1, description="How long a cached SERP stays valid.")
+    max_entries: int = Field(
+        default=5000,
+        ge=1,
+        description="Maximum number of cached SERPs; least recently used entries are evicted first.",
+    )
+
+
+class DownloadCacheSettings(BaseModel):
+    """Local content-addressed cache of downloaded documents, shared across sessions."""
+
+    enabled: bool = True
+    directory: str = Field(default=".cache/downloads", description="Directory holding the blob store and its index.")
+    max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        ge=1,
+        description="Byte budget for stored documents; least recently used entries are evicted first.",
+    )
+    fresh_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description="Entries younger than this are served without revalidation; older ones are revalidated.",
+    )
+
+
+class DownloadSettings(BaseModel):
+    """How source documents are fetched through Oxylabs."""
+
+    render_mode: Literal["adaptive", "always", "never"] = Field(
+        default="adaptive",
+        description=(
+            "adaptive: plain fetch first, JS render only when the page has too little text "
+            "(and remember the domain); always/never: force or disable JS rendering."
+        ),
+    )
+    min_static_text_chars: int = Field(
+        default=500,
+        ge=0,
+        description="Minimum visible text a plain fetch must contain to skip the rendered fetch.",
+    )
+
+    max_concurrent_downloads: int = Field(
+        default=16,
+        ge=1,
+        description=(
+            "Global cap on concurrent Oxylabs requests (downloads and searches); "
+            "the starting window when adaptive_concurrency is on."
+        ),
+    )
+    adaptive_concurrency: bool = Field(
+        default=True,
+        description="Adjust the global cap with AIMD from observed 429/5xx errors and latency.",
+    )
+    min_adaptive_concurrency: int = Field(default=2, ge=1)
+    max_adaptive_concurrency: int = Field(default=64, ge=1)
+    aimd_decrease_factor: float = Field(
+        default=0.5,
+        gt=0.0,
+        lt=1.0,
+        description="Multiplier applied to the concurrency window on a congestion signal.",
+    )
+    aimd_latency_tolerance: float = Field(
+        default=2.0,
+        gt=1.0,
+        description="Recent latency above this multiple of the long-run baseline counts as congestion.",
+    )
+    max_concurrent_per_domain: int = Field(
+        default=2,
+        ge=1,
+        description="Maximum concurrent downloads against a single target domain.",
+    )
+    per_domain_requests_per_second: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="Sustained per-domain download rate (token-bucket refill rate).",
+    )
+    per_domain_burst: int = Field(
+        default=3,
+        ge=1,
+        description="Per-domain token-bucket size: how many downloads may start back to back.",
+    )
+
+    max_document_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=1,
+        description="Hard cap on the size of a single downloaded document.",
+    )
+    oversize_policy: Literal["truncate", "abort"] = Field(
+        default="truncate",
+        description="Keep the first max_document_bytes of an oversized document, or drop it entirely.",
+    )
+
+    retry_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts per Oxylabs request for retryable errors (timeouts, connection errors, 429/5xx).",
+    )
+    retry_base_delay_seconds: float = Field(default=0.5, ge=0.0, description="Base delay of the exponential backoff.")
+    retry_max_delay_seconds: float = Field(default=8.0, ge=0.0, description="Upper bound of a single backoff delay.")
+    hedge_enabled: bool = Field(
+        default=False,
+        description="Fire a duplicate download when the first one is slower than the latency percentile below.",
+    )
+    hedge_percentile: float = Field(default=90.0, gt=0.0, lt=100.0)
+    hedge_min_delay_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="Never hedge a download earlier than this, whatever the observed latencies.",
+    )
+    coalesce_in_flight: bool = Field(
+        default=True,
+        description="Share one Oxylabs request between identical searches/downloads that are in flight together.",
+    )
+
+
+class CircuitBreakerSettings(BaseModel):
+    """Per-domain circuit breaker that stops downloading from domains that keep failing."""
+
+    enabled: bool = True
+    window_size: int = Field(default=10, ge=1, description="Recent URLs per domain whose outcomes are tracked.")
+    min_calls: int = Field(default=4, ge=1, description="Outcomes needed before a circuit may open.")
+    failure_rate_threshold: float = Field(default=0.75, gt=0.0, le=1.0)
+    slow_call_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Downloads slower than this count as failures (endless render timeouts).",
+    )
+    cooldown_seconds: float = Field(
+        default=900.0,
+        ge=0.0,
+        description="How long an open circuit fails fast before a single probe is let through.",
+    )
+    path: str | None = Field(
+        default=".cache/circuit_breaker.json",
+        description="Where open circuits are persisted across sessions; null keeps them in memory only.",
+    )
+
+
+class NegativeCacheSettings(BaseModel):
+    """Cross-session record of failed URLs that are not worth fetching again for a while."""
+
+    enabled: bool = True
+    path: str = Field(default=".cache/negative_cache.sqlite3", description="SQLite database file for failed URLs.")
+    ttl_seconds: dict[str, int] = Field(
+        default_factory=lambda: {
+            "not_text": 30 * 86400,
+            "parse_failed": 7 * 86400,
+            "download_failed": 6 * 3600,
+        },
+        description="How long a URL stays blocked, per failure reason. 0 disables caching for that reason.",
+    )
+    default_ttl_seconds: int = Field(default=3600, ge=0, description="TTL for failure reasons not listed above.")
+
+
+class PrefetchSettings(BaseModel):
+    """Opt-in speculative download + parse of the top new SERP results while the agent is thinking."""
+
+    enabled: bool = False
+    top_k: int = Field(default=3, ge=1, description="How many of the shown results to prefetch per web_search call.")
+    ttl_seconds: float = Field(
+        default=180.0,
+        gt=0.0,
+        description="Prefetched documents not claimed by generate_evidences within this time are dropped as wasted.",
+    )
+    max_requests: int = Field(default=12, ge=1, description="Maximum prefetches outstanding at once.")
+    max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        ge=1,
+        description="Stop prefetching while this many downloaded bytes are waiting to be claimed.",
+    )
+
+
+class ContentPrecheckSettings(BaseModel):
+    """Cheap content-type classification that runs before a URL is downloaded."""
+
+    enabled: bool = True
+    head_requests: bool = Field(
+        default=False,
+        description=(
+            "Also send a direct HEAD request to the origin (bypassing Oxylabs) when the URL "
+            "extension is inconclusive. Unanswered or refused HEADs never skip a URL."
+        ),
+    )
+    head_timeout_seconds: float = Field(default=3.0, gt=0.0)
+    skip_extensions: list[str] = Field(
+        default_factory=lambda: [
+            "7z", "apk", "avi", "bin", "bmp", "bz2", "dmg", "exe", "flac", "flv", "gif", "gz",
+            "heic", "ico", "iso", "jpeg", "jpg", "m4a", "m4v", "mkv", "mov", "mp3", "mp4", "mpeg",
+            "msi", "ogg", "otf", "png", "rar", "svg", "tar", "tgz", "tif", "tiff", "ttf", "wav",
+            "webm", "webp", "wmv", "woff", "woff2", "xz", "zip",
+        ],
+        description="URL path extensions that never contain extractable text.",
+    )
+
+
+class EvidenceBatchSettings(BaseModel):
+    """When a generate_evidences call stops waiting for slow sources."""
+
+    deadline_seconds: float | None = Field(
+        default=90.0,
+        gt=0.0,
+        description="Return whatever is ready after this long. None waits for every URL.",
+    )
+    quorum: int | None = Field(
+        default=None,
+        ge=1,
+        description="Return as soon as this many URLs have yielded evidence. None waits for all of them.",
+    )
+    straggler_policy: Literal["background", "cancel"] = Field(
+        default="background",
+        description=(
+            "What happens to URLs still in flight when the call returns: 'background' keeps them "
+            "running and hands their results to a later call (finalize_research cancels what is "
+            "still running), 'cancel' drops them as failed."
+        ),
+    )
+
+
+class EvidencePipelineSettings(BaseModel):
+    """Per-stage concurrency and queue bounds for the download -> parse -> analyze pipeline."""
+
+    download_concurrency: int = Field(default=16, ge=1)
+    parse_concurrency: int = Field(default=4, ge=1)
+    analysis_concurrency: int = Field(default=8, ge=1)
+    parse_queue_size: int = Field(
+        default=8,
+        ge=1,
+        description="Downloaded pages waiting for a parser. Downloads pause while this is full.",
+    )
+    analysis_queue_size: int = Field(
+        default=8,
+        ge=1,
+        description="Parsed documents waiting for analysis. Parsing pauses while this is full.",
+    )
+
+
+class ParserSettings(BaseModel):
+    """Where HTML extraction runs, so it does not block the event loop."""
+
+    executor: Literal["process", "thread", "inline"] = Field(
+        default="process",
+        description="'inline' runs extraction on the event loop thread (only useful for benchmarks and debugging).",
+    )
+    max_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Worker processes. None uses min(4, CPU count).",
+    )
+    thread_max_bytes: int = Field(
+        default=32 * 1024,
+        ge=0,
+        description="Documents up to this size are parsed in a thread, where sending them to a process costs more than it saves.",
+    )
+    warm_pool: bool = Field(default=True, description="Start the worker processes when the parser is created.")
+    fallback_min_chars: int = Field(
+        default=250,
+        ge=0,
+        description=(
+            "Try the slower extractors (Trafilatura with its fallbacks, then the baseline extractor) when the "
+            "fast extractor returns fewer characters than this. 0 only runs the fast extractor."
+        ),
+    )
+    routes: dict[str, list[Literal["passthrough", "trafilatura", "local", "llamaparse"]]] = Field(
+        default_factory=lambda: {
+            "html": ["trafilatura"],
+            "text": ["passthrough", "llamaparse"],
+            "pdf": ["local", "llamaparse"],
+            "docx": ["local", "llamaparse"],
+            "pptx": ["local", "llamaparse"],
+            "office": ["llamaparse"],
+            "unknown": ["trafilatura"],
+        },
+        description=(
+            "Parsers to try, in order, per sniffed document type. The next parser runs only when the "
+            "previous one fails. Types: html, text, pdf, docx, pptx, office (xlsx, odt, epub, rtf, legacy "
+            "doc/ppt/xls), unknown. 'passthrough' keeps the decoded text as is."
+        ),
+    )
+    llamaparse_enabled: bool = Field(
+        default=True,
+        description="Allow routes to LlamaParse (uploads to LlamaCloud, billed). When off, those steps are skipped.",
+    )
+    pdf_max_pages: int = Field(default=60, ge=1, description="Pages read by the local PDF extractor; the rest are dropped.")
+    pdf_page_range: tuple[int, int] | None = Field(
+        default=None,
+        description="1-based inclusive [first, last] pages for the local PDF extractor. None reads from page 1.",
+    )
+    pdf_min_chars_per_page: int = Field(
+        default=200,
+        ge=0,
+        description=(
+            "Below this many extracted characters per page the PDF is treated as scanned and left to the next "
+            "parser in the route (LlamaParse)."
+        ),
+    )
+
+
 class ResearchSettings(BaseModel):
     """Runtime settings for deep research planning/execution."""
 
@@ -28,6 +357,18 @@ class ResearchSettings(BaseModel):
         ),
     )
 
+    oxylabs: OxylabsClientSettings = Field(default_factory=OxylabsClientSettings)
+    serp_cache: SerpCacheSettings = Field(default_factory=SerpCacheSettings)
+    download_cache: DownloadCacheSettings = Field(default_factory=DownloadCacheSettings)
+    downloads: DownloadSettings = Field(default_factory=DownloadSettings)
+    content_precheck: ContentPrecheckSettings = Field(default_factory=ContentPrecheckSettings)
+    circuit_breaker: CircuitBreakerSettings = Field(default_factory=CircuitBreakerSettings)
+    negative_cache: NegativeCacheSettings = Field(default_factory=NegativeCacheSettings)
+    prefetch: PrefetchSettings = Field(default_factory=PrefetchSettings)
+    evidence_batch: EvidenceBatchSettings = Field(default_factory=EvidenceBatchSettings)
+    evidence_pipeline: EvidencePipelineSettings = Field(default_factory=EvidencePipelineSettings)
+    parser: ParserSettings = Field(default_factory=ParserSettings)
+
 
 class LLMModelConfig(BaseModel):
     """Atomic configuration for a single LLM instance."""
@@ -38,6 +379,34 @@ class LLMModelConfig(BaseModel):
 class PlannerConfig(BaseModel):
     main_llm: LLMModelConfig
 
+class SerpRerankConfig(BaseModel):
+    """Local (no LLM) reranking of SERP results before they are shown to the searcher agent."""
+
+    enabled: bool = True
+    top_k: int | None = Field(
+        default=6,
+        ge=1,
+        description="Show only the k best results; null shows all of them, ordered by score.",
+    )
+    show_scores: bool = Field(default=False, description="Print the rerank score next to every result.")
+    position_weight: float = Field(
+        default=0.3,
+        ge=0.0,
+        description="Weight of the original Google position (1st result gets the full weight).",
+    )
+    domain_priors: dict[str, float] = Field(
+        default_factory=lambda: {
+            "wikipedia.org": 0.3,
+            "arxiv.org": 0.2,
+            "nature.com": 0.2,
+            "nih.gov": 0.2,
+            "pinterest.com": -1.0,
+            "quora.com": -0.3,
+        },
+        description="Score added for results from a domain (and its subdomains).",
+    )
+
+
 class SearcherConfig(BaseModel):
     main_llm: LLMModelConfig
     weak_llm: LLMModelConfig
@@ -47,6 +416,36 @@ class SearcherConfig(BaseModel):
         ge=1,
         description="Maximum number of SERP results to return/process for a single search query.",
     )
+    max_serp_pages: int = Field(
+        default=1,
+        ge=1,
+        le=10,
+        description="Maximum Google result pages fetched for a single search query.",
+    )
+    serp_page_wave: int = Field(
+        default=2,
+        ge=1,
+        description=(
+            "After page 1, SERP pages are fetched concurrently this many at a time. Larger waves "
+            "return sooner but may bill pages the early stop would have skipped."
+        ),
+    )
+    serp_min_new_results: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Stop fetching further SERP pages once this many unseen URLs were collected "
+            "(defaults to max_results_per_query)."
+        ),
+    )
+    rerank: SerpRerankConfig = Field(default_factory=SerpRerankConfig)
+    serp_features_as_evidence: bool = Field(
+        default=True,
+        description=(
+            "Add featured snippets, knowledge panels, 'people also ask' answers and top stories "
+            "to the evidence bundle straight from the SERP, without downloading anything."
+        ),
+    )
 
 class OrchestratorConfig(BaseModel):
     main_llm: LLMModelConfig
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Literal
+
+from deep_research.config import CircuitBreakerSettings
+from deep_research.services.metrics import metrics
+from deep_research.services.url_utils import get_url_domain, get_url_key
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(slots=True)
+class _DomainCircuit:
+    state: CircuitState = "closed"
+    opened_at: float = 0.0
+    probing: bool = False
+    # Latest outcome per URL, so a parse failure overrides the download success of the same URL.
+    outcomes: OrderedDict[str, bool] = field(default_factory=OrderedDict)
+
+    def failure_rate(self) -> float:
+        return sum(not ok for ok in self.outcomes.values()) / len(self.outcomes)
+
+
+class DomainCircuitBreaker:
+    """Per-domain circuit breaker for downloads.
+
+    Tracks the outcome of the last `window_size` URLs of each domain (slow downloads count
+    as failures). Once at least `min_calls` outcomes are known and the failure rate reaches
+    `failure_rate_threshold` the circuit opens and downloads for that domain fail fast.
+    After `cooldown_seconds` a single probe is let through: success closes the circuit,
+    failure re-opens it for another cooldown.
+
+    Open circuits are optionally persisted to a JSON file so known-bad domains stay
+    blocked across restarts.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_size: int,
+        min_calls: int,
+        failure_rate_threshold: float,
+        slow_call_seconds: float,
+        cooldown_seconds: float,
+        path: str | Path | None = None,
+    ) -> None:
+        self._window_size = window_size
+        self._min_calls = min_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._cooldown_seconds = cooldown_seconds
+        self._path = Path(path) if path else None
+        self._file_lock = threading.Lock()
+        self._circuits: Dict[str, _DomainCircuit] = self._load()
+
+    @classmethod
+    def from_settings(cls, settings: CircuitBreakerSettings) -> "DomainCircuitBreaker":
+        return cls(
+            window_size=settings.window_size,
+            min_calls=settings.min_calls,
+            failure_rate_threshold=settings.failure_rate_threshold,
+            slow_call_seconds=settings.slow_call_seconds,
+            cooldown_seconds=settings.cooldown_seconds,
+            path=settings.path,
+        )
+
+    def state(self, url: str) -> CircuitState:
+        circuit = self._circuits.get(get_url_domain(url))
+        return circuit.state if circuit is not None else "closed"
+
+    def allow(self, url: str) -> bool:
+        """Whether a download for `url` may proceed. Moves expired open circuits to half-open."""
+
+        domain = get_url_domain(url)
+        circuit = self._circuits.get(domain)
+        if circuit is None or circuit.state == "closed":
+            return True
+
+        if circuit.state == "open" and time.time() - circuit.opened_at >= self._cooldown_seconds:
+            circuit.state = "half_open"
+            circuit.probing = False
+
+        if circuit.state == "half_open" and not circuit.probing:
+            circuit.probing = True
+            logger.info("Circuit for %s half-open, probing with %s", domain, url)
+            return True
+
+        metrics.incr("circuit_breaker.rejected")
+        return False
+
+    def release(self, url: str) -> None:
+        """Give up a half-open probe without an outcome (e.g. the download was cancelled)."""
+
+        circuit = self._circuits.get(get_url_domain(url))
+        if circuit is not None and circuit.state == "half_open":
+            circuit.probing = False
+
+    async def record(self, url: str, *, ok: bool, latency: float | None = None) -> None:
+        """Record the outcome of a download (or of parsing what was downloaded)."""
+
+        domain = get_url_domain(url)
+        if not domain:
+            return
+        if ok and latency is not None and latency > self._slow_call_seconds:
+            ok = False
+
+        circuit = self._circuits.setdefault(domain, _DomainCircuit())
+        key = get_url_key(url)
+        circuit.outcomes[key] = ok
+        circuit.outcomes.move_to_end(key)
+        while len(circuit.outcomes) > self._window_size:
+            circuit.outcomes.popitem(last=False)
+
+        changed = False
+        if circuit.state == "half_open":
+            circuit.probing = False
+            if ok:
+                logger.info("Circuit for %s closed after a successful probe", domain)
+                circuit.state = "closed"
+                circuit.outcomes.clear()
+            else:
+                self._open(domain, circuit)
+            changed = True
+        elif (
+            circuit.state == "closed"
+            and len(circuit.outcomes) >= self._min_calls
+            and circuit.failure_rate() >= self._failure_rate_threshold
+        ):
+            self._open(domain, circuit)
+            changed = True
+
+        if changed and self._path is not None:
+            await asyncio.to_thread(self._save, self._snapshot())
+
+    def _open(self, domain: str, circuit: _DomainCircuit) -> None:
+        circuit.state = "open"
+        circuit.opened_at = time.time()
+        metrics.incr("circuit_breaker.opened")
+        logger.warning(
+            "Circuit for %s opened (failure rate %.0f%% over %s URLs); failing fast for %ss",
+            domain,
+            circuit.failure_rate() * 100,
+            len(circuit.outcomes),
+            self._cooldown_seconds,
+        )
+
+    def _snapshot(self) -> Dict[str, float]:
+        # Only open circuits are worth persisting; a half-open one re-opens on restart.
+        return {d: c.opened_at for d, c in self._circuits.items() if c.state != "closed"}
+
+    def _save(self, snapshot: Dict[str, float]) -> None:
+        with self._file_lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(snapshot))
+            os.replace(tmp_path, self._path)
+
+    def _load(self) -> Dict[str, _DomainCircuit]:
+        if self._path is None or not self._path.exists():
+            return {}
+        try:
+            snapshot = json.loads(self._path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable circuit breaker state %s: %s", self._path, e)
+            return {}
+        return {domain: _DomainCircuit(state="open", opened_at=float(opened_at)) for domain, opened_at in snapshot.items()}
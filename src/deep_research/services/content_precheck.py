@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, Literal
+from urllib.parse import urlsplit
+
+import httpx
+
+from deep_research.config import ContentPrecheckSettings
+from deep_research.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+ContentKind = Literal["text", "document", "binary", "unknown"]
+
+_TEXT_EXTENSIONS = frozenset(
+    {"htm", "html", "xhtml", "shtml", "php", "asp", "aspx", "jsp", "cfm", "txt", "md", "xml", "json", "csv"}
+)
+_DOCUMENT_EXTENSIONS = frozenset({"pdf", "doc", "docx", "odt", "rtf", "ppt", "pptx", "xls", "xlsx", "epub"})
+_TEXT_MIME_TYPES = frozenset(
+    {
+        "application/xhtml+xml",
+        "application/xml",
+        "application/json",
+        "application/ld+json",
+        "application/rss+xml",
+        "application/atom+xml",
+    }
+)
+_DOCUMENT_MIME_PREFIXES = (
+    "application/pdf",
+    "application/msword",
+    "application/rtf",
+    "application/epub+zip",
+    "application/vnd.openxmlformats-officedocument.",
+    "application/vnd.oasis.opendocument.",
+    "application/vnd.ms-",
+)
+
+
+@dataclass(slots=True)
+class PrecheckResult:
+    """Pre-download guess of what a URL serves. Only `binary` URLs are skipped."""
+
+    url: str
+    kind: ContentKind
+    content_type: str | None = None
+    reason: str | None = None
+
+    @property
+    def skip(self) -> bool:
+        return self.kind == "binary"
+
+
+def classify_mime_type(content_type: str) -> ContentKind:
+    mime = content_type.split(";", 1)[0].strip().lower()
+    if not mime:
+        return "unknown"
+    if mime.startswith("text/") or mime in _TEXT_MIME_TYPES:
+        return "text"
+    if mime.startswith(_DOCUMENT_MIME_PREFIXES):
+        return "document"
+    if mime == "application/octet-stream":
+        return "unknown"
+    return "binary"
+
+
+class ContentPrecheck:
+    """Classifies URLs before the (rendered, proxied) download, so payloads without
+    extractable text - archives, media, images, fonts - are never fetched.
+
+    The URL extension decides first. When it is inconclusive and `head_requests` is on,
+    a direct HEAD to the origin reads the Content-Type; any HEAD failure lets the URL through.
+    """
+
+    def __init__(
+        self,
+        *,
+        skip_extensions: Iterable[str],
+        head_requests: bool = False,
+        head_timeout_seconds: float = 3.0,
+    ) -> None:
+        self._skip_extensions = frozenset(e.lower().lstrip(".") for e in skip_extensions)
+        self._head_requests = head_requests
+        self._head_timeout_seconds = head_timeout_seconds
+
+    @classmethod
+    def from_settings(cls, settings: ContentPrecheckSettings) -> "ContentPrecheck":
+        return cls(
+            skip_extensions=settings.skip_extensions,
+            head_requests=settings.head_requests,
+            head_timeout_seconds=settings.head_timeout_seconds,
+        )
+
+    def classify_url(self, url: str) -> PrecheckResult:
+        suffix = PurePosixPath(urlsplit(url).path).suffix.lower().lstrip(".")
+        if suffix in self._skip_extensions:
+            return PrecheckResult(url=url, kind="binary", reason=f"binary file extension .{suffix}")
+        if suffix in _DOCUMENT_EXTENSIONS:
+            return PrecheckResult(url=url, kind="document")
+        if suffix in _TEXT_EXTENSIONS:
+            return PrecheckResult(url=url, kind="text")
+        return PrecheckResult(url=url, kind="unknown")
+
+    async def check_many(self, urls: Iterable[str]) -> Dict[str, PrecheckResult]:
+        results = {url: self.classify_url(url) for url in urls}
+
+        if self._head_requests:
+            unknown = [url for url, r in results.items() if r.kind == "unknown"]
+            if unknown:
+                async with httpx.AsyncClient(follow_redirects=True, timeout=self._head_timeout_seconds) as client:
+                    probed = await asyncio.gather(*(self._head(client, url) for url in unknown))
+                results.update(zip(unknown, probed))
+
+        for result in results.values():
+            if result.skip:
+                metrics.incr("precheck.skipped")
+                logger.info("Skipping %s before download: %s", result.url, result.reason)
+        return results
+
+    @staticmethod
+    async def _head(client: httpx.AsyncClient, url: str) -> PrecheckResult:
+        try:
+            response = await client.head(url)
+        except httpx.HTTPError as e:
+            logger.debug("HEAD precheck failed for %s: %s", url, e)
+            return PrecheckResult(url=url, kind="unknown")
+
+        content_type = response.headers.get("content-type", "")
+        if response.is_error or not content_type:
+            return PrecheckResult(url=url, kind="unknown")
+
+        kind = classify_mime_type(content_type)
+        reason = f"content-type {content_type.split(';', 1)[0].strip()}" if kind == "binary" else None
+        return PrecheckResult(url=url, kind=kind, content_type=content_type, reason=reason)
@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from deep_research.config import DownloadCacheSettings
+from deep_research.services.metrics import metrics
+from deep_research.services.url_utils import get_url_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CachedDownload:
+    """A cached raw document. `content` is a read-only view over a memory-mapped blob."""
+
+    content: memoryview
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    truncated: bool = False
+
+    def is_fresh(self, fresh_seconds: int) -> bool:
+        return (time.time() - self.fetched_at) <= fresh_seconds
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for cheap revalidation."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DownloadCache:
+    """Local, content-addressed cache of downloaded documents.
+
+    Blobs are stored once per sha256 under `directory/blobs/ab/<sha256>` and indexed in
+    SQLite by (url, render mode), together with the ETag/Last-Modified validators.
+    The total size of stored blobs is kept under `max_bytes` by evicting the least
+    recently used entries. Hits are read back through mmap instead of being copied.
+    """
+
+    def __init__(self, *, directory: str | Path, max_bytes: int, fresh_seconds: int) -> None:
+        self._directory = Path(directory)
+        self._blob_dir = self._directory / "blobs"
+        self._max_bytes = max_bytes
+        self._fresh_seconds = fresh_seconds
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_settings(cls, settings: DownloadCacheSettings) -> "DownloadCache":
+        return cls(
+            directory=settings.directory,
+            max_bytes=settings.max_bytes,
+            fresh_seconds=settings.fresh_seconds,
+        )
+
+    @property
+    def fresh_seconds(self) -> int:
+        return self._fresh_seconds
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._blob_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._directory / "index.sqlite3", check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " url TEXT NOT NULL,"
+                " render TEXT NOT NULL,"
+                " sha256 TEXT NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " truncated INTEGER NOT NULL DEFAULT 0,"
+                " fetched_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (url, render))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_sha256 ON entries (sha256)")
+            conn.execute("CREATE TABLE IF NOT EXISTS blobs (sha256 TEXT PRIMARY KEY, size INTEGER NOT NULL)")
+            self._conn = conn
+        return self._conn
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self._blob_dir / sha256[:2] / sha256
+
+    async def get(self, url: str, render: str) -> CachedDownload | None:
+        cached = await asyncio.to_thread(self._get_sync, get_url_key(url), render)
+        metrics.incr("download_cache.hit" if cached is not None else "download_cache.miss")
+        return cached
+
+    async def put(
+        self,
+        url: str,
+        render: str,
+        content: bytes,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        truncated: bool = False,
+    ) -> None:
+        if not content:
+            return
+        await asyncio.to_thread(
+            self._put_sync, get_url_key(url), render, content, etag, last_modified, truncated
+        )
+
+    async def mark_revalidated(self, url: str, render: str) -> None:
+        """Record a successful 304 revalidation: the stored blob is fresh again."""
+        await asyncio.to_thread(self._mark_revalidated_sync, get_url_key(url), render)
+        metrics.incr("download_cache.revalidated")
+
+    def _get_sync(self, key: str, render: str) -> CachedDownload | None:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT sha256, etag, last_modified, fetched_at, truncated FROM entries WHERE url = ? AND render = ?",
+                (key, render),
+            ).fetchone()
+            if row is None:
+                return None
+
+            sha256, etag, last_modified, fetched_at, truncated = row
+            try:
+                with open(self._blob_path(sha256), "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (FileNotFoundError, ValueError):
+                logger.warning("Download cache blob missing for %s; dropping entry", key)
+                conn.execute("DELETE FROM entries WHERE url = ? AND render = ?", (key, render))
+                conn.commit()
+                return None
+
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE url = ? AND render = ?",
+                (time.time(), key, render),
+            )
+            conn.commit()
+
+        return CachedDownload(
+            content=memoryview(mapped),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+            truncated=bool(truncated),
+        )
+
+    def _put_sync(
+        self,
+        key: str,
+        render: str,
+        content: bytes,
+        etag: str | None,
+        last_modified: str | None,
+        truncated: bool,
+    ) -> None:
+        sha256 = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(sha256)
+        now = time.time()
+
+        with self._lock:
+            conn = self._connection()
+            if not blob_path.exists():
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = blob_path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, blob_path)
+            conn.execute("INSERT OR REPLACE INTO blobs (sha256, size) VALUES (?, ?)", (sha256, len(content)))
+            conn.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (url, render, sha256, etag, last_modified, truncated, fetched_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, render, sha256, etag, last_modified, int(truncated), now, now),
+            )
+            self._evict_locked(conn)
+            conn.commit()
+
+    def _mark_revalidated_sync(self, key: str, render: str) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE url = ? AND render = ?",
+                (now, now, key, render),
+            )
+            conn.commit()
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        while total > self._max_bytes:
+            row = conn.execute("SELECT url, render, sha256 FROM entries ORDER BY accessed_at ASC LIMIT 1").fetchone()
+            if row is None:
+                break
+
+            url, render, sha256 = row
+            conn.execute("DELETE FROM entries WHERE url = ? AND render = ?", (url, render))
+            metrics.incr("download_cache.evicted")
+
+            (refs,) = conn.execute("SELECT COUNT(*) FROM entries WHERE sha256 = ?", (sha256,)).fetchone()
+            if refs:
+                continue
+
+            size_row = conn.execute("SELECT size FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+            conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+            # Open mmaps keep their pages alive after unlink, so readers are unaffected.
+            self._blob_path(sha256).unlink(missing_ok=True)
+            total -= size_row[0] if size_row else 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,254 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Iterator
+
+from deep_research.config import DownloadSettings
+from deep_research.services.metrics import metrics
+from deep_research.services.retry_policy import is_retryable_error
+from deep_research.services.url_utils import get_url_domain
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, holding at most `burst` tokens."""
+
+    def __init__(self, *, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+@dataclass(slots=True)
+class _LatencyEma:
+    fast: float
+    baseline: float
+
+    def update(self, latency: float) -> None:
+        self.fast = 0.7 * self.fast + 0.3 * latency
+        self.baseline = 0.98 * self.baseline + 0.02 * latency
+
+
+class AimdLimiter:
+    """In-flight request limit driven by additive-increase/multiplicative-decrease.
+
+    Every fast success grows the window by `1 / window` (about +1 per window's worth of
+    requests); a congestion signal (429/5xx, transport errors, or latency well above the
+    long-run baseline) multiplies it by `decrease_factor`, at most once per `cooldown`
+    seconds so one burst of errors does not collapse it. Latency is tracked per request
+    class (SERP, plain, rendered), so a mix of fast and slow kinds of request is not
+    mistaken for congestion. With `adaptive=False` the window stays fixed at `initial`.
+    The current window is exported as the `downloads.concurrency_window` gauge.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+        adaptive: bool = True,
+    ) -> None:
+        self._min_limit = min(min_limit, initial)
+        self._max_limit = max(max_limit, initial)
+        self._limit = float(initial)
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._cooldown = cooldown
+        self._adaptive = adaptive
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+        self._latencies: Dict[str, _LatencyEma] = {}
+        self._last_decrease = 0.0
+        metrics.set_gauge("downloads.concurrency_window", self.limit)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # the slot was handed over right before the cancellation
+            elif waiter in self._waiters:  # _wake() may already have dropped it
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def on_success(self, latency: float, request_class: str = "default") -> None:
+        if not self._adaptive:
+            return
+        ema = self._latencies.get(request_class)
+        if ema is None:
+            self._latencies[request_class] = _LatencyEma(fast=latency, baseline=latency)
+        else:
+            ema.update(latency)
+            if ema.fast > ema.baseline * self._latency_tolerance:
+                self.on_congestion(f"{request_class} latency")
+                return
+        self._set_limit(min(self._max_limit, self._limit + 1 / self._limit))
+
+    def on_congestion(self, reason: str) -> None:
+        if not self._adaptive:
+            return
+        now = time.monotonic()
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        self._set_limit(max(self._min_limit, self._limit * self._decrease_factor))
+        logger.info("Oxylabs congestion (%s): concurrency window reduced to %s", reason, self.limit)
+
+    def _set_limit(self, limit: float) -> None:
+        self._limit = limit
+        metrics.set_gauge("downloads.concurrency_window", self.limit)
+        self._wake()
+
+
+class _DomainLimits:
+    def __init__(self, *, max_concurrent: int, rate: float, burst: int) -> None:
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.bucket = TokenBucket(rate=rate, burst=burst)
+
+
+class DownloadScheduler:
+    """Bounds outgoing Oxylabs requests globally and per target domain.
+
+    A request first waits for its domain (concurrency + token-bucket rate) and only then
+    takes a global slot, so a busy host never holds global capacity hostage and queued
+    requests for other domains keep overlapping. The global cap is an `AimdLimiter` fed
+    by the outcome and latency of every request made inside a slot.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int,
+        max_concurrent_per_domain: int,
+        per_domain_rate: float,
+        per_domain_burst: int,
+        global_limiter: AimdLimiter | None = None,
+    ) -> None:
+        self._global = global_limiter or AimdLimiter(
+            initial=max_concurrent, min_limit=max_concurrent, max_limit=max_concurrent, adaptive=False
+        )
+        self._max_concurrent_per_domain = max_concurrent_per_domain
+        self._per_domain_rate = per_domain_rate
+        self._per_domain_burst = per_domain_burst
+        self._domains: Dict[str, _DomainLimits] = {}
+        self._in_flight = 0
+
+    @classmethod
+    def from_settings(cls, settings: DownloadSettings) -> "DownloadScheduler":
+        return cls(
+            max_concurrent=settings.max_concurrent_downloads,
+            max_concurrent_per_domain=settings.max_concurrent_per_domain,
+            per_domain_rate=settings.per_domain_requests_per_second,
+            per_domain_burst=settings.per_domain_burst,
+            global_limiter=AimdLimiter(
+                initial=settings.max_concurrent_downloads,
+                min_limit=settings.min_adaptive_concurrency,
+                max_limit=settings.max_adaptive_concurrency,
+                decrease_factor=settings.aimd_decrease_factor,
+                latency_tolerance=settings.aimd_latency_tolerance,
+                adaptive=settings.adaptive_concurrency,
+            ),
+        )
+
+    @property
+    def concurrency_window(self) -> int:
+        return self._global.limit
+
+    def _limits_for(self, domain: str) -> _DomainLimits:
+        limits = self._domains.get(domain)
+        if limits is None:
+            limits = _DomainLimits(
+                max_concurrent=self._max_concurrent_per_domain,
+                rate=self._per_domain_rate,
+                burst=self._per_domain_burst,
+            )
+            self._domains[domain] = limits
+        return limits
+
+    @asynccontextmanager
+    async def slot(self, url: str | None = None, *, request_class: str = "serp") -> AsyncIterator[None]:
+        """Hold a request slot. Without a URL only the global cap applies (e.g. SERP queries).
+
+        `request_class` ("serp", "plain", "rendered") picks the latency baseline the request is compared with.
+        """
+
+        domain = get_url_domain(url) if url else ""
+        if not domain:
+            async with self._global_slot(request_class):
+                yield
+            return
+
+        limits = self._limits_for(domain)
+        async with limits.semaphore:
+            await limits.bucket.acquire()
+            async with self._global_slot(request_class):
+                yield
+
+    @asynccontextmanager
+    async def _global_slot(self, request_class: str) -> AsyncIterator[None]:
+        await self._global.acquire()
+        started = time.monotonic()
+        try:
+            with self._track_in_flight():
+                yield
+        except Exception as e:
+            if is_retryable_error(e):
+                self._global.on_congestion(type(e).__name__)
+            raise
+        else:
+            self._global.on_success(time.monotonic() - started, request_class)
+        finally:
+            self._global.release()
+
+    @contextmanager
+    def _track_in_flight(self) -> Iterator[None]:
+        self._in_flight += 1
+        metrics.set_gauge("downloads.in_flight", self._in_flight)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            metrics.set_gauge("downloads.in_flight", self._in_flight)
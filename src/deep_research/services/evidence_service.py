@@ -1,43 +1,233 @@
 # src/deep_research/services/evidence_service.py
 
 import asyncio
+import heapq
+import itertools
 import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import PurePosixPath
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
+from deep_research.config import EvidenceBatchSettings, EvidencePipelineSettings
 from deep_research.services.content_analysis_service import ContentAnalysisService
+from deep_research.services.content_precheck import ContentPrecheck
 from deep_research.services.file_service import FileService
-from deep_research.services.trafilatura_document_parser_service import TrafilaturaDocumentParserService
-from deep_research.services.web_search_service import WebSearchService
+from deep_research.services.metrics import metrics
+from deep_research.services.routing_document_parser_service import RoutingDocumentParserService
+from deep_research.services.web_search_service import CIRCUIT_OPEN, WebSearchService
 from deep_research.services.models import ParsedDocument
+from deep_research.services.negative_cache import (
+    FAILURE_DOWNLOAD,
+    FAILURE_NOT_TEXT,
+    FAILURE_PARSE,
+    NegativeCache,
+)
+from deep_research.services.prefetcher import PrefetchedDocument, SpeculativePrefetcher
+from deep_research.services.serp_reranker import tokenize
 from deep_research.services.token_counting_service import TokenCountingService
+from deep_research.services.url_utils import canonicalize_url
 from deep_research.workflows.research.searcher.models import EvidenceItem
 
 logger = logging.getLogger(__name__)
 
+_RELEVANCE_SAMPLE_CHARS = 20_000
+
+
+@dataclass(slots=True)
+class _UrlOutcome:
+    """Result of one URL's download -> parse -> analyze chain."""
+
+    url: str
+    item: EvidenceItem | None = None
+    failed: bool = False
+    # Negative-cache reason; None when the failure says nothing lasting about the URL.
+    failure_reason: str | None = None
+    # Parsed fine, but not analyzed because its content would not fit in the token budget.
+    over_budget: bool = False
+
+
+@dataclass(slots=True)
+class _TokenBudget:
+    """Evidence tokens reserved by one generate_evidence call, taken before an analysis starts."""
+
+    limit: int | None
+    used: int
+    max_item_tokens: int | None = None
+
+    def tokens_for(self, text: str) -> int:
+        if self.max_item_tokens is not None:
+            text = TokenCountingService.truncate_text(text, self.max_item_tokens)
+        return TokenCountingService.count_tokens(text)
+
+    def reserve(self, tokens: int) -> bool:
+        if self.limit is not None and self.used + tokens > self.limit:
+            return False
+        self.used += tokens
+        return True
+
+    def release(self, tokens: int) -> None:
+        self.used -= tokens
+
+
+@dataclass(slots=True)
+class _UrlJob:
+    """One URL's task and the budget it reserves from. Stragglers are re-bound to each later call's budget."""
+
+    url: str
+    budget: _TokenBudget
+    task: asyncio.Task[_UrlOutcome] | None = None
+    # Set while the analysis holds a reservation: the budget it came from and its size.
+    reserved_from: _TokenBudget | None = None
+    reserved_tokens: int = 0
+
+    def rebind(self, budget: _TokenBudget) -> None:
+        """Reserve from `budget` from now on, moving a reservation already held when it fits there.
+
+        A reservation that does not fit stays where it is and is charged again on collection.
+        """
+        if self.reserved_from is None:
+            self.budget = budget
+        elif self.reserved_from is not budget and budget.reserve(self.reserved_tokens):
+            self.reserved_from.release(self.reserved_tokens)
+            self.reserved_from = self.budget = budget
+
+    def charge(self, outcome: "_UrlOutcome", budget: _TokenBudget) -> "_UrlOutcome":
+        """Make sure a finished analysis is paid for by `budget`, the collecting call's."""
+        if outcome.item is None or self.reserved_from is None or self.reserved_from is budget:
+            return outcome
+        self.reserved_from.release(self.reserved_tokens)
+        self.reserved_from = None
+        if not budget.reserve(self.reserved_tokens):
+            logger.info("Dropping %s: its evidence no longer fits the budget", self.url)
+            return _UrlOutcome(url=self.url, over_budget=True)
+        self.reserved_from = budget
+        return outcome
+
+
+class _QueuePlace:
+    """A place in a stage's queue, given up when `work` gets a worker or by `release`."""
+
+    __slots__ = ("_queue",)
+
+    def __init__(self, queue: asyncio.Semaphore) -> None:
+        self._queue: asyncio.Semaphore | None = queue
+
+    def release(self) -> None:
+        if self._queue is not None:
+            self._queue.release()
+            self._queue = None
+
+
+class _Stage:
+    """A pipeline stage with `workers` slots fed by a queue holding at most `queue_size` items.
+
+    The upstream worker calls `put` while still holding its own slot, so a full queue stalls
+    the upstream stage (backpressure) instead of letting finished work pile up in memory.
+    Waiting items get a free worker in order of their `priority` (highest first). Whoever
+    holds a place and does not reach `work` (an error in between) must `release` it.
+    """
+
+    def __init__(self, name: str, *, workers: int, queue_size: int) -> None:
+        self.name = name
+        self._free_workers = workers
+        self._waiters: List[Tuple[float, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self._queue = asyncio.Semaphore(queue_size)
+
+    async def put(self) -> _QueuePlace:
+        if self._queue.locked():
+            metrics.incr(f"evidence.{self.name}_backpressure")
+        await self._queue.acquire()
+        return _QueuePlace(self._queue)
+
+    @asynccontextmanager
+    async def work(self, place: _QueuePlace, priority: float = 0.0) -> AsyncIterator[None]:
+        """Wait for a free worker, then leave the queue."""
+        try:
+            await self._acquire_worker(priority)
+        finally:
+            place.release()
+        try:
+            yield
+        finally:
+            self._release_worker()
+
+    async def _acquire_worker(self, priority: float) -> None:
+        if self._free_workers > 0 and not self._waiters:
+            self._free_workers -= 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._order), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The worker was handed over just as we were cancelled: pass it on.
+            if waiter.done() and not waiter.cancelled():
+                self._release_worker()
+            raise
+
+    def _release_worker(self) -> None:
+        while self._waiters:
+            _priority, _order, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free_workers += 1
+
 
 class EvidenceService:
     """
     Orchestrates the evidence gathering pipeline:
+    0. Skip known-bad URLs (NegativeCache) and URLs without extractable text (ContentPrecheck)
     1. Download Content (WebSearchService)
     2. Upload Content (FileService)
     3. Parse Content (DocumentParserService)
     4. Enrich Content (ContentAnalysisService)
+
+    Each URL flows through the steps on its own as soon as the previous step is done. Steps
+    have their own concurrency limits and bounded queues between them (EvidencePipelineSettings).
+    A call returns once the quorum of URLs is analyzed or the deadline passes; URLs still in
+    flight then become stragglers.
     """
 
     def __init__(
         self,
         *,
         content_analysis_service: ContentAnalysisService,
-        document_parser_service: TrafilaturaDocumentParserService,
+        document_parser_service: RoutingDocumentParserService,
         file_service: FileService,
         web_search_service: WebSearchService,
+        content_precheck: ContentPrecheck | None = None,
+        negative_cache: NegativeCache | None = None,
+        prefetcher: SpeculativePrefetcher | None = None,
+        batch_settings: EvidenceBatchSettings | None = None,
+        pipeline_settings: EvidencePipelineSettings | None = None,
     ) -> None:
         self.content_analysis_service = content_analysis_service
         self.document_parser_service = document_parser_service
         self.file_service = file_service
         self.web_search_service = web_search_service
+        self.content_precheck = content_precheck
+        self.negative_cache = negative_cache
+        self.prefetcher = prefetcher
+        self.batch_settings = batch_settings or EvidenceBatchSettings()
+        pipeline = pipeline_settings or EvidencePipelineSettings()
+        # Shared by all calls, so background stragglers count against the same limits.
+        self._download_slots = asyncio.Semaphore(pipeline.download_concurrency)
+        self._parse_stage = _Stage("parse", workers=pipeline.parse_concurrency, queue_size=pipeline.parse_queue_size)
+        self._analysis_stage = _Stage(
+            "analysis", workers=pipeline.analysis_concurrency, queue_size=pipeline.analysis_queue_size
+        )
+        # Background stragglers from earlier calls, by canonical URL. They live as long as this
+        # service (one research turn): `collect_stragglers` / `cancel_stragglers` end them.
+        self._stragglers: Dict[str, _UrlJob] = {}
+
+    @property
+    def pending_urls(self) -> List[str]:
+        """URLs still being processed in the background; their results arrive with a later call."""
+        return [job.url for job in self._stragglers.values() if not job.task.done()]
 
     async def generate_evidence(
         self,
@@ -51,62 +241,155 @@ class EvidenceService:
         """
         Parses and analyzes URLs to produce enriched EvidenceItems.
         Returns (items, failures, budget_exhausted).
-        This service orchestrates the evidence generation process of downloading and parsing content.
+        Results of background stragglers from earlier calls that finished since are included,
+        charged to this call's budget. URLs still running when the call returns are in neither
+        list (see `pending_urls`).
         """
 
-        # this is the downloading part
-        download_tasks = [self.web_search_service.download_url_bytes(url) for url in urls]
-        download_results = await asyncio.gather(*download_tasks, return_exceptions=True)
-        
-        valid_downloads: List[Tuple[str, bytes]] = []
+        stats_before = metrics.snapshot()
+        urls = self._dedupe_urls(urls)
         failures: set[str] = set()
+        # New failures worth remembering across sessions: {url: reason}
+        failure_reasons: dict[str, str] = {}
 
-        for url, res in zip(urls, download_results):
-            if isinstance(res, BaseException) or not res:
-                failures.add(url)
-                logger.error(f"Failed to download {url}: {res}")
-            else:
-                valid_downloads.append((url, res))
-
-        # todo: soon it will be beautiful llama parser
-        # Legacy path:
-        # Upload bytes to LlamaCloud and then parse via LlamaParse (kept for future swap).
-        # upload_tasks = [
-        #     self.file_service.upload_bytes(
-        #         content,
-        #         filename=self._build_upload_filename(url=url),
-        #     )
-        #     for url, content in valid_downloads
-        # ]
-        # upload_results = await asyncio.gather(*upload_tasks, return_exceptions=True)
-
-        files_to_parse: List[Tuple[str | None, str, bytes]] = [] # (file_id, url, content)
-        
-        for url, content in valid_downloads:
-            # if isinstance(res, BaseException):
-            #     failures.add(url)
-            #     logger.error(f"Failed to upload {url}: {res}")
-            # else:
-            #     files_to_parse.append((res, url))
-            files_to_parse.append((None, url, content))
-
-        parsed_documents, parse_failures = await self.document_parser_service.parse_files(files_to_parse)
-        failures.update(parse_failures)
-
-        results = await asyncio.gather(
-            *(self._process_evidence(e, directive) for e in parsed_documents)
+        # Analyses reserve their tokens up front, so none are paid for only to be dropped for budget.
+        budget = _TokenBudget(
+            limit=max_total_tokens, used=max(0, existing_total_tokens), max_item_tokens=max_item_tokens
         )
+        outcomes = self._take_finished_stragglers(budget)
+        # Stragglers still running reserve from this call's budget from now on.
+        for job in self._stragglers.values():
+            job.rebind(budget)
+
+        if self.negative_cache is not None:
+            known_bad = await self.negative_cache.get_many(urls)
+            for url, reason in known_bad.items():
+                logger.info("Skipping %s: failed recently (%s)", url, reason)
+            failures.update(known_bad)
+            urls = [url for url in urls if url not in known_bad]
+
+        if self.content_precheck is not None:
+            prechecks = await self.content_precheck.check_many(urls)
+            skipped = {url for url, result in prechecks.items() if result.skip}
+            failures.update(skipped)
+            failure_reasons.update(dict.fromkeys(skipped, FAILURE_NOT_TEXT))
+            urls = [url for url in urls if url not in skipped]
+
+        # Documents prefetched while the agent was choosing URLs skip download and parse. Each URL's
+        # task waits for its own prefetch, so a slow one holds up nothing else and obeys the deadline.
+        prefetches = (
+            self.prefetcher.claim_many(url for url in urls if canonicalize_url(url) not in self._stragglers)
+            if self.prefetcher is not None
+            else {}
+        )
+
+        jobs: List[_UrlJob] = []
+        for rank, url in enumerate(urls):
+            # A URL requested again while it is still running in the background is not started twice.
+            job = self._stragglers.pop(canonicalize_url(url), None)
+            if job is None:
+                job = _UrlJob(url=url, budget=budget)
+                job.task = asyncio.create_task(
+                    self._evidence_for_url(job, directive, prefetches.get(url), rank=rank), name=url
+                )
+            jobs.append(job)
+
+        try:
+            finished, stragglers = await self._wait_for_quorum(jobs)
+        except asyncio.CancelledError:
+            for job in jobs:
+                job.task.cancel()
+            raise
+        # A straggler requested again may have reserved from an earlier call's budget.
+        outcomes.extend(job.charge(job.task.result(), budget) for job in finished)
+        self._handle_stragglers(stragglers, failures)
+        # Earlier stragglers that finished meanwhile.
+        outcomes.extend(self._take_finished_stragglers(budget))
+
+        items, budget_exhausted = await self._finish(
+            outcomes,
+            failures,
+            failure_reasons,
+            max_total_tokens=max_total_tokens,
+            max_item_tokens=max_item_tokens,
+            existing_total_tokens=existing_total_tokens,
+        )
+
+        # Counters are process-wide, so concurrent calls may show up in each other's stats.
+        logger.info("Pipeline stats for %s urls: %s", len(urls), metrics.delta(stats_before))
+        if self.prefetcher is not None and (hit_rate := self.prefetcher.hit_rate()) is not None:
+            logger.info(
+                "Prefetch hit rate %.0f%% (%s wasted so far)", hit_rate * 100, metrics.get("prefetch.wasted")
+            )
+        return items, sorted(failures), budget_exhausted
+
+    async def collect_stragglers(
+        self,
+        *,
+        max_total_tokens: int | None = None,
+        max_item_tokens: int | None = None,
+        existing_total_tokens: int = 0,
+    ) -> Tuple[List[EvidenceItem], List[str], bool]:
+        """End of the research turn: return what finished in the background and cancel the rest.
+
+        Same return value as `generate_evidence`.
+        """
+
+        budget = _TokenBudget(
+            limit=max_total_tokens, used=max(0, existing_total_tokens), max_item_tokens=max_item_tokens
+        )
+        outcomes = self._take_finished_stragglers(budget)
+        self.cancel_stragglers()
+        failures: set[str] = set()
+        failure_reasons: dict[str, str] = {}
+        items, budget_exhausted = await self._finish(
+            outcomes,
+            failures,
+            failure_reasons,
+            max_total_tokens=max_total_tokens,
+            max_item_tokens=max_item_tokens,
+            existing_total_tokens=existing_total_tokens,
+        )
+        return items, sorted(failures), budget_exhausted
+
+    def cancel_stragglers(self) -> None:
+        """Cancel background work that is still running, prefetches included, so none outlives the research turn."""
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        for job in self._stragglers.values():
+            if not job.task.done():
+                logger.info("Cancelling %s: still running when the research turn ended", job.url)
+                job.task.cancel()
+                metrics.incr("evidence.stragglers_cancelled")
+        self._stragglers.clear()
+
+    async def _finish(
+        self,
+        outcomes: List[_UrlOutcome],
+        failures: set[str],
+        failure_reasons: dict[str, str],
+        *,
+        max_total_tokens: int | None,
+        max_item_tokens: int | None,
+        existing_total_tokens: int,
+    ) -> Tuple[List[EvidenceItem], bool]:
+        """Record failures and keep the items that fit the budget. Returns (items, budget_exhausted)."""
+
+        budget_exhausted = any(outcome.over_budget for outcome in outcomes)
+        for outcome in outcomes:
+            if outcome.failed:
+                failures.add(outcome.url)
+                if outcome.failure_reason is not None:
+                    failure_reasons[outcome.url] = outcome.failure_reason
+        if self.negative_cache is not None:
+            await self.negative_cache.put_many(failure_reasons)
 
         items: List[EvidenceItem] = []
-        budget_exhausted = False
+        # Every item already reserved its tokens from this call's budget; this only guards the total.
         total_tokens = max(0, existing_total_tokens)
 
-        for url, item, error in results:
-            if error:
-                failures.add(url)
-                logger.error("Error processing evidence for %s", url, exc_info=error)
-                continue
-
+        for outcome in outcomes:
+            item = outcome.item
             if not item:
                 continue
 
@@ -122,7 +405,175 @@ class EvidenceService:
             items.append(item)
             total_tokens += content_tokens
 
-        return items, sorted(failures), budget_exhausted
+        return items, budget_exhausted
+
+    async def _wait_for_quorum(self, jobs: List[_UrlJob]) -> Tuple[List[_UrlJob], List[_UrlJob]]:
+        """Wait until `quorum` URLs have yielded evidence, all are done, or the deadline passes.
+
+        Returns (finished jobs in completion order, unfinished jobs).
+        """
+
+        settings = self.batch_settings
+        quorum = min(settings.quorum or len(jobs), len(jobs))
+        loop = asyncio.get_running_loop()
+        deadline = None if settings.deadline_seconds is None else loop.time() + settings.deadline_seconds
+
+        finished: List[_UrlJob] = []
+        pending = {job.task for job in jobs}
+        # Only usable evidence counts: failed, empty and over-budget outcomes do not end the wait.
+        analyzed = 0
+        while pending and analyzed < quorum:
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                metrics.incr("evidence.deadline_hits")
+                break
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for job in jobs:
+                if job.task in done:
+                    finished.append(job)
+                    analyzed += job.task.result().item is not None
+
+        if pending and analyzed >= quorum:
+            metrics.incr("evidence.quorum_hits")
+        return finished, [job for job in jobs if job.task in pending]
+
+    def _handle_stragglers(self, stragglers: Iterable[_UrlJob], failures: set[str]) -> None:
+        for job in stragglers:
+            metrics.incr("evidence.stragglers")
+            if self.batch_settings.straggler_policy == "cancel":
+                logger.warning("Cancelling %s: not finished before the deadline/quorum", job.url)
+                job.task.cancel()
+                failures.add(job.url)
+            else:
+                logger.info("Leaving %s running in the background", job.url)
+                self._stragglers[canonicalize_url(job.url)] = job
+
+    def _take_finished_stragglers(self, budget: _TokenBudget) -> List[_UrlOutcome]:
+        """Finished stragglers' outcomes, their items charged to `budget` (that of the collecting call)."""
+        outcomes: List[_UrlOutcome] = []
+        for key, job in list(self._stragglers.items()):
+            if not job.task.done():
+                continue
+            del self._stragglers[key]
+            if job.task.cancelled():
+                continue
+            metrics.incr("evidence.stragglers_collected")
+            outcomes.append(job.charge(job.task.result(), budget))
+        return outcomes
+
+    async def _evidence_for_url(
+        self,
+        job: _UrlJob,
+        directive: str,
+        prefetch: asyncio.Task[PrefetchedDocument] | None,
+        *,
+        rank: int,
+    ) -> _UrlOutcome:
+        """Download, parse and analyze one URL. Never raises; failures are reported in the outcome."""
+
+        url = job.url
+        parse_place: _QueuePlace | None = None
+        analysis_place: _QueuePlace | None = None
+        try:
+            prefetched = None if prefetch is None else await SpeculativePrefetcher.resolve(url, prefetch)
+            if prefetched is not None:
+                if prefetched.download_failed:
+                    return self._download_failure(url, prefetched.download_error)
+                document, download_metadata = prefetched.document, prefetched.download_metadata
+                if document is not None:
+                    analysis_place = await self._analysis_stage.put()
+            else:
+                async with self._download_slots:
+                    try:
+                        res = await self.web_search_service.download_url(url)
+                    except Exception as e:
+                        logger.error(f"Failed to download {url}: {e}")
+                        return _UrlOutcome(url=url, failed=True, failure_reason=FAILURE_DOWNLOAD)
+                    if not res.content:
+                        logger.error(f"Failed to download {url}: {res}")
+                        return self._download_failure(url, res.error)
+                    download_metadata = res.metadata
+                    parse_place = await self._parse_stage.put()
+
+                async with self._parse_stage.work(parse_place):
+                    # The router picks Trafilatura, the local extractor or LlamaParse (upload + parse) per document.
+                    parsed, _failed = await self.document_parser_service.parse_files([(None, url, res.content)])
+                    del res
+                    document = parsed[0] if parsed else None
+                    if document is not None:
+                        analysis_place = await self._analysis_stage.put()
+
+            if document is None:
+                # A page that downloads fine but never parses (bot walls, paywalls) is still a failing domain.
+                if (breaker := self.web_search_service.circuit_breaker) is not None:
+                    await breaker.record(url, ok=False)
+                return _UrlOutcome(url=url, failed=True, failure_reason=FAILURE_PARSE)
+
+            document.metadata.update(download_metadata)
+            priority = self._expected_value(document, directive, rank)
+            async with self._analysis_stage.work(analysis_place, priority=priority):
+                # Read at reservation time: a straggler reserves from the call now collecting it.
+                budget = job.budget
+                tokens = budget.tokens_for(document.markdown)
+                if not budget.reserve(tokens):
+                    logger.info("Not analyzing %s: %s tokens would exceed the evidence budget", url, tokens)
+                    metrics.incr("evidence.llm_calls_saved")
+                    return _UrlOutcome(url=url, over_budget=True)
+                job.reserved_from, job.reserved_tokens = budget, tokens
+                kept = False
+                try:
+                    _url, item, error = await self._process_evidence(document, directive)
+                    kept = error is None and item is not None
+                finally:
+                    # Also on cancellation. rebind() may have moved the reservation meanwhile.
+                    if not kept and job.reserved_from is not None:
+                        job.reserved_from.release(tokens)
+                        job.reserved_from = None
+            if error:
+                logger.error("Error processing evidence for %s", url, exc_info=error)
+                return _UrlOutcome(url=url, failed=True)
+            return _UrlOutcome(url=url, item=item)
+        except Exception:
+            logger.exception("Unexpected error while gathering evidence for %s", url)
+            return _UrlOutcome(url=url, failed=True)
+        finally:
+            # No-ops once `work` took them; otherwise an error struck between `put` and `work`.
+            for place in (parse_place, analysis_place):
+                if place is not None:
+                    place.release()
+
+    @staticmethod
+    def _expected_value(document: ParsedDocument, directive: str, rank: int) -> float:
+        """How likely a document is to be worth analyzing: directive terms it contains, plus request order.
+
+        The agent lists URLs best-first (and web_search shows them reranked), so earlier ones get a bonus.
+        """
+        terms = set(tokenize(directive))
+        if terms:
+            # The opening of a page is enough to tell what it is about.
+            present = terms.intersection(tokenize(document.markdown[:_RELEVANCE_SAMPLE_CHARS]))
+            lexical = len(present) / len(terms)
+        else:
+            lexical = 0.0
+        return lexical + 0.5 / (1 + rank)
+
+    @staticmethod
+    def _download_failure(url: str, error: str | None) -> _UrlOutcome:
+        # An open circuit says nothing about this particular URL.
+        return _UrlOutcome(url=url, failed=True, failure_reason=None if error == CIRCUIT_OPEN else FAILURE_DOWNLOAD)
+
+    @staticmethod
+    def _dedupe_urls(urls: List[str]) -> List[str]:
+        """Drop URLs whose canonical form was already requested, keeping the first variant."""
+        unique: dict[str, str] = {}
+        for url in urls:
+            canonical = canonicalize_url(url)
+            if canonical in unique:
+                if unique[canonical] != url:
+                    metrics.incr("urls.canonical_duplicates")
+                continue
+            unique[canonical] = url
+        return list(unique.values())
 
     @staticmethod
     def _infer_suffix_from_url(*, url: str) -> str:
@@ -176,5 +627,6 @@ class EvidenceService:
             )
             return evidence.source_url, item, None
 
-        except BaseException as e:
+        # Not BaseException: a cancelled analysis (deadline, cancel_stragglers) must stay cancelled.
+        except Exception as e:
             return evidence.source_url, None, e
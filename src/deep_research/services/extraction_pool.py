@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Literal, TypeVar
+
+from deep_research.config import ParserSettings
+from deep_research.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def warm_worker() -> None:
+    """Import the extractors once per worker so the first real parse does not pay for it."""
+    import trafilatura
+
+    from deep_research.services import local_document_parser_service  # noqa: F401
+
+    # Touching the extractor once loads lxml/trafilatura and their lazily built tables.
+    trafilatura.extract("<html><body><p>warm up</p></body></html>")
+
+
+class ExtractionPool:
+    """Runs CPU-bound document extraction off the event loop.
+
+    In a process pool by default (true parallelism, no GIL), or in a thread for documents
+    up to `thread_max_bytes`, where sending them to a process costs more than it saves.
+    Shared by every local extractor (HTML, Office, PDF).
+    """
+
+    def __init__(
+        self,
+        *,
+        executor: Literal["process", "thread", "inline"] = "thread",
+        max_workers: int | None = None,
+        thread_max_bytes: int = 0,
+    ) -> None:
+        self._executor = executor
+        self._max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._thread_max_bytes = thread_max_bytes
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    @classmethod
+    def from_settings(cls, settings: ParserSettings) -> "ExtractionPool":
+        pool = cls(
+            executor=settings.executor,
+            max_workers=settings.max_workers,
+            thread_max_bytes=settings.thread_max_bytes,
+        )
+        if settings.executor == "process" and settings.warm_pool:
+            pool.warm_up()
+        return pool
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # spawn: forking a process that runs an event loop and other threads is not safe.
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_worker,
+            )
+        return self._process_pool
+
+    def warm_up(self) -> None:
+        """Start every worker process now instead of on the first parse."""
+        pool = self._pool()
+        for _ in range(self._max_workers):
+            pool.submit(warm_worker)
+
+    def close(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    async def run(self, fn: Callable[..., T], content: bytes | memoryview, *args) -> T:
+        """Run `fn(content, *args)`; `fn` must be a module-level function so worker processes can import it."""
+        if self._executor == "inline":
+            return fn(content, *args)
+
+        if self._executor == "thread" or len(content) <= self._thread_max_bytes:
+            metrics.incr("parser.thread")
+            return await asyncio.to_thread(fn, content, *args)
+
+        metrics.incr("parser.process")
+        loop = asyncio.get_running_loop()
+        try:
+            # memoryviews (mmap cache hits) cannot be pickled to the worker.
+            return await loop.run_in_executor(self._pool(), fn, bytes(content), *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. crashed on a pathological page); start a fresh pool for the next parse.
+            logger.error("Parser process pool broke; restarting it")
+            self.close()
+            raise
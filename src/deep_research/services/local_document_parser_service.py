@@ -0,0 +1,242 @@
+import asyncio
+import io
+import logging
+import re
+import zipfile
+from typing import Any, Dict, List, Tuple
+
+from lxml import etree
+
+from deep_research.config import ParserSettings
+from deep_research.services.extraction_pool import ExtractionPool
+from deep_research.services.metrics import metrics
+from deep_research.services.models import ParsedDocument
+from deep_research.services.pdf_extraction import extract_pdf_document
+
+logger = logging.getLogger(__name__)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_CORE_NS = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+}
+_SLIDE_RE = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
+_HEADING_STYLE_RE = re.compile(r"^(?:heading|berschrift|titre|titulo)\s*(\d)$", re.IGNORECASE)
+
+# Zip bombs: refuse archives whose XML parts would inflate beyond this.
+_MAX_UNCOMPRESSED_BYTES = 64 * 1024 * 1024
+
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False, remove_blank_text=True)
+
+
+def _read_xml(archive: zipfile.ZipFile, name: str) -> etree._Element | None:
+    try:
+        return etree.fromstring(archive.read(name), parser=_XML_PARSER)
+    except KeyError:
+        return None
+
+
+def _markdown_table(rows: List[List[str]]) -> str:
+    rows = [row for row in rows if any(cell for cell in row)]
+    if not rows:
+        return ""
+    width = max(len(row) for row in rows)
+    rows = [[cell.replace("|", "\\|").replace("\n", " ") for cell in row] + [""] * (width - len(row)) for row in rows]
+    lines = ["| " + " | ".join(rows[0]) + " |", "|" + " --- |" * width]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
+
+
+def _core_metadata(archive: zipfile.ZipFile) -> Dict[str, Any]:
+    """Title, author, date and language from docProps/core.xml (same keys as the HTML parser)."""
+    core = _read_xml(archive, "docProps/core.xml")
+    if core is None:
+        return {}
+    created = core.findtext("dcterms:created", namespaces=_CORE_NS) or ""
+    metadata = {
+        "title": (core.findtext("dc:title", namespaces=_CORE_NS) or "").strip(),
+        "author": (core.findtext("dc:creator", namespaces=_CORE_NS) or "").strip(),
+        "published_date": created.strip()[:10],
+        "language": (core.findtext("dc:language", namespaces=_CORE_NS) or "").strip().lower(),
+    }
+    return {key: value for key, value in metadata.items() if value}
+
+
+def _docx_text(element: etree._Element) -> str:
+    parts: List[str] = []
+    for node in element.iter(f"{_W}t", f"{_W}tab", f"{_W}br"):
+        if node.tag == f"{_W}t":
+            parts.append(node.text or "")
+        else:
+            parts.append("\t" if node.tag == f"{_W}tab" else "\n")
+    return "".join(parts).strip()
+
+
+def _docx_markdown(archive: zipfile.ZipFile) -> str:
+    document = _read_xml(archive, "word/document.xml")
+    body = document.find(f"{_W}body") if document is not None else None
+    if body is None:
+        return ""
+
+    blocks: List[str] = []
+    for child in body:
+        if child.tag == f"{_W}tbl":
+            rows = [
+                [_docx_text(cell) for cell in row.iter(f"{_W}tc")]
+                for row in child.iter(f"{_W}tr")
+            ]
+            if table := _markdown_table(rows):
+                blocks.append(table)
+            continue
+        if child.tag != f"{_W}p":
+            continue
+
+        text = _docx_text(child)
+        if not text:
+            continue
+        style = child.find(f"{_W}pPr/{_W}pStyle")
+        style_name = style.get(f"{_W}val", "") if style is not None else ""
+        if style_name.lower() == "title":
+            blocks.append(f"# {text}")
+        elif match := _HEADING_STYLE_RE.match(style_name):
+            blocks.append(f"{'#' * min(int(match.group(1)) + 1, 6)} {text}")
+        elif child.find(f"{_W}pPr/{_W}numPr") is not None:
+            blocks.append(f"- {text}")
+        else:
+            blocks.append(text)
+    return "\n\n".join(blocks)
+
+
+def _pptx_markdown(archive: zipfile.ZipFile) -> str:
+    slides = sorted(
+        (int(match.group(1)), name) for name in archive.namelist() if (match := _SLIDE_RE.match(name))
+    )
+    sections: List[str] = []
+    for number, name in slides:
+        slide = _read_xml(archive, name)
+        if slide is None:
+            continue
+
+        title = ""
+        lines: List[str] = []
+        for shape in slide.iter(f"{_P}sp"):
+            placeholder = shape.find(f"{_P}nvSpPr/{_P}nvPr/{_P}ph")
+            paragraphs = [
+                "".join(t.text or "" for t in paragraph.iter(f"{_A}t")).strip()
+                for paragraph in shape.iter(f"{_A}p")
+            ]
+            paragraphs = [p for p in paragraphs if p]
+            if placeholder is not None and placeholder.get("type") in ("title", "ctrTitle") and not title:
+                title = " ".join(paragraphs)
+            else:
+                lines.extend(f"- {p}" for p in paragraphs)
+        for table in slide.iter(f"{_A}tbl"):
+            rows = [
+                ["".join(t.text or "" for t in cell.iter(f"{_A}t")).strip() for cell in row.iter(f"{_A}tc")]
+                for row in table.iter(f"{_A}tr")
+            ]
+            if markdown := _markdown_table(rows):
+                lines.append(markdown)
+
+        if title or lines:
+            heading = f"## Slide {number}" + (f": {title}" if title else "")
+            sections.append("\n".join([heading, *lines]))
+    return "\n\n".join(sections)
+
+
+def extract_office_document(content: bytes | memoryview, url: str) -> Tuple[str, Dict[str, Any]]:
+    """DOCX/PPTX bytes -> (markdown, metadata). Module level so worker processes can run it."""
+    archive = zipfile.ZipFile(io.BytesIO(content))
+    if sum(info.file_size for info in archive.infolist() if info.filename.endswith(".xml")) > _MAX_UNCOMPRESSED_BYTES:
+        raise ValueError(f"Refusing to inflate oversized Office archive from {url}")
+
+    names = set(archive.namelist())
+    if "word/document.xml" in names:
+        markdown = _docx_markdown(archive)
+    elif any(_SLIDE_RE.match(name) for name in names):
+        markdown = _pptx_markdown(archive)
+    else:
+        raise ValueError(f"Unsupported Office document at {url}")
+    return markdown, _core_metadata(archive)
+
+
+class LocalDocumentParserService:
+    """Parses PDF, DOCX and PPTX files locally, without a LlamaParse round trip.
+
+    Keeps headings, list items and tables as Markdown; PDFs are joined page by page. A PDF
+    with too little text per page (scanned, text drawn as images) fails here, so the router
+    hands it to the next parser. Runs in the shared ExtractionPool.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool: ExtractionPool | None = None,
+        pdf_max_pages: int = 60,
+        pdf_page_range: Tuple[int, int] | None = None,
+        pdf_min_chars_per_page: int = 200,
+    ) -> None:
+        self._pool = pool or ExtractionPool()
+        self._pdf_max_pages = pdf_max_pages
+        self._pdf_page_range = pdf_page_range
+        self._pdf_min_chars_per_page = pdf_min_chars_per_page
+
+    @classmethod
+    def from_settings(
+        cls, settings: ParserSettings, *, pool: ExtractionPool | None = None
+    ) -> "LocalDocumentParserService":
+        return cls(
+            pool=pool or ExtractionPool.from_settings(settings),
+            pdf_max_pages=settings.pdf_max_pages,
+            pdf_page_range=settings.pdf_page_range,
+            pdf_min_chars_per_page=settings.pdf_min_chars_per_page,
+        )
+
+    async def parse_files(self, files: List[Tuple[str | None, str, bytes | memoryview]]) -> tuple[List[ParsedDocument], List[str]]:
+        tasks = [self._parse_single(url=url, content=content) for _file_id, url, content in files]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        valid_results: list[ParsedDocument] = []
+        failed_urls: list[str] = []
+
+        for (_file_id, url, _content), res in zip(files, results):
+            if isinstance(res, BaseException):
+                failed_urls.append(url)
+                logger.error("Failed to parse url=%s (local)", url, exc_info=res)
+                continue
+            valid_results.append(res)
+
+        return valid_results, sorted(failed_urls)
+
+    async def _parse_single(self, *, url: str, content: bytes | memoryview) -> ParsedDocument:
+        logger.info("Parsing url=%s (local)", url)
+
+        if bytes(content[:5]) == b"%PDF-":
+            markdown, metadata = await self._parse_pdf(url=url, content=content)
+        else:
+            markdown, metadata = await self._pool.run(extract_office_document, content, url)
+        if not markdown:
+            raise ValueError(f"No extractable text in {url}")
+
+        return ParsedDocument(
+            source_url=url,
+            markdown=markdown,
+            assets=[],
+            metadata=metadata,
+        )
+
+    async def _parse_pdf(self, *, url: str, content: bytes | memoryview) -> Tuple[str, Dict[str, Any]]:
+        extraction = await self._pool.run(
+            extract_pdf_document, content, url, self._pdf_max_pages, self._pdf_page_range
+        )
+        metrics.incr("parser.pdf.pages", extraction.pages_read)
+        if extraction.pages_read < extraction.page_count:
+            metrics.incr("parser.pdf.truncated")
+        if extraction.chars_per_page < self._pdf_min_chars_per_page:
+            metrics.incr("parser.pdf.low_density")
+            raise ValueError(
+                f"Only {extraction.chars_per_page:.0f} characters per page in {url}; probably scanned"
+            )
+        return extraction.markdown, extraction.metadata
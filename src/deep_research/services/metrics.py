@@ -0,0 +1,53 @@
+import threading
+from collections import Counter
+from typing import Dict
+
+
+class MetricsRegistry:
+    """In-process counters and gauges for the search/download/parse pipeline.
+
+    Kept deliberately tiny: services bump named counters (e.g. `serp_cache.hit`) and
+    tools/runners read a snapshot to report what the caches and limiters saved.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Counter[str] = Counter()
+        self._gauges: Dict[str, float] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            if name in self._gauges:
+                return self._gauges[name]
+            return self._counters.get(name, 0)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, float]:
+        with self._lock:
+            data: Dict[str, float] = {k: v for k, v in self._counters.items() if k.startswith(prefix)}
+            data.update({k: v for k, v in self._gauges.items() if k.startswith(prefix)})
+        return dict(sorted(data.items()))
+
+    def delta(self, before: Dict[str, float], prefix: str = "") -> Dict[str, float]:
+        """Counter increments since `before` (a previous `snapshot`), omitting unchanged ones."""
+        with self._lock:
+            return {
+                k: v - before.get(k, 0)
+                for k, v in sorted(self._counters.items())
+                if k.startswith(prefix) and v != before.get(k, 0)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+
+
+metrics = MetricsRegistry()
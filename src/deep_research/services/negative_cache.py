@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Mapping
+
+from deep_research.config import NegativeCacheSettings
+from deep_research.services.metrics import metrics
+from deep_research.services.url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+FAILURE_NOT_TEXT = "not_text"
+FAILURE_DOWNLOAD = "download_failed"
+FAILURE_PARSE = "parse_failed"
+
+# SQLite caps the number of bound parameters per statement.
+_QUERY_CHUNK = 500
+
+
+class NegativeCache:
+    """Persistent SQLite record of URLs that failed, so they are not scraped again.
+
+    Each entry keeps the failure reason and expires after the TTL configured for that
+    reason (`default_ttl_seconds` for unknown reasons). URLs are keyed in canonical form.
+    Blocking sqlite calls run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | Path,
+        ttl_seconds: Mapping[str, int],
+        default_ttl_seconds: int,
+    ) -> None:
+        self._path = Path(path)
+        self._ttl_seconds = dict(ttl_seconds)
+        self._default_ttl_seconds = default_ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_settings(cls, settings: NegativeCacheSettings) -> "NegativeCache":
+        return cls(
+            path=settings.path,
+            ttl_seconds=settings.ttl_seconds,
+            default_ttl_seconds=settings.default_ttl_seconds,
+        )
+
+    def ttl_for(self, reason: str) -> int:
+        return self._ttl_seconds.get(reason, self._default_ttl_seconds)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS failed_urls ("
+                " url TEXT PRIMARY KEY,"
+                " reason TEXT NOT NULL,"
+                " failed_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS failed_urls_expires_at ON failed_urls (expires_at)")
+            self._conn = conn
+        return self._conn
+
+    async def get_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Return {url: failure reason} for the given URLs that are still negatively cached."""
+
+        by_key: Dict[str, list[str]] = {}
+        for url in urls:
+            by_key.setdefault(canonicalize_url(url), []).append(url)
+        if not by_key:
+            return {}
+
+        reasons = await asyncio.to_thread(self._get_many_sync, list(by_key))
+        hits = {url: reason for key, reason in reasons.items() for url in by_key[key]}
+        if hits:
+            metrics.incr("negative_cache.hit", len(hits))
+        return hits
+
+    async def put_many(self, failures: Mapping[str, str]) -> None:
+        """Record {url: failure reason}; a newer failure replaces an older entry."""
+
+        if not failures:
+            return
+        now = time.time()
+        rows = [
+            (canonicalize_url(url), reason, now, now + self.ttl_for(reason))
+            for url, reason in failures.items()
+            if self.ttl_for(reason) > 0
+        ]
+        if rows:
+            await asyncio.to_thread(self._put_many_sync, rows)
+            metrics.incr("negative_cache.stored", len(rows))
+
+    def _get_many_sync(self, keys: list[str]) -> Dict[str, str]:
+        now = time.time()
+        reasons: Dict[str, str] = {}
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[i : i + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT url, reason FROM failed_urls WHERE expires_at > ? AND url IN ({placeholders})",
+                    (now, *chunk),
+                ).fetchall()
+                reasons.update(rows)
+        return reasons
+
+    def _put_many_sync(self, rows: list[tuple[str, str, float, float]]) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO failed_urls (url, reason, failed_at, expires_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("DELETE FROM failed_urls WHERE expires_at <= ?", (time.time(),))
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
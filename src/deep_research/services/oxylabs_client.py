@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import os
+from typing import Any
+
+import httpx
+
+from deep_research.config import OxylabsClientSettings
+
+logger = logging.getLogger(__name__)
+
+OXYLABS_REALTIME_URL = "https://realtime.oxylabs.io/v1/queries"
+
+
+class OxylabsClient:
+    """Long-lived, pooled HTTP client for the Oxylabs realtime Web Scraper API.
+
+    The Oxylabs SDK opens a new aiohttp session per client and closes it as soon as
+    no request is in flight, so every search/download paid for a fresh TLS handshake.
+    This client keeps one httpx connection pool (with keep-alive) for the whole process.
+    Call `aclose()` on shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        username: str,
+        password: str,
+        settings: OxylabsClientSettings | None = None,
+        base_url: str = OXYLABS_REALTIME_URL,
+    ) -> None:
+        self._auth = httpx.BasicAuth(username, password)
+        self._settings = settings or OxylabsClientSettings()
+        self._base_url = base_url
+        self._http: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stale_closes: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_env(cls, settings: OxylabsClientSettings | None = None) -> "OxylabsClient":
+        username = os.getenv("OXYLABS_USERNAME")
+        password = os.getenv("OXYLABS_PASSWORD")
+        if not username or not password:
+            raise ValueError(
+                "Oxylabs credentials are required. Set OXYLABS_USERNAME and OXYLABS_PASSWORD."
+            )
+        return cls(username=username, password=password, settings=settings)
+
+    @property
+    def settings(self) -> OxylabsClientSettings:
+        return self._settings
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        # httpx pools are bound to the event loop they were first used on.
+        loop = asyncio.get_running_loop()
+        if self._http is not None and not self._http.is_closed and self._loop is not loop:
+            self._close_stale_client()
+        if self._http is None or self._http.is_closed or self._loop is not loop:
+            self._http = httpx.AsyncClient(
+                auth=self._auth,
+                limits=httpx.Limits(
+                    max_connections=self._settings.max_connections,
+                    max_keepalive_connections=self._settings.max_keepalive_connections,
+                    keepalive_expiry=self._settings.keepalive_expiry_seconds,
+                ),
+                timeout=httpx.Timeout(self._settings.request_timeout_seconds),
+            )
+            self._loop = loop
+        return self._http
+
+    def _close_stale_client(self) -> None:
+        """Close a pool left behind by a previous event loop, on that loop when it still runs."""
+        stale, stale_loop = self._http, self._loop
+        self._http = None
+        self._loop = None
+        if stale_loop is not None and stale_loop.is_running():
+            asyncio.run_coroutine_threadsafe(stale.aclose(), stale_loop)
+            return
+        # The owning loop is gone: its sockets can no longer be awaited, only dropped.
+        self._stale_closes.add(task := asyncio.get_running_loop().create_task(self._drop_client(stale)))
+        task.add_done_callback(self._stale_closes.discard)
+
+    @staticmethod
+    async def _drop_client(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("Ignoring error while closing a stale Oxylabs pool: %s", e)
+
+    async def query(self, payload: dict[str, Any], *, timeout: float | None = None) -> dict[str, Any]:
+        """POST a realtime query and return the decoded JSON response.
+
+        Raises httpx.HTTPStatusError on non-2xx responses and httpx.TransportError on network failures.
+        """
+
+        client = self._get_http_client()
+        request_timeout = timeout if timeout is not None else self._settings.request_timeout_seconds
+        response = await client.post(self._base_url, json=payload, timeout=request_timeout)
+        response.raise_for_status()
+        return response.json()
+
+    async def query_raw(
+        self,
+        payload: dict[str, Any],
+        *,
+        max_bytes: int,
+        timeout: float | None = None,
+    ) -> tuple[bytearray, bool]:
+        """POST a realtime query and stream the raw response body, reading at most `max_bytes`.
+
+        Returns (body, truncated). When the body is larger than `max_bytes` the stream is
+        closed early instead of buffering the rest, and `truncated` is True.
+        """
+
+        client = self._get_http_client()
+        request_timeout = timeout if timeout is not None else self._settings.request_timeout_seconds
+        body = bytearray()
+        async with client.stream("POST", self._base_url, json=payload, timeout=request_timeout) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+
+            async for chunk in response.aiter_bytes():
+                remaining = max_bytes - len(body)
+                if len(chunk) > remaining:
+                    body += chunk[:remaining]
+                    return body, True
+                body += chunk
+
+        return body, False
+
+    async def aclose(self) -> None:
+        """Close the pooled connections. The client can be reused afterwards (a new pool is created)."""
+
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._loop = None
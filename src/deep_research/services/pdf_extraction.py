@@ -0,0 +1,178 @@
+import io
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from pypdf import PdfReader
+
+# 3+ spaces in layout-mode text separate table columns; 1-2 are ordinary word spacing.
+_COLUMN_GAP_RE = re.compile(r"\s{3,}")
+_NUMBERED_HEADING_RE = re.compile(r"^(\d+(?:\.\d+){0,3})\.?\s+[A-Z]")
+_PAGE_NUMBER_RE = re.compile(r"^(?:page\s+)?\d+(?:\s*(?:/|of)\s*\d+)?$", re.IGNORECASE)
+_MIN_TABLE_ROWS = 3
+_MAX_HEADING_CHARS = 90
+_MAX_HEADING_WORDS = 12
+
+
+@dataclass(slots=True)
+class PdfExtraction:
+    markdown: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    page_count: int = 0
+    pages_read: int = 0
+    # Extracted characters per page read; low values mean scanned pages or text drawn as images.
+    chars_per_page: float = 0.0
+
+
+def _columns(line: str) -> List[str]:
+    return [cell for cell in _COLUMN_GAP_RE.split(line.strip()) if cell]
+
+
+def _heading_level(line: str) -> int | None:
+    """1..4 for lines that look like headings (numbered, ALL CAPS or Title Case), else None."""
+    text = line.strip()
+    words = text.split()
+    if not words or len(text) > _MAX_HEADING_CHARS or len(words) > _MAX_HEADING_WORDS or text[-1] in ".,;:":
+        return None
+    if match := _NUMBERED_HEADING_RE.match(text):
+        return min(match.group(1).count(".") + 2, 4)
+    letters = [c for c in text if c.isalpha()]
+    if len(letters) >= 4 and all(c.isupper() for c in letters):
+        return 2
+    capitalized = sum(1 for w in words if w[:1].isupper())
+    if len(words) >= 2 and capitalized / len(words) >= 0.75:
+        return 3
+    return None
+
+
+def _markdown_table(rows: List[List[str]]) -> str:
+    width = max(len(row) for row in rows)
+    rows = [[cell.replace("|", "\\|") for cell in row] + [""] * (width - len(row)) for row in rows]
+    lines = ["| " + " | ".join(rows[0]) + " |", "|" + " --- |" * width]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+    return "\n".join(lines)
+
+
+def _join_paragraph(lines: List[str]) -> str:
+    text = ""
+    for line in lines:
+        line = " ".join(line.split())
+        if text.endswith("-") and line[:1].islower():
+            text = text[:-1] + line
+        else:
+            text = f"{text} {line}" if text else line
+    return text
+
+
+def page_markdown(text: str) -> str:
+    """Layout-mode page text -> Markdown paragraphs, headings and tables."""
+    lines = [line.rstrip() for line in text.splitlines()]
+    lines = [line for line in lines if not _PAGE_NUMBER_RE.match(line.strip())]
+
+    blocks: List[str] = []
+    paragraph: List[str] = []
+
+    def flush() -> None:
+        if paragraph:
+            blocks.append(_join_paragraph(paragraph))
+            paragraph.clear()
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line.strip():
+            flush()
+            i += 1
+            continue
+
+        # Consecutive lines with the same number (>= 2) of column-separated cells form a table.
+        cells = _columns(line)
+        if len(cells) >= 2:
+            rows = [cells]
+            j = i + 1
+            while j < len(lines):
+                if not lines[j].strip():
+                    j += 1
+                    continue
+                next_cells = _columns(lines[j])
+                if len(next_cells) != len(cells):
+                    break
+                rows.append(next_cells)
+                j += 1
+            if len(rows) >= _MIN_TABLE_ROWS:
+                flush()
+                blocks.append(_markdown_table(rows))
+                i = j
+                continue
+
+        standalone = (i == 0 or not lines[i - 1].strip()) and (i + 1 == len(lines) or not lines[i + 1].strip())
+        if standalone and (level := _heading_level(line)):
+            flush()
+            blocks.append(f"{'#' * level} {' '.join(line.split())}")
+        else:
+            paragraph.append(line)
+        i += 1
+
+    flush()
+    return "\n\n".join(blocks)
+
+
+def _pdf_metadata(reader: PdfReader) -> Dict[str, Any]:
+    info = reader.metadata
+    if info is None:
+        return {}
+    try:
+        created = info.creation_date
+    except Exception:
+        created = None
+    metadata = {
+        "title": (info.title or "").strip(),
+        "author": (info.author or "").strip(),
+        "published_date": created.date().isoformat() if created else "",
+    }
+    return {key: value for key, value in metadata.items() if value}
+
+
+def extract_pdf_document(
+    content: bytes | memoryview,
+    url: str,
+    max_pages: int,
+    page_range: Tuple[int, int] | None = None,
+) -> PdfExtraction:
+    """PDF bytes -> page-joined Markdown. Module level so worker processes can run it.
+
+    Reads pages `page_range` (1-based, inclusive; all pages when None), at most `max_pages` of them.
+    """
+    reader = PdfReader(io.BytesIO(content))
+    if reader.is_encrypted and not reader.decrypt(""):
+        raise ValueError(f"Encrypted PDF at {url}")
+
+    page_count = len(reader.pages)
+    first, last = page_range or (1, page_count)
+    first, last = max(first, 1), min(last, page_count)
+    numbers = range(first, last + 1)[:max_pages]
+
+    pages: List[str] = []
+    chars = 0
+    for number in numbers:
+        try:
+            text = reader.pages[number - 1].extract_text(extraction_mode="layout") or ""
+        except Exception:
+            # Image-only pages (no /Contents) and odd content streams: no text, counts against density.
+            text = ""
+        chars += sum(1 for c in text if not c.isspace())
+        if markdown := page_markdown(text):
+            pages.append(f"<!-- page {number} -->\n\n{markdown}")
+
+    metadata = _pdf_metadata(reader)
+    metadata["page_count"] = page_count
+    if len(numbers) < page_count:
+        metadata["pages_read"] = f"{numbers[0]}-{numbers[-1]}" if numbers else "none"
+
+    return PdfExtraction(
+        markdown="\n\n".join(pages),
+        metadata=metadata,
+        page_count=page_count,
+        pages_read=len(numbers),
+        chars_per_page=chars / len(numbers) if numbers else 0.0,
+    )
@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable
+
+from deep_research.config import PrefetchSettings
+from deep_research.services.content_precheck import ContentPrecheck
+from deep_research.services.metrics import metrics
+from deep_research.services.models import ParsedDocument
+from deep_research.services.routing_document_parser_service import RoutingDocumentParserService
+from deep_research.services.url_utils import canonicalize_url
+from deep_research.services.web_search_service import WebSearchService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PrefetchedDocument:
+    """Downloaded and parsed ahead of time. `document` is None when either step failed."""
+
+    url: str
+    document: ParsedDocument | None
+    download_failed: bool = False
+    download_error: str | None = None
+    download_metadata: Dict[str, Any] = field(default_factory=dict)
+    content_bytes: int = 0
+
+
+@dataclass(slots=True)
+class _Entry:
+    task: asyncio.Task[PrefetchedDocument]
+    created_at: float
+
+
+class SpeculativePrefetcher:
+    """Downloads and parses the top SERP results while the agent decides what to read.
+
+    `schedule` starts background work for the first `top_k` URLs, as long as fewer than
+    `max_requests` prefetches are outstanding and less than `max_bytes` of prefetched
+    content is waiting to be used. `claim_many` hands finished (or still running) work to
+    `generate_evidence`, which waits for each URL's result with `resolve`. Entries not taken
+    within `ttl_seconds`, or still unclaimed at `close`, are dropped and counted as wasted
+    (`prefetch.wasted`, `prefetch.wasted_bytes`).
+    """
+
+    def __init__(
+        self,
+        *,
+        web_search_service: WebSearchService,
+        document_parser_service: RoutingDocumentParserService,
+        top_k: int,
+        ttl_seconds: float,
+        max_requests: int,
+        max_bytes: int,
+        content_precheck: ContentPrecheck | None = None,
+    ) -> None:
+        self._web_search_service = web_search_service
+        self._document_parser_service = document_parser_service
+        self._top_k = top_k
+        self._ttl_seconds = ttl_seconds
+        self._max_requests = max_requests
+        self._max_bytes = max_bytes
+        self._content_precheck = content_precheck
+        self._entries: Dict[str, _Entry] = {}
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: PrefetchSettings,
+        *,
+        web_search_service: WebSearchService,
+        document_parser_service: RoutingDocumentParserService,
+        content_precheck: ContentPrecheck | None = None,
+    ) -> "SpeculativePrefetcher":
+        return cls(
+            web_search_service=web_search_service,
+            document_parser_service=document_parser_service,
+            top_k=settings.top_k,
+            ttl_seconds=settings.ttl_seconds,
+            max_requests=settings.max_requests,
+            max_bytes=settings.max_bytes,
+            content_precheck=content_precheck,
+        )
+
+    @staticmethod
+    def hit_rate() -> float | None:
+        """Share of started prefetches that were used by generate_evidence (process-wide)."""
+        started = metrics.get("prefetch.started")
+        return metrics.get("prefetch.hit") / started if started else None
+
+    def _held_bytes(self) -> int:
+        return sum(
+            e.task.result().content_bytes
+            for e in self._entries.values()
+            if e.task.done() and not e.task.cancelled() and e.task.exception() is None
+        )
+
+    def schedule(self, urls: Iterable[str]) -> int:
+        """Start prefetching the first `top_k` URLs that are not already prefetched. Returns how many started."""
+
+        self._expire()
+        started = 0
+        for url in list(urls)[: self._top_k]:
+            key = canonicalize_url(url)
+            if key in self._entries:
+                continue
+            if self._content_precheck is not None and self._content_precheck.classify_url(url).skip:
+                continue
+            if len(self._entries) >= self._max_requests or self._held_bytes() >= self._max_bytes:
+                metrics.incr("prefetch.skipped_budget")
+                break
+
+            task = asyncio.create_task(self._prefetch(url))
+            self._entries[key] = _Entry(task=task, created_at=time.monotonic())
+            metrics.incr("prefetch.started")
+            started += 1
+
+        if started:
+            logger.info("Speculatively prefetching %s URL(s)", started)
+        return started
+
+    def claim_many(self, urls: Iterable[str]) -> Dict[str, asyncio.Task[PrefetchedDocument]]:
+        """Claim the prefetch tasks for `urls` without waiting for them; see `resolve`."""
+
+        self._expire()
+        claimed: Dict[str, asyncio.Task[PrefetchedDocument]] = {}
+        for url in urls:
+            entry = self._entries.pop(canonicalize_url(url), None)
+            if entry is not None:
+                claimed[url] = entry.task
+            else:
+                metrics.incr("prefetch.miss")
+        return claimed
+
+    @staticmethod
+    async def resolve(url: str, task: asyncio.Task[PrefetchedDocument]) -> PrefetchedDocument | None:
+        """Wait for a claimed prefetch. None when it raised, so the caller fetches `url` itself.
+
+        Only parsed documents count as hits; failed downloads and parses are `prefetch.unusable`.
+        """
+
+        try:
+            prefetched = await task
+        except Exception as e:
+            logger.warning("Prefetch of %s failed, fetching again: %s", url, e)
+            metrics.incr("prefetch.miss")
+            return None
+        metrics.incr("prefetch.hit" if prefetched.document is not None else "prefetch.unusable")
+        prefetched.url = url
+        if prefetched.document is not None:
+            prefetched.document.source_url = url
+        return prefetched
+
+    def close(self) -> None:
+        """Drop every unclaimed prefetch, cancelling those still running. Call when the research turn ends."""
+        for entry in self._entries.values():
+            self._discard(entry)
+        self._entries.clear()
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if now - entry.created_at < self._ttl_seconds:
+                continue
+            del self._entries[key]
+            self._discard(entry)
+
+    @staticmethod
+    def _discard(entry: _Entry) -> None:
+        metrics.incr("prefetch.wasted")
+        if entry.task.done():
+            if not entry.task.cancelled() and entry.task.exception() is None:
+                metrics.incr("prefetch.wasted_bytes", entry.task.result().content_bytes)
+        else:
+            entry.task.cancel()
+
+    async def _prefetch(self, url: str) -> PrefetchedDocument:
+        download = await self._web_search_service.download_url(url)
+        if not download.content:
+            return PrefetchedDocument(url=url, document=None, download_failed=True, download_error=download.error)
+
+        parsed, _failed = await self._document_parser_service.parse_files([(None, url, download.content)])
+        return PrefetchedDocument(
+            url=url,
+            document=parsed[0] if parsed else None,
+            download_metadata=download.metadata,
+            content_bytes=len(download.content),
+        )
@@ -0,0 +1,56 @@
+import logging
+from collections import OrderedDict
+
+import trafilatura
+
+from deep_research.services.url_utils import get_url_domain
+
+logger = logging.getLogger(__name__)
+
+_HTML_SNIFF_BYTES = 1024
+_HTML_MARKERS = (b"<!doctype html", b"<html", b"<head", b"<body")
+
+
+class RenderPolicy:
+    """Decides when a download needs a JS-rendered fetch.
+
+    A plain fetch is tried first; if its visible text is too short the page is assumed
+    to be a JS shell and its domain is remembered, so later URLs on that domain skip
+    the wasted plain attempt. The remembered set is bounded (oldest domains dropped).
+    """
+
+    def __init__(self, *, min_text_chars: int, max_domains: int = 10_000) -> None:
+        self._min_text_chars = min_text_chars
+        self._max_domains = max_domains
+        self._render_domains: OrderedDict[str, None] = OrderedDict()
+
+    def needs_render(self, url: str) -> bool:
+        domain = get_url_domain(url)
+        if domain in self._render_domains:
+            self._render_domains.move_to_end(domain)
+            return True
+        return False
+
+    def mark_needs_render(self, url: str) -> None:
+        domain = get_url_domain(url)
+        if not domain:
+            return
+        logger.info("Remembering that %s needs JS rendering", domain)
+        self._render_domains[domain] = None
+        self._render_domains.move_to_end(domain)
+        while len(self._render_domains) > self._max_domains:
+            self._render_domains.popitem(last=False)
+
+    def is_sufficient(self, content: bytes | memoryview) -> bool:
+        """Cheap check that a plain (non-rendered) fetch has enough text to be useful."""
+
+        if not content:
+            return False
+
+        head = bytes(content[:_HTML_SNIFF_BYTES]).lower()
+        # Non-HTML payloads (PDFs, plain text, JSON...) do not get better with rendering.
+        if not any(marker in head for marker in _HTML_MARKERS):
+            return True
+
+        text = trafilatura.html2txt(str(content, "utf-8", errors="replace"))
+        return len(text.strip()) >= self._min_text_chars
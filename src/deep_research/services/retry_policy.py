@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, TypeVar
+
+import httpx
+
+from deep_research.config import DownloadSettings
+from deep_research.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class RetryableStatusError(Exception):
+    """The target site answered with a transient status (5xx/429) through Oxylabs."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"Transient upstream status {status_code}")
+        self.status_code = status_code
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    if isinstance(error, RetryableStatusError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+class RetryPolicy:
+    """Retries retryable errors with "full jitter" exponential backoff."""
+
+    def __init__(self, *, max_attempts: int, base_delay: float, max_delay: float, name: str = "downloads") -> None:
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._name = name
+
+    @classmethod
+    def from_settings(cls, settings: DownloadSettings, *, name: str = "downloads") -> "RetryPolicy":
+        return cls(
+            max_attempts=settings.retry_max_attempts,
+            base_delay=settings.retry_base_delay_seconds,
+            max_delay=settings.retry_max_delay_seconds,
+            name=name,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self._max_delay, self._base_delay * (2 ** attempt)))
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                attempt += 1
+                if attempt >= self._max_attempts or not is_retryable_error(e):
+                    raise
+                delay = self.backoff(attempt - 1)
+                metrics.incr(f"{self._name}.retries")
+                logger.info("Retrying %s after %s (attempt %s, sleeping %.2fs)", self._name, e, attempt + 1, delay)
+                await asyncio.sleep(delay)
+
+
+class LatencyTracker:
+    """Rolling window of request latencies used to pick the hedging delay."""
+
+    def __init__(self, *, window: int = 200) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, pct: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class HedgePolicy:
+    """Fires a duplicate request when the first one is slower than the observed p-th percentile.
+
+    The first request to succeed wins and the other is cancelled. Hedging stays off until
+    `min_samples` latencies have been observed.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        percentile: float,
+        min_delay: float,
+        min_samples: int = 20,
+        name: str = "downloads",
+    ) -> None:
+        self._enabled = enabled
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._min_samples = min_samples
+        self._name = name
+        self.latencies = LatencyTracker()
+
+    @classmethod
+    def from_settings(cls, settings: DownloadSettings, *, name: str = "downloads") -> "HedgePolicy":
+        return cls(
+            enabled=settings.hedge_enabled,
+            percentile=settings.hedge_percentile,
+            min_delay=settings.hedge_min_delay_seconds,
+            name=name,
+        )
+
+    def hedge_delay(self) -> float | None:
+        if not self._enabled or len(self.latencies) < self._min_samples:
+            return None
+        return max(self._min_delay, self.latencies.percentile(self._percentile) or 0.0)
+
+    async def _timed(self, fn: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await fn()
+        self.latencies.record(time.monotonic() - started)
+        return result
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        delay = self.hedge_delay()
+        primary = asyncio.ensure_future(self._timed(fn))
+        if delay is None:
+            return await primary
+
+        hedge: asyncio.Future[T] | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            metrics.incr(f"{self._name}.hedges")
+            hedge = asyncio.ensure_future(self._timed(fn))
+            pending = {primary, hedge}
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            metrics.incr(f"{self._name}.hedge_wins")
+                        return task.result()
+                    error = error or task.exception()
+            raise error  # both requests failed
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
@@ -0,0 +1,219 @@
+import asyncio
+import codecs
+import io
+import logging
+import time
+import zipfile
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Literal, Mapping, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from deep_research.config import ParserSettings
+from deep_research.services.document_parser_service import DocumentParserService
+from deep_research.services.extraction_pool import ExtractionPool
+from deep_research.services.file_service import FileService
+from deep_research.services.local_document_parser_service import LocalDocumentParserService
+from deep_research.services.metrics import metrics
+from deep_research.services.models import ParsedDocument
+from deep_research.services.trafilatura_document_parser_service import TrafilaturaDocumentParserService
+
+logger = logging.getLogger(__name__)
+
+DocumentKind = Literal["html", "text", "pdf", "docx", "pptx", "office", "unknown"]
+PARSERS = ("passthrough", "trafilatura", "local", "llamaparse")
+
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_EXTENSION_KINDS: Dict[str, DocumentKind] = {
+    "pdf": "pdf",
+    "docx": "docx",
+    "pptx": "pptx",
+    **dict.fromkeys(("doc", "ppt", "xls", "xlsx", "odt", "odp", "ods", "rtf", "epub"), "office"),
+    **dict.fromkeys(("htm", "html", "xhtml", "shtml", "php", "asp", "aspx", "jsp"), "html"),
+    **dict.fromkeys(("txt", "md", "csv", "json", "xml"), "text"),
+}
+_UPLOAD_SUFFIXES = {"pdf": ".pdf", "docx": ".docx", "pptx": ".pptx", "html": ".html", "text": ".txt"}
+# UTF-32 LE starts with the UTF-16 LE mark, so it is checked first.
+_TEXT_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _zip_kind(content: bytes | memoryview) -> DocumentKind:
+    try:
+        names = zipfile.ZipFile(io.BytesIO(content)).namelist()
+    except zipfile.BadZipFile:
+        return "unknown"
+    if "word/document.xml" in names:
+        return "docx"
+    if any(name.startswith("ppt/slides/") for name in names):
+        return "pptx"
+    # xlsx, OpenDocument, EPUB
+    return "office"
+
+
+def sniff_document_kind(content: bytes | memoryview, url: str) -> DocumentKind:
+    """Guess the document type from its magic bytes, falling back to the URL extension."""
+    head = bytes(content[:1024])
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04") and (kind := _zip_kind(content)) != "unknown":
+        return kind
+    if head.startswith(_OLE_MAGIC) or head.startswith(b"{\\rtf"):
+        return "office"
+
+    markup = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if markup.startswith((b"<!doctype html", b"<html", b"<head", b"<body")) or b"<html" in markup:
+        return "html"
+
+    extension = PurePosixPath(urlsplit(url).path).suffix.lower().lstrip(".")
+    if kind := _EXTENSION_KINDS.get(extension):
+        return kind
+    if markup.startswith(b"<"):
+        return "html"
+    if head and b"\x00" not in head:
+        return "text"
+    return "unknown"
+
+
+def decode_text(content: bytes | memoryview) -> str:
+    """Plain-text bytes -> str: by byte order mark, else UTF-8, else Windows-1252 (never fails)."""
+    data = bytes(content)
+    for bom, encoding in _TEXT_BOMS:
+        if data.startswith(bom):
+            return data.decode(encoding, errors="replace")
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("cp1252", errors="replace")
+
+
+class _TextRoute:
+    """Plain text, Markdown, CSV and JSON need no extraction: the decoded text is the Markdown."""
+
+    async def parse_files(self, files: List[Tuple[str | None, str, bytes | memoryview]]) -> tuple[List[ParsedDocument], List[str]]:
+        parsed: List[ParsedDocument] = []
+        failed: List[str] = []
+        for _file_id, url, content in files:
+            if text := decode_text(content).strip():
+                parsed.append(ParsedDocument(source_url=url, markdown=text))
+            else:
+                failed.append(url)
+        return parsed, failed
+
+
+class _LlamaParseRoute:
+    """Uploads the bytes to LlamaCloud, then parses the file with LlamaParse."""
+
+    def __init__(self, *, file_service: FileService, parser: DocumentParserService) -> None:
+        self._file_service = file_service
+        self._parser = parser
+
+    async def parse_files(self, files: List[Tuple[str | None, str, bytes | memoryview]]) -> tuple[List[ParsedDocument], List[str]]:
+        to_parse: List[Tuple[str, str]] = []
+        failed: List[str] = []
+        for _file_id, url, content in files:
+            filename = f"upload_{abs(hash(url))}{_UPLOAD_SUFFIXES.get(sniff_document_kind(content, url), '')}"
+            try:
+                to_parse.append((await self._file_service.upload_bytes(bytes(content), filename=filename), url))
+            except Exception as e:
+                logger.error("Failed to upload %s for LlamaParse: %s", url, e)
+                failed.append(url)
+
+        parsed, parse_failures = await self._parser.parse_files(to_parse) if to_parse else ([], [])
+        return parsed, sorted(failed + parse_failures)
+
+
+class RoutingDocumentParserService:
+    """Sends each downloaded document to the cheapest parser that can handle it.
+
+    The document type is sniffed from magic bytes (URL extension as a fallback) and looked
+    up in `routes`: HTML goes to Trafilatura, plain text passes through as is, PDF/DOCX/PPTX
+    go to the local extractor and other Office formats to LlamaParse. When a parser fails, the next one in the route is tried
+    (e.g. scanned PDFs go on to LlamaParse). Same `parse_files` contract as the individual parsers.
+
+    Per-parser counters: `parser.route.<parser>.attempts`, `.hits`, `.failures`, `.ms`;
+    `parser.kind.<kind>` counts sniffed types and `parser.route.fallbacks` second tries.
+    """
+
+    def __init__(self, *, routes: Mapping[str, Sequence[str]], parsers: Mapping[str, Any]) -> None:
+        self._routes = {kind: list(chain) for kind, chain in routes.items()}
+        self._parsers = dict(parsers)
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: ParserSettings,
+        *,
+        pool: ExtractionPool | None = None,
+        file_service: FileService | None = None,
+        llama_parser: DocumentParserService | None = None,
+    ) -> "RoutingDocumentParserService":
+        pool = pool or ExtractionPool.from_settings(settings)
+        parsers: Dict[str, Any] = {
+            "passthrough": _TextRoute(),
+            "trafilatura": TrafilaturaDocumentParserService.from_settings(settings, pool=pool),
+            "local": LocalDocumentParserService.from_settings(settings, pool=pool),
+        }
+        if settings.llamaparse_enabled and file_service is not None:
+            parsers["llamaparse"] = _LlamaParseRoute(
+                file_service=file_service,
+                parser=llama_parser or DocumentParserService(),
+            )
+        return cls(routes=settings.routes, parsers=parsers)
+
+    @staticmethod
+    def route_report() -> Dict[str, Dict[str, float]]:
+        """Per-parser attempts, hits, hit rate and mean latency (process-wide)."""
+        report: Dict[str, Dict[str, float]] = {}
+        for name in PARSERS:
+            attempts = metrics.get(f"parser.route.{name}.attempts")
+            hits = metrics.get(f"parser.route.{name}.hits")
+            report[name] = {
+                "attempts": attempts,
+                "hits": hits,
+                "hit_rate": hits / attempts if attempts else 0.0,
+                "avg_ms": metrics.get(f"parser.route.{name}.ms") / attempts if attempts else 0.0,
+            }
+        return report
+
+    async def parse_files(self, files: List[Tuple[str | None, str, bytes | memoryview]]) -> tuple[List[ParsedDocument], List[str]]:
+        tasks = [self._parse_single(url=url, content=content) for _file_id, url, content in files]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        valid_results: list[ParsedDocument] = []
+        failed_urls: list[str] = []
+
+        for (_file_id, url, _content), res in zip(files, results):
+            if isinstance(res, BaseException):
+                failed_urls.append(url)
+                logger.error("Failed to parse url=%s: %s", url, res)
+                continue
+            valid_results.append(res)
+
+        return valid_results, sorted(failed_urls)
+
+    async def _parse_single(self, *, url: str, content: bytes | memoryview) -> ParsedDocument:
+        kind = sniff_document_kind(content, url)
+        metrics.incr(f"parser.kind.{kind}")
+        chain = [name for name in self._routes.get(kind, self._routes.get("unknown", [])) if name in self._parsers]
+        if not chain:
+            raise ValueError(f"No parser available for {kind} document")
+
+        for attempt, name in enumerate(chain):
+            if attempt:
+                metrics.incr("parser.route.fallbacks")
+                logger.info("Falling back to %s for %s (%s)", name, url, kind)
+            started = time.perf_counter()
+            parsed, _failed = await self._parsers[name].parse_files([(None, url, content)])
+            metrics.incr(f"parser.route.{name}.attempts")
+            metrics.incr(f"parser.route.{name}.ms", round((time.perf_counter() - started) * 1000))
+            if parsed:
+                metrics.incr(f"parser.route.{name}.hits")
+                return parsed[0]
+            metrics.incr(f"parser.route.{name}.failures")
+
+        raise ValueError(f"{kind} document could not be parsed (tried {', '.join(chain)})")
@@ -0,0 +1,189 @@
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from deep_research.config import SerpCacheSettings
+from deep_research.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r'-?"[^"]*"|\S+')
+_OPERATOR_RE = re.compile(r"^-?[a-z_]+:\S+$")
+_BOOLEAN_OPERATORS = {"or": "OR", "and": "AND", "|": "OR"}
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache lookups.
+
+    Lower-cases terms, collapses whitespace (also inside quoted phrases), keeps boolean
+    operators upper-cased and moves `key:value` operators (site:, filetype:, ...) to the
+    end in a stable order, so `site:x.com Foo  bar` and `foo bar site:x.com` share a key.
+    """
+
+    terms: List[str] = []
+    operators: List[str] = []
+    for token in _TOKEN_RE.findall(query or ""):
+        lowered = token.lower()
+        if token in ("OR", "AND", "|"):
+            terms.append(_BOOLEAN_OPERATORS[lowered])
+        elif '"' in lowered:
+            terms.append(" ".join(lowered.split()))
+        elif _OPERATOR_RE.match(lowered):
+            operators.append(lowered)
+        else:
+            terms.append(lowered)
+    return " ".join(terms + sorted(operators))
+
+
+class SerpCache:
+    """Persistent SQLite cache of parsed SERP pages, keyed by normalized query and page number.
+
+    Organic results are stored per page. SERP features repeat across the pages of a query,
+    so they are stored once per query (merged, without duplicates) and returned with page 1.
+    Entries expire after `ttl_seconds`; once the page table grows past `max_entries` the
+    least recently used pages are evicted, together with the features of queries that no
+    longer have a cached page. Blocking sqlite calls run in a worker thread.
+    """
+
+    def __init__(self, *, path: str | Path, ttl_seconds: int, max_entries: int) -> None:
+        self._path = Path(path)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_settings(cls, settings: SerpCacheSettings) -> "SerpCache":
+        return cls(path=settings.path, ttl_seconds=settings.ttl_seconds, max_entries=settings.max_entries)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS serp_pages ("
+                " query TEXT NOT NULL,"
+                " page INTEGER NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (query, page))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS serp_cache_accessed_at ON serp_pages (accessed_at)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS serp_features ("
+                " query TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    async def get(self, query: str, page: int) -> Dict[str, Any] | None:
+        """Return the cached page as {"organic": [...], "features": [...]}, or None.
+
+        Features (all cached ones of the query) come with page 1 only.
+        """
+        key = normalize_query(query)
+        cached = await asyncio.to_thread(self._get_sync, key, page)
+        if cached is None:
+            metrics.incr("serp_cache.miss")
+            logger.info("SERP cache miss query=%r page=%s", key, page)
+            return None
+
+        metrics.incr("serp_cache.hit")
+        logger.info("SERP cache hit query=%r page=%s", key, page)
+        return cached
+
+    async def set(self, query: str, page: int, organic: List[Dict[str, Any]], features: List[Dict[str, Any]]) -> None:
+        key = normalize_query(query)
+        await asyncio.to_thread(self._set_sync, key, page, json.dumps(organic), features)
+
+    def _get_sync(self, key: str, page: int) -> Dict[str, Any] | None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, created_at FROM serp_pages WHERE query = ? AND page = ?",
+                (key, page),
+            ).fetchone()
+            if row is None:
+                return None
+
+            organic, created_at = row
+            if now - created_at > self._ttl_seconds:
+                conn.execute("DELETE FROM serp_pages WHERE query = ? AND page = ?", (key, page))
+                conn.commit()
+                return None
+
+            conn.execute(
+                "UPDATE serp_pages SET accessed_at = ? WHERE query = ? AND page = ?",
+                (now, key, page),
+            )
+            conn.commit()
+            features = self._features(conn, key, now) if page == 1 else []
+        return {"organic": json.loads(organic), "features": features}
+
+    def _features(self, conn: sqlite3.Connection, key: str, now: float) -> List[Dict[str, Any]]:
+        row = conn.execute(
+            "SELECT payload FROM serp_features WHERE query = ? AND created_at >= ?",
+            (key, now - self._ttl_seconds),
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else []
+
+    def _set_sync(self, key: str, page: int, organic: str, features: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO serp_pages (query, page, payload, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, page, organic, now, now),
+            )
+            if features:
+                merged = merge_features(self._features(conn, key, now), features)
+                conn.execute(
+                    "INSERT OR REPLACE INTO serp_features (query, payload, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(merged), now),
+                )
+            conn.execute("DELETE FROM serp_pages WHERE created_at < ?", (now - self._ttl_seconds,))
+            (count,) = conn.execute("SELECT COUNT(*) FROM serp_pages").fetchone()
+            if count > self._max_entries:
+                evicted = count - self._max_entries
+                conn.execute(
+                    "DELETE FROM serp_pages WHERE rowid IN ("
+                    " SELECT rowid FROM serp_pages ORDER BY accessed_at ASC LIMIT ?)",
+                    (evicted,),
+                )
+                metrics.incr("serp_cache.evicted", evicted)
+            conn.execute(
+                "DELETE FROM serp_features WHERE created_at < ? OR query NOT IN (SELECT query FROM serp_pages)",
+                (now - self._ttl_seconds,),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def merge_features(*feature_lists: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Concatenate feature lists, dropping repeats (the same block shown on several SERP pages)."""
+    seen: set[str] = set()
+    merged: List[Dict[str, Any]] = []
+    for features in feature_lists:
+        for feature in features:
+            fingerprint = json.dumps(feature, sort_keys=True)
+            if fingerprint not in seen:
+                seen.add(fingerprint)
+                merged.append(feature)
+    return merged
@@ -0,0 +1,124 @@
+from typing import Any, Dict, Iterable, List
+from urllib.parse import quote_plus
+
+from deep_research.workflows.research.searcher.models import EvidenceItem
+
+FEATURED_SNIPPET = "featured_snippet"
+KNOWLEDGE_PANEL = "knowledge_panel"
+PEOPLE_ALSO_ASK = "people_also_ask"
+TOP_STORIES = "top_stories"
+
+
+def _as_list(value: Any) -> List[Dict[str, Any]]:
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, dict)]
+    return []
+
+
+def _text(*values: Any) -> str:
+    return " ".join(str(v).strip() for v in values if isinstance(v, (str, int, float)) and str(v).strip())
+
+
+def extract_serp_features(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Pull answer-bearing blocks out of a parsed Oxylabs Google SERP (`content.results`).
+
+    Returns normalized dicts: {"type", "title", "text", "url", "source"}; blocks without
+    any usable text are dropped.
+    """
+
+    features: List[Dict[str, Any]] = []
+
+    for snippet in _as_list(results.get("featured_snippet")):
+        text = _text(snippet.get("desc") or snippet.get("answer") or snippet.get("text"))
+        if text:
+            features.append(
+                {
+                    "type": FEATURED_SNIPPET,
+                    "title": _text(snippet.get("title")),
+                    "text": text,
+                    "url": snippet.get("url"),
+                    "source": None,
+                }
+            )
+
+    for panel in _as_list(results.get("knowledge")):
+        facts = [
+            f"{_text(f.get('title'))}: {_text(f.get('content'))}"
+            for f in _as_list(panel.get("factoids"))
+            if _text(f.get("title")) and _text(f.get("content"))
+        ]
+        text = "\n".join(filter(None, [_text(panel.get("subtitle")), _text(panel.get("description")), *facts]))
+        if text:
+            source = panel.get("source") if isinstance(panel.get("source"), dict) else {}
+            features.append(
+                {
+                    "type": KNOWLEDGE_PANEL,
+                    "title": _text(panel.get("title")),
+                    "text": text,
+                    "url": panel.get("url") or source.get("url"),
+                    "source": None,
+                }
+            )
+
+    for question in _as_list(results.get("related_questions")):
+        answer = _text(question.get("answer"))
+        if answer:
+            source = question.get("source") if isinstance(question.get("source"), dict) else {}
+            features.append(
+                {
+                    "type": PEOPLE_ALSO_ASK,
+                    "title": _text(question.get("question")),
+                    "text": answer,
+                    "url": source.get("url"),
+                    "source": _text(source.get("title")) or None,
+                }
+            )
+
+    top_stories = results.get("top_stories")
+    stories = _as_list(top_stories.get("items")) if isinstance(top_stories, dict) else _as_list(top_stories)
+    for story in stories:
+        title = _text(story.get("title"))
+        if title and story.get("url"):
+            features.append(
+                {
+                    "type": TOP_STORIES,
+                    "title": title,
+                    "text": _text(title, "-", story.get("source"), story.get("time_frame")),
+                    "url": story.get("url"),
+                    "source": _text(story.get("source")) or None,
+                }
+            )
+
+    return features
+
+
+def serp_features_to_evidence(query: str, features: Iterable[Dict[str, Any]]) -> List[EvidenceItem]:
+    """Turn SERP features into `source_type="serp"` evidence items (no download, parse or LLM call)."""
+
+    search_url = f"https://www.google.com/search?q={quote_plus(query)}"
+    items: List[EvidenceItem] = []
+    for feature in features:
+        title = feature.get("title") or None
+        text = feature["text"]
+        content = text
+        if title and feature["type"] == PEOPLE_ALSO_ASK:
+            content = f"Q: {title}\nA: {text}"
+        elif title and feature["type"] == KNOWLEDGE_PANEL:
+            content = f"{title}\n{text}"
+        items.append(
+            EvidenceItem(
+                url=feature.get("url") or search_url,
+                title=title,
+                source_type="serp",
+                metadata={
+                    "serp_feature": feature["type"],
+                    "query": query,
+                    **({"source": feature["source"]} if feature.get("source") else {}),
+                },
+                summary=f"- [{feature['type']}] {content}",
+                content=content,
+            )
+        )
+    return items
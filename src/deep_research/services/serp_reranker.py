@@ -0,0 +1,104 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Mapping
+
+from deep_research.services.metrics import metrics
+from deep_research.services.url_utils import get_url_domain
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_TITLE_SUFFIX_RE = re.compile(r"\s+[-|–—·:]\s+[^-|–—·:]{1,40}$")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to was what when where which who why with vs".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS and len(t) > 1]
+
+
+def normalize_title(title: str) -> str:
+    """Title without the trailing site name (`Foo bar - Example News` -> `foo bar`)."""
+    return " ".join(tokenize(_TITLE_SUFFIX_RE.sub("", title or "")))
+
+
+@dataclass(slots=True)
+class RankedResult:
+    item: Dict
+    score: float
+
+
+class SerpReranker:
+    """Local, LLM-free reranking of organic SERP results against the search query.
+
+    Score = BM25 of the query over title + snippet (normalized to 0..1 within the result
+    set) + a small prior for the original Google position + a per-domain prior. Results
+    whose normalized title repeats an earlier (better ranked) one are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        domain_priors: Mapping[str, float] | None = None,
+        position_weight: float = 0.3,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        self._domain_priors = {d.lower().removeprefix("www."): p for d, p in (domain_priors or {}).items()}
+        self._position_weight = position_weight
+        self._k1 = k1
+        self._b = b
+
+    def domain_prior(self, url: str) -> float:
+        domain = get_url_domain(url)
+        # Most specific match wins: `docs.python.org`, then `python.org`.
+        while domain:
+            if domain in self._domain_priors:
+                return self._domain_priors[domain]
+            _, _, domain = domain.partition(".")
+        return 0.0
+
+    def rerank(self, query: str, results: List[Dict]) -> List[RankedResult]:
+        docs = [tokenize(f"{r.get('title') or ''} {r.get('desc') or r.get('snippet') or ''}") for r in results]
+        lexical = self._bm25(tokenize(query), docs)
+        top = max(lexical, default=0.0)
+
+        ranked: List[RankedResult] = []
+        for position, (item, raw) in enumerate(zip(results, lexical)):
+            score = raw / top if top > 0 else 0.0
+            score += self._position_weight / (1 + position)
+            score += self.domain_prior(item.get("url") or "")
+            ranked.append(RankedResult(item=item, score=round(score, 3)))
+        ranked.sort(key=lambda r: r.score, reverse=True)
+
+        unique: List[RankedResult] = []
+        seen_titles: set[str] = set()
+        for result in ranked:
+            title = normalize_title(result.item.get("title") or "")
+            if title and title in seen_titles:
+                metrics.incr("serp.rerank_duplicate_titles")
+                continue
+            seen_titles.add(title)
+            unique.append(result)
+        return unique
+
+    def _bm25(self, query_terms: List[str], docs: List[List[str]]) -> List[float]:
+        if not docs or not query_terms:
+            return [0.0] * len(docs)
+
+        n_docs = len(docs)
+        avg_len = sum(len(d) for d in docs) / n_docs or 1.0
+        doc_freq = Counter(term for doc in docs for term in set(doc))
+        scores: List[float] = []
+        for doc in docs:
+            tf = Counter(doc)
+            score = 0.0
+            for term in set(query_terms):
+                if term not in tf:
+                    continue
+                idf = math.log((n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5) + 1)
+                norm = tf[term] + self._k1 * (1 - self._b + self._b * len(doc) / avg_len)
+                score += idf * tf[term] * (self._k1 + 1) / norm
+            scores.append(score)
+        return scores
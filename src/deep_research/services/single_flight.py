@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+from deep_research.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls for the same key into one in-flight task.
+
+    The first caller starts the work; later callers with the same key await the same
+    task. Each caller awaits through `asyncio.shield`, so cancelling one caller never
+    cancels the shared work for the others; the shared task is cancelled only when its
+    last waiter goes away. With `enabled=False` every call runs its own work.
+    """
+
+    def __init__(self, name: str, *, enabled: bool = True) -> None:
+        self._name = name
+        self._enabled = enabled
+        self._calls: Dict[Hashable, _Call[T]] = {}
+        self.coalesced = 0
+
+    def _forget(self, key: Hashable, call: _Call[T]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        if not self._enabled:
+            return await fn()
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _task, key=key, call=call: self._forget(key, call))
+        else:
+            self.coalesced += 1
+            metrics.incr(f"single_flight.{self._name}.coalesced")
+            logger.debug("Coalesced in-flight %s request for %r", self._name, key)
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Forget the call first: a caller arriving before the task finishes
+                # cancelling must start fresh work, not join (and inherit) the cancellation.
+                self._forget(key, call)
+                call.task.cancel()
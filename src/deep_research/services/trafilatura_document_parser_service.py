@@ -1,22 +1,152 @@
 import asyncio
 import logging
-from typing import List, Tuple
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
 
 import trafilatura
+from lxml.html import HtmlElement
+from trafilatura.metadata import extract_metadata
+from trafilatura.utils import load_html
 
+from deep_research.config import ParserSettings
+from deep_research.services.extraction_pool import ExtractionPool
+from deep_research.services.metrics import metrics
 from deep_research.services.models import ParsedDocument
 
 logger = logging.getLogger(__name__)
 
 
+def _decode_bytes(content: bytes | memoryview) -> str:
+    if not content:
+        return ""
+
+    # str() decodes straight from the buffer, so memory-mapped cache hits are not copied first.
+    try:
+        return str(content, "utf-8")
+    except UnicodeDecodeError:
+        return str(content, "utf-8", errors="replace")
+
+
+# Extraction tiers, cheapest first.
+TIER_FAST = "fast"
+TIER_FALLBACK = "fallback"
+TIER_BASELINE = "baseline"
+TIERS = (TIER_FAST, TIER_FALLBACK, TIER_BASELINE)
+
+
+@dataclass(slots=True)
+class _Extraction:
+    text: str = ""
+    # Tier that produced `text`; None when every tier came back empty.
+    tier: str | None = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def _run_tier(tier: str, tree: HtmlElement) -> str:
+    if tier == TIER_BASELINE:
+        # Readability-style: the largest text blocks, without Trafilatura's boilerplate heuristics.
+        _tree, text, _length = trafilatura.baseline(tree)
+        return text or ""
+    # Trafilatura works on its own copy of a tree it is given, so tiers do not see each other's pruning.
+    extracted = trafilatura.extract(
+        tree,
+        include_comments=False,
+        include_tables=True,
+        fast=tier == TIER_FAST,
+        favor_recall=tier == TIER_FALLBACK,
+    )
+    return extracted or ""
+
+
+def _extract_metadata(tree: HtmlElement, url: str) -> Dict[str, Any]:
+    """Title, publication date, author, site name and language, from meta tags, JSON-LD and markup."""
+    # extensive=False: dates come from metadata and the URL, not from scanning the whole body text.
+    document = extract_metadata(tree, default_url=url, extensive=False)
+    language = tree.get("lang")
+    if not language:
+        # http-equiv values are case-insensitive ("Content-Language" is the usual spelling).
+        language = next(
+            (
+                meta.get("content")
+                for meta in tree.iterfind(".//meta[@http-equiv]")
+                if meta.get("http-equiv", "").strip().lower() == "content-language"
+            ),
+            None,
+        )
+    if not language:
+        locale = tree.find(".//meta[@property='og:locale']")
+        language = locale.get("content") if locale is not None else None
+    metadata = {
+        "title": document.title,
+        "published_date": document.date,
+        "author": document.author,
+        "sitename": document.sitename,
+        "language": language.strip().replace("_", "-").lower() if language else None,
+    }
+    return {key: value for key, value in metadata.items() if value}
+
+
+def _extract_document(content: bytes | memoryview, url: str, min_chars: int) -> _Extraction:
+    """Decode, parse once, read metadata and run the extraction cascade. Module level so worker processes can run it.
+
+    Later tiers only run while the best text so far is shorter than `min_chars`.
+    """
+    tree = load_html(_decode_bytes(content))
+    if tree is None:
+        return _Extraction()
+
+    extraction = _Extraction(metadata=_extract_metadata(tree, url))
+    for tier in TIERS:
+        started = time.perf_counter()
+        text = _run_tier(tier, tree)
+        extraction.timings[tier] = time.perf_counter() - started
+        if len(text) > len(extraction.text):
+            extraction.text, extraction.tier = text, tier
+        if len(extraction.text) >= min_chars:
+            break
+    return extraction
+
+
 class TrafilaturaDocumentParserService:
     """Parses downloaded HTML bytes into Markdown using Trafilatura.
 
     This is intentionally separate from DocumentParserService (LlamaParse) so both
     implementations can coexist and be swapped by wiring.
+
+    Extraction is CPU-bound, so it runs off the event loop in an ExtractionPool.
     """
 
-    async def parse_files(self, files: List[Tuple[str | None, str, bytes]]) -> tuple[List[ParsedDocument], List[str]]:
+    def __init__(self, *, pool: ExtractionPool | None = None, fallback_min_chars: int = 250) -> None:
+        self._pool = pool or ExtractionPool()
+        self._fallback_min_chars = fallback_min_chars
+
+    @classmethod
+    def from_settings(
+        cls, settings: ParserSettings, *, pool: ExtractionPool | None = None
+    ) -> "TrafilaturaDocumentParserService":
+        return cls(
+            pool=pool or ExtractionPool.from_settings(settings),
+            fallback_min_chars=settings.fallback_min_chars,
+        )
+
+    @staticmethod
+    def tier_report() -> Dict[str, Dict[str, float]]:
+        """Per-tier attempts, hits (tier produced the kept text), hit rate and mean time (process-wide)."""
+        report: Dict[str, Dict[str, float]] = {}
+        for tier in TIERS:
+            attempts = metrics.get(f"parser.{tier}.attempts")
+            hits = metrics.get(f"parser.{tier}.hits")
+            report[tier] = {
+                "attempts": attempts,
+                "hits": hits,
+                "hit_rate": hits / attempts if attempts else 0.0,
+                "avg_ms": metrics.get(f"parser.{tier}.ms") / attempts if attempts else 0.0,
+            }
+        return report
+
+    async def parse_files(self, files: List[Tuple[str | None, str, bytes | memoryview]]) -> tuple[List[ParsedDocument], List[str]]:
         tasks = [self._parse_single(url=url, content=content) for _file_id, url, content in files]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -32,35 +162,22 @@ class TrafilaturaDocumentParserService:
 
         return valid_results, sorted(failed_urls)
 
-    async def _parse_single(self, *, url: str, content: bytes) -> ParsedDocument:
+    async def _parse_single(self, *, url: str, content: bytes | memoryview) -> ParsedDocument:
         logger.info("Parsing url=%s (trafilatura)", url)
 
-        decoded = self._decode_bytes(content)
-        extracted = trafilatura.extract(
-            decoded,
-            include_comments=False,
-            include_tables=True,
-            no_fallback=True,
-        )
-
-        markdown_content = extracted or ""
-        if not markdown_content:
-            logger.warning("Trafilatura returned no content for %s", url)
+        extraction = await self._pool.run(_extract_document, content, url, self._fallback_min_chars)
+        for tried, seconds in extraction.timings.items():
+            metrics.incr(f"parser.{tried}.attempts")
+            metrics.incr(f"parser.{tried}.ms", round(seconds * 1000))
+        if extraction.tier is None:
+            metrics.incr("parser.empty")
+            # An empty document would only waste an analysis call downstream.
+            raise ValueError(f"No extractable text in {url} (tried {', '.join(extraction.timings) or 'nothing'})")
+        metrics.incr(f"parser.{extraction.tier}.hits")
 
         return ParsedDocument(
             source_url=url,
-            markdown=markdown_content,
+            markdown=extraction.text,
             assets=[],
-            metadata={},
+            metadata=extraction.metadata,
         )
-
-    @staticmethod
-    def _decode_bytes(content: bytes) -> str:
-        if not content:
-            return ""
-
-        try:
-            return content.decode("utf-8")
-        except UnicodeDecodeError:
-            return content.decode("utf-8", errors="replace")
-
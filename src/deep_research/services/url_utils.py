@@ -0,0 +1,98 @@
+import re
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+_TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "gbraid",
+        "wbraid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "mkt_tok",
+        "ref_src",
+        "ref_url",
+        "spm",
+        "amp",
+        "outputtype",
+    }
+)
+_TRACKING_PREFIXES = ("utm_", "pk_", "__hs")
+_AMP_PATH_RE = re.compile(r"/amp$|\.amp(?=\.html?$)", re.IGNORECASE)
+_GOOGLE_AMP_RE = re.compile(r"^/amp/(s/)?(.+)$")
+
+
+def get_url_domain(url: str) -> str:
+    """Return the lower-cased host of a URL without port or a leading `www.`."""
+
+    host = (urlsplit((url or "").strip()).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+def get_url_key(url: str) -> str:
+    """Stable lookup key for a URL: lower-cased scheme/host, default path, no fragment."""
+
+    parts = urlsplit((url or "").strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical form of a URL for deduplication (not for fetching).
+
+    Variants of the same document collapse to one string: the scheme becomes https, the
+    host is lower-cased without `www.`/`m.`/`amp.` or a default port, the fragment,
+    tracking parameters (`utm_*`, `gclid`, ...) and trailing slash are dropped, the
+    remaining query parameters are sorted, and AMP variants (`/amp`, `.amp.html`, Google
+    AMP cache links) point back at the article. Non-http(s) or malformed input is returned
+    stripped.
+    """
+
+    raw = (url or "").strip()
+    try:
+        parts = urlsplit(raw)
+        port = parts.port
+    except ValueError:
+        # Bad port or IPv6 host: keep the URL as given instead of failing the caller's whole batch.
+        return raw
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname:
+        return raw
+
+    host = parts.hostname.lower().rstrip(".")
+    path = parts.path
+
+    if host in ("google.com", "www.google.com") and (match := _GOOGLE_AMP_RE.match(path)):
+        target = unquote(match.group(2))
+        if not target.startswith(("http://", "https://")):
+            target = "https://" + target
+        return canonicalize_url(target)
+
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix):]
+            break
+
+    netloc = host
+    if port and port not in (80, 443):
+        netloc = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", path).rstrip("/")
+    path = _AMP_PATH_RE.sub("", path)
+
+    query = urlencode(
+        sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k))
+    )
+    return urlunsplit(("https", netloc, path or "/", query, ""))
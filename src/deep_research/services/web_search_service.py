@@ -1,85 +1,575 @@
 import logging
-import os
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, replace
+from typing import Any, Collection, Dict, List, Tuple
 
 import asyncio
 import base64
+import binascii
 import json
-from oxylabs import AsyncClient
+import time
 
-from llama_index.readers.oxylabs import OxylabsGoogleSearchReader
+from deep_research.config import DownloadSettings
+from deep_research.services.circuit_breaker import DomainCircuitBreaker
+from deep_research.services.download_cache import CachedDownload, DownloadCache
+from deep_research.services.download_scheduler import DownloadScheduler
+from deep_research.services.metrics import metrics
+from deep_research.services.oxylabs_client import OxylabsClient
+from deep_research.services.render_policy import RenderPolicy
+from deep_research.services.retry_policy import (
+    RETRYABLE_STATUS_CODES,
+    HedgePolicy,
+    RetryableStatusError,
+    RetryPolicy,
+)
+from deep_research.services.serp_cache import SerpCache, merge_features, normalize_query
+from deep_research.services.serp_features import extract_serp_features
+from deep_research.services.single_flight import SingleFlight
+from deep_research.services.url_utils import canonicalize_url, get_url_key
 
 logger = logging.getLogger(__name__)
 
 
+_CONTENT_MARKER = b'"content":'
+_RESULTS_MARKER = b'"results"'
+_RESPONSE_ENVELOPE_BYTES = 256 * 1024
+
+CIRCUIT_OPEN = "circuit_open"
+
+
+@dataclass(slots=True)
+class DownloadResult:
+    """Outcome of downloading a single URL. `error` says why `content` is empty, when known."""
+
+    url: str
+    content: bytes | memoryview
+    truncated: bool = False
+    rendered: bool = False
+    from_cache: bool = False
+    error: str | None = None
+
+    @classmethod
+    def from_cached(cls, url: str, cached: CachedDownload, *, rendered: bool) -> "DownloadResult":
+        return cls(url=url, content=cached.content, truncated=cached.truncated, rendered=rendered, from_cache=True)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Download facts worth keeping on the parsed document."""
+        metadata: Dict[str, Any] = {"content_bytes": len(self.content)}
+        if self.truncated:
+            metadata["truncated"] = True
+        return metadata
+
+
+@dataclass(slots=True)
+class SearchResponse:
+    """Organic results plus answer-bearing SERP features (see `extract_serp_features`)."""
+
+    results: List[Dict]
+    features: List[Dict]
+    requests_made: int
+
+
+@dataclass(slots=True)
+class _SerpPage:
+    organic: List[Dict]
+    features: List[Dict]
+    requests_made: int
+
+
+@dataclass(slots=True)
+class _ScrapedPage:
+    content: bytes
+    status_code: int | None
+    headers: Dict[str, str]
+    truncated: bool = False
+
+
 class WebSearchService:
-    """A service to encapsulate complex web search logic."""
-
-    def __init__(self) -> None:
-        self._username = os.getenv("OXYLABS_USERNAME")
-        self._password = os.getenv("OXYLABS_PASSWORD")
-        if not self._username or not self._password:
-            raise ValueError(
-                "Oxylabs credentials are required. Set OXYLABS_USERNAME and OXYLABS_PASSWORD."
-            )
+    """A service to encapsulate complex web search logic.
+
+    All requests go through a single pooled `OxylabsClient`, so one instance of this
+    service is meant to be shared by every searcher agent in the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: OxylabsClient | None = None,
+        serp_cache: SerpCache | None = None,
+        download_cache: DownloadCache | None = None,
+        download_settings: DownloadSettings | None = None,
+        circuit_breaker: DomainCircuitBreaker | None = None,
+    ) -> None:
+        self._client = client or OxylabsClient.from_env()
+        self._serp_cache = serp_cache
+        self._download_cache = download_cache
+        self._download_settings = download_settings or DownloadSettings()
+        self._circuit_breaker = circuit_breaker
+        self._render_policy = RenderPolicy(min_text_chars=self._download_settings.min_static_text_chars)
+        self._scheduler = DownloadScheduler.from_settings(self._download_settings)
+        self._search_retry = RetryPolicy.from_settings(self._download_settings, name="search")
+        self._download_retry = RetryPolicy.from_settings(self._download_settings, name="downloads")
+        self._download_hedge = HedgePolicy.from_settings(self._download_settings, name="downloads")
+        coalesce = self._download_settings.coalesce_in_flight
+        self._search_flights: SingleFlight[_SerpPage] = SingleFlight("search", enabled=coalesce)
+        self._download_flights: SingleFlight[DownloadResult] = SingleFlight("download", enabled=coalesce)
 
-    async def search_google(self, query: str, max_results: int = 10) -> Tuple[List[Dict], int]:
+    @property
+    def client(self) -> OxylabsClient:
+        return self._client
+
+    @property
+    def circuit_breaker(self) -> DomainCircuitBreaker | None:
+        return self._circuit_breaker
+
+    @property
+    def concurrency_window(self) -> int:
+        """Current AIMD limit on in-flight Oxylabs requests."""
+        return self._scheduler.concurrency_window
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of searches/downloads that joined an identical request already in flight."""
+        return self._search_flights.coalesced + self._download_flights.coalesced
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by the underlying Oxylabs client."""
+        await self._client.aclose()
+        if self._serp_cache is not None:
+            self._serp_cache.close()
+        if self._download_cache is not None:
+            self._download_cache.close()
+
+    async def search_google(
+        self,
+        query: str,
+        max_results: int = 10,
+        *,
+        max_pages: int = 1,
+        min_new_results: int | None = None,
+        exclude_urls: Collection[str] = (),
+        page_wave: int = 2,
+    ) -> Tuple[List[Dict], int]:
         """
         Performs a Google search and returns a list of organic result dictionaries.
-        Optimized for agents.
+        Optimized for agents. See `search` for the parameters.
         """
-        _MAX_PAGES = 1
-        search_reader = OxylabsGoogleSearchReader(username=self._username, password=self._password)
-        search_data = await search_reader.aget_response({'query': query, 'pages': _MAX_PAGES, 'parse': True})
+        response = await self.search(
+            query,
+            max_results,
+            max_pages=max_pages,
+            min_new_results=min_new_results,
+            exclude_urls=exclude_urls,
+            page_wave=page_wave,
+        )
+        return response.results, response.requests_made
 
-        requests_made = 1
+    async def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        *,
+        max_pages: int = 1,
+        min_new_results: int | None = None,
+        exclude_urls: Collection[str] = (),
+        page_wave: int = 2,
+    ) -> SearchResponse:
+        """
+        Performs a Google search and returns organic results plus SERP features
+        (featured snippet, knowledge panel, people also ask, top stories).
+
+        Up to `max_pages` SERP pages are fetched: page 1 first, then the following pages
+        concurrently in waves of `page_wave`. Once `min_new_results` (default: `max_results`)
+        URLs outside `exclude_urls` have been collected, no further wave is requested, so the
+        early stop saves billed requests while a wave costs one round trip. Excluded results are
+        still returned (so the caller can report them) but do not count towards `max_results`.
+        URLs are compared in canonical form, so variants of one document (http/https, `www.`,
+        tracking parameters, AMP, ...) are returned once.
+        Pages served from the SERP cache do not count in `requests_made`.
+        """
+        target_new = min_new_results or max_results
+        exclude_urls = {canonicalize_url(u) for u in exclude_urls}
+        pages: Dict[int, List[Dict]] = {}
+        features: Dict[int, List[Dict]] = {}
+        errors: Dict[int, BaseException] = {}
+        new_urls: set[str] = set()
+        requests_made = 0
+
+        wave = [1]
+        while wave:
+            results = await asyncio.gather(
+                *(self._fetch_serp_page(query, page_number) for page_number in wave), return_exceptions=True
+            )
+            exhausted = False
+            for page_number, serp_page in zip(wave, results):
+                if isinstance(serp_page, BaseException):
+                    if not isinstance(serp_page, Exception):
+                        raise serp_page
+                    errors[page_number] = serp_page
+                    logger.warning("SERP page %s failed for %r: %s", page_number, query, serp_page)
+                    continue
+                pages[page_number] = serp_page.organic
+                features[page_number] = serp_page.features
+                requests_made += serp_page.requests_made
+                new_urls.update(self._new_urls(serp_page.organic, exclude_urls))
+                # An empty page means Google has no more results for the query.
+                exhausted = exhausted or not serp_page.organic
+            if len(new_urls) >= target_new or exhausted:
+                break
+            first = wave[-1] + 1
+            wave = list(range(first, min(first + page_wave, max_pages + 1)))
+
+        skipped = max_pages - len(pages) - len(errors)
+        if skipped:
+            metrics.incr("serp.pages_skipped", skipped)
+            logger.info("Early stop for %r: %s SERP page request(s) skipped", query, skipped)
+
+        if not pages and errors:
+            raise errors[min(errors)]
 
         collected_results: List[Dict] = []
-        for page in search_data.results:
-            collected_results.extend(page.content['results']['organic'])
+        collected_urls: Dict[str, str] = {}
+        new_count = 0
+        for page_number in sorted(pages):
+            for item in pages[page_number]:
+                url = (item.get("url") or "").strip()
+                if not url:
+                    continue
+                canonical = canonicalize_url(url)
+                if canonical in collected_urls:
+                    if collected_urls[canonical] != url:
+                        metrics.incr("urls.canonical_duplicates")
+                    continue
+                if canonical not in exclude_urls:
+                    if new_count >= max_results:
+                        break
+                    new_count += 1
+                collected_urls[canonical] = url
+                collected_results.append(item)
+
+        return SearchResponse(
+            results=collected_results,
+            features=merge_features(*(features[page_number] for page_number in sorted(features))),
+            requests_made=requests_made,
+        )
+
+    @staticmethod
+    def _new_urls(organic: List[Dict], exclude_urls: Collection[str]) -> set[str]:
+        urls = {canonicalize_url(item.get("url") or "") for item in organic}
+        return {url for url in urls if url and url not in exclude_urls}
+
+    async def _fetch_serp_page(self, query: str, page: int) -> _SerpPage:
+        """Return the organic results and SERP features of one SERP page.
+
+        Concurrent requests for the same normalized query and page share one fetch.
+        """
+
+        key = (normalize_query(query), page)
+        return await self._search_flights.do(key, lambda: self._fetch_serp_page_uncoalesced(query, page))
 
-        return collected_results[:max_results], requests_made
+    async def _fetch_serp_page_uncoalesced(self, query: str, page: int) -> _SerpPage:
+        if self._serp_cache is not None:
+            cached = await self._serp_cache.get(query, page)
+            if cached is not None:
+                return _SerpPage(organic=cached["organic"], features=cached["features"], requests_made=0)
 
-    async def download_url_bytes(self, url: str, use_render: bool = True, timeout: int = 10) -> bytes:
-        """Download raw bytes for a URL."""
+        async def fetch() -> Dict[str, Any]:
+            async with self._scheduler.slot(request_class="serp"):
+                return await self._client.query(
+                    {"source": "google_search", "query": query, "start_page": page, "pages": 1, "parse": True}
+                )
+
+        search_data = await self._search_retry.run(fetch)
+
+        organic: List[Dict] = []
+        features: List[Dict] = []
+        for result_page in search_data.get("results") or []:
+            parsed = self._extract_parsed_results(result_page)
+            organic.extend(parsed.get("organic") or [])
+            features.extend(extract_serp_features(parsed))
+
+        if self._serp_cache is not None and organic:
+            await self._serp_cache.set(query, page, organic, features)
+        return _SerpPage(organic=organic, features=features, requests_made=1)
+
+    @staticmethod
+    def _extract_parsed_results(page: Dict[str, Any]) -> Dict[str, Any]:
+        content = page.get("content") or {}
+        if not isinstance(content, dict):
+            return {}
+        results = content.get("results") or {}
+        return results if isinstance(results, dict) else {}
+
+    async def download_url_bytes(
+        self, url: str, use_render: bool | None = None, timeout: float | None = None
+    ) -> bytes | memoryview:
+        """Download raw bytes for a URL (see `download_url`)."""
+
+        result = await self.download_url(url, use_render=use_render, timeout=timeout)
+        return result.content
+
+    async def download_url(
+        self, url: str, use_render: bool | None = None, timeout: float | None = None
+    ) -> DownloadResult:
+        """Download a URL, capped at the configured maximum document size.
+
+        `use_render=None` follows the configured render mode. In adaptive mode a plain fetch
+        is tried first and escalated to a JS-rendered fetch only when it returned a page with
+        too little text; a failed plain fetch is returned as is.
+        Failures are logged and reported as an empty result. While the circuit breaker
+        of the URL's domain is open, the download fails fast.
+        """
 
         if not url:
             raise ValueError("url is required")
 
-        client = AsyncClient(self._username, self._password)
-        
-        scrape_params = {
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return await self._download_any(url, use_render=use_render, timeout=timeout)
+
+        if not breaker.allow(url):
+            logger.info("Skipping %s: circuit open for its domain", url)
+            return DownloadResult(url=url, content=b"", error=CIRCUIT_OPEN)
+
+        started = time.monotonic()
+        recorded = False
+        try:
+            result = await self._download_any(url, use_render=use_render, timeout=timeout)
+            recorded = True
+            await breaker.record(url, ok=bool(result.content), latency=time.monotonic() - started)
+            return result
+        finally:
+            if not recorded:
+                breaker.release(url)
+
+    async def _download_any(
+        self, url: str, *, use_render: bool | None, timeout: float | None
+    ) -> DownloadResult:
+        if use_render is None:
+            mode = self._download_settings.render_mode
+            if mode == "adaptive":
+                return await self._download_adaptive(url, timeout=timeout)
+            use_render = mode == "always"
+
+        return await self._download(url, use_render=use_render, timeout=timeout)
+
+    async def _download_adaptive(self, url: str, *, timeout: float | None) -> DownloadResult:
+        if self._render_policy.needs_render(url):
+            metrics.incr("render.known_domain")
+            return await self._download(url, use_render=True, timeout=timeout)
+
+        plain = await self._download(url, use_render=False, timeout=timeout)
+        if not plain.content:
+            # A failed fetch (timeout, 5xx, ...) says nothing about whether the domain needs JS.
+            metrics.incr("render.plain_failed")
+            return plain
+        if await asyncio.to_thread(self._render_policy.is_sufficient, plain.content):
+            metrics.incr("render.plain_sufficient")
+            return plain
+
+        logger.info("Plain fetch insufficient for %s, escalating to rendered fetch", url)
+        metrics.incr("render.escalated")
+        self._render_policy.mark_needs_render(url)
+        rendered = await self._download(url, use_render=True, timeout=timeout)
+        return rendered if rendered.content else plain
+
+    async def _download(self, url: str, *, use_render: bool, timeout: float | None) -> DownloadResult:
+        """Download one URL in a fixed render mode; identical in-flight downloads are coalesced."""
+
+        key = (get_url_key(url), use_render)
+        result = await self._download_flights.do(
+            key, lambda: self._download_uncoalesced(url, use_render=use_render, timeout=timeout)
+        )
+        return result if result.url == url else replace(result, url=url)
+
+    async def _download_uncoalesced(self, url: str, *, use_render: bool, timeout: float | None) -> DownloadResult:
+        """Download one URL in a fixed render mode, going through the download cache.
+
+        Cache hits are returned as a read-only memoryview over the memory-mapped blob.
+        Stale cache entries are revalidated with their ETag/Last-Modified validators.
+        """
+
+        render = "html" if use_render else "none"
+        cached = await self._download_cache.get(url, render) if self._download_cache else None
+        if cached is not None and cached.is_fresh(self._download_cache.fresh_seconds):
+            logger.info("Download cache hit %s (render=%s)", url, render)
+            return DownloadResult.from_cached(url, cached, rendered=use_render)
+
+        try:
+            page = await self._scrape(
+                url,
+                use_render=use_render,
+                timeout=timeout,
+                headers=cached.validators if cached is not None else None,
+            )
+        except Exception as e:
+            if cached is not None:
+                logger.warning("Revalidation failed for %s, serving stale copy: %s", url, e)
+                return DownloadResult.from_cached(url, cached, rendered=use_render)
+            logger.error("Failed to download %s: %s", url, e)
+            return DownloadResult(url=url, content=b"", rendered=use_render, error=str(e) or type(e).__name__)
+
+        if cached is not None and page.status_code == 304:
+            logger.info("Download cache revalidated %s (render=%s)", url, render)
+            await self._download_cache.mark_revalidated(url, render)
+            return DownloadResult.from_cached(url, cached, rendered=use_render)
+
+        if not page.content:
+            if cached is not None:
+                return DownloadResult.from_cached(url, cached, rendered=use_render)
+            return DownloadResult(url=url, content=b"", rendered=use_render)
+
+        if self._download_cache is not None:
+            await self._download_cache.put(
+                url,
+                render,
+                page.content,
+                etag=page.headers.get("etag"),
+                last_modified=page.headers.get("last-modified"),
+                truncated=page.truncated,
+            )
+        return DownloadResult(url=url, content=page.content, truncated=page.truncated, rendered=use_render)
+
+    async def _scrape(
+        self,
+        url: str,
+        *,
+        use_render: bool,
+        timeout: float | None,
+        headers: Dict[str, str] | None = None,
+    ) -> _ScrapedPage:
+        scrape_params: Dict[str, Any] = {
+            "source": "universal",
             "url": url,
             "content_encoding": "base64",
             "parse": False,
-            "request_timeout": timeout,
         }
         if use_render:
             scrape_params["render"] = "html"
+        if headers:
+            scrape_params["context"] = [
+                {"key": "force_headers", "value": True},
+                {"key": "headers", "value": headers},
+            ]
+
+        max_bytes = self._download_settings.max_document_bytes
 
+        async def fetch() -> _ScrapedPage:
+            async with self._scheduler.slot(url, request_class="rendered" if use_render else "plain"):
+                body, truncated = await self._client.query_raw(
+                    scrape_params,
+                    max_bytes=_max_response_bytes(max_bytes),
+                    timeout=timeout,
+                )
+            page = _decode_scrape_body(body, truncated=truncated)
+            if not page.content and page.status_code in RETRYABLE_STATUS_CODES:
+                raise RetryableStatusError(page.status_code)
+            return page
+
+        # Each hedged attempt takes its own scheduler slot, so hedging never bypasses the limits.
         try:
-            result = await client.universal.scrape_url(**scrape_params)
+            page = await self._download_retry.run(lambda: self._download_hedge.run(fetch))
+        except RetryableStatusError as e:
+            logger.warning("Giving up on %s after retries: upstream status %s", url, e.status_code)
+            return _ScrapedPage(content=b"", status_code=e.status_code, headers={})
 
-            raw = getattr(result, "raw", None)
-            if raw is None:
-                raw = result
+        if len(page.content) > max_bytes:
+            page.content = page.content[:max_bytes]
+            page.truncated = True
 
-            if isinstance(raw, dict):
-                data = raw
-            elif isinstance(raw, (str, bytes, bytearray)):
-                data = json.loads(raw)
-            else:
-                data = json.loads(str(raw))
+        if page.truncated:
+            metrics.incr("downloads.oversized")
+            if self._download_settings.oversize_policy == "abort":
+                logger.warning("Aborted download of %s: larger than %s bytes", url, max_bytes)
+                return _ScrapedPage(content=b"", status_code=page.status_code, headers={})
+            logger.warning("Truncated download of %s to %s bytes", url, len(page.content))
 
-            results = data.get("results") or []
-            if not results:
-                return b""
+        return page
 
-            content_base64 = results[0].get("content")
-            if not content_base64:
-                return b""
 
-            return base64.b64decode(content_base64)
-        except Exception as e:
-            logger.error("Failed to download %s: %s", url, e)
-            return b""
+def _max_response_bytes(max_document_bytes: int) -> int:
+    """Raw response budget: base64 inflates content by 4/3, plus room for the JSON envelope."""
+    return -(-max_document_bytes // 3) * 4 + _RESPONSE_ENVELOPE_BYTES
+
+
+def _b64decode_prefix(encoded: bytes | memoryview) -> bytes:
+    """Decode the longest complete base64 prefix (a truncated body may end mid-quantum)."""
+    return base64.b64decode(encoded[: len(encoded) - len(encoded) % 4])
+
+
+def _scan_content(body: bytearray) -> Tuple[bytes, bytearray, bool]:
+    """Decode the first `"content":` string after `"results"` in place of parsing it as JSON.
+
+    Returns (content, envelope with that value replaced by "", whether a value was found).
+    """
+
+    anchor = body.find(_RESULTS_MARKER)
+    marker = body.find(_CONTENT_MARKER, anchor) if anchor != -1 else -1
+    if marker == -1:
+        return b"", body, False
+
+    start = marker + len(_CONTENT_MARKER)
+    while start < len(body) and body[start] in b" \t\r\n":
+        start += 1
+    if start >= len(body) or body[start] != ord('"'):
+        return b"", body, False
+
+    end = body.find(b'"', start + 1)
+    stop = end if end != -1 else len(body)
+    if body.find(b"\\", start + 1, stop) != -1:
+        # Escaped solidus (\/) is valid JSON but not valid base64.
+        content = _b64decode_prefix(bytes(body[start + 1 : stop]).replace(b"\\/", b"/"))
+    else:
+        with memoryview(body) as view:
+            content = _b64decode_prefix(view[start + 1 : stop])
+    envelope = body[:start] + b'""' + body[end + 1 :] if end != -1 else bytearray()
+    return content, envelope, True
+
+
+def _decode_scrape_body(body: bytearray, *, truncated: bool) -> _ScrapedPage:
+    """Decode an Oxylabs universal scrape response without materializing the base64 as `str`.
+
+    The base64 `results[0].content` value is decoded straight from the response buffer; only
+    the small remainder of the JSON envelope goes through `json.loads`. If the scanned value
+    turns out not to be `results[0].content`, the whole body is parsed the ordinary way.
+    A truncated body yields the decodable prefix of the content and no status/headers.
+    """
+
+    try:
+        content, envelope, scanned = _scan_content(body)
+    except binascii.Error:
+        content, envelope, scanned = b"", body, False
+
+    if truncated or not envelope:
+        return _ScrapedPage(content=content, status_code=None, headers={}, truncated=truncated)
+
+    data = _loads_or_none(envelope) if scanned else None
+    if data is None or not _scanned_first_result(data):
+        if scanned:
+            logger.debug("Scanned content value was not results[0].content; parsing the full body")
+        data = json.loads(body)
+        content, scanned = b"", False
+
+    results = data.get("results") or []
+    if not results:
+        return _ScrapedPage(content=b"", status_code=None, headers={})
+
+    result = results[0]
+    if not scanned and result.get("content"):
+        content = base64.b64decode(result["content"])
+    response_headers = {str(k).lower(): str(v) for k, v in (result.get("headers") or {}).items()}
+    return _ScrapedPage(content=content, status_code=result.get("status_code"), headers=response_headers)
+
+
+def _loads_or_none(envelope: bytearray) -> Dict[str, Any] | None:
+    try:
+        data = json.loads(envelope)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _scanned_first_result(data: Dict[str, Any]) -> bool:
+    """True when the value blanked out by `_scan_content` was `results[0].content`."""
+    results = data.get("results")
+    return bool(results) and isinstance(results[0], dict) and results[0].get("content") == ""
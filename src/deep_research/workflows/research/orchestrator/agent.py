@@ -7,6 +7,7 @@ from llama_index.llms.google_genai import GoogleGenAI
 
 from deep_research.workflows.research.orchestrator.customs import OrchestratorAgent
 from deep_research.workflows.research.orchestrator.tools import call_research_agent, call_write_agent
+from deep_research.workflows.research.searcher.agent import close_web_search_service
 from deep_research.workflows.research.state import ResearchStateAccessor
 from deep_research.workflows.research.orchestrator.prompts import build_orchestrator_system_prompt
 
@@ -63,10 +64,14 @@ class OrchestratorWorkflow(Workflow):
 
         handler = agent.run(user_msg="Start the research", ctx=agent_ctx)
 
-        async for event in handler.stream_events():
-            ctx.write_event_to_stream(event)
+        try:
+            async for event in handler.stream_events():
+                ctx.write_event_to_stream(event)
 
-        result = await handler
+            result = await handler
+        finally:
+            # The pooled Oxylabs connections belong to this run's event loop; the service reopens them lazily.
+            await close_web_search_service()
 
         final_inner_state = await ResearchStateAccessor.get(agent_ctx)
         async with ctx.store.edit_state() as store:
@@ -1,21 +1,26 @@
 from workflows import Context
 
 from deep_research.workflows.research.state import ResearchStateAccessor
-from deep_research.workflows.research.searcher.agent import build_searcher_agent
+from deep_research.workflows.research.searcher.agent import build_evidence_service, build_searcher_agent
 from deep_research.workflows.research.writer.agent import build_writer_agent
 
 
 async def call_research_agent(ctx: Context, prompt: str) -> str:
     print(f"Orchestrator -> SearcherAgent: {prompt}")
 
-    searcher_agent = build_searcher_agent()
+    evidence_service = build_evidence_service()
+    searcher_agent = build_searcher_agent(evidence_service)
     searcher_ctx = Context(searcher_agent)
 
     orchestrator_state = await ResearchStateAccessor.get(ctx)
     async with ResearchStateAccessor.edit(searcher_ctx) as searcher_state:
         searcher_state.research_turn = orchestrator_state.research_turn.model_copy(deep=True)
 
-    await searcher_agent.run(user_msg=prompt, ctx=searcher_ctx)
+    try:
+        await searcher_agent.run(user_msg=prompt, ctx=searcher_ctx)
+    finally:
+        # finalize_research collects what finished; nothing may keep running once the searcher is gone.
+        evidence_service.cancel_stragglers()
 
     searcher_state = await ResearchStateAccessor.get(searcher_ctx)
 
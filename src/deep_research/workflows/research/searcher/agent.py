@@ -1,13 +1,22 @@
+from functools import cache
+
 from llama_index.core.agent.workflow import FunctionAgent
 from llama_index.core.tools import FunctionTool
 from llama_index.llms.google_genai import GoogleGenAI
 
 from deep_research.config import ResearchConfig
+from deep_research.services.circuit_breaker import DomainCircuitBreaker
 from deep_research.services.content_analysis_service import ContentAnalysisService
+from deep_research.services.content_precheck import ContentPrecheck
+from deep_research.services.download_cache import DownloadCache
 from deep_research.services.evidence_service import EvidenceService
 from deep_research.services.file_service import FileService
+from deep_research.services.negative_cache import NegativeCache
+from deep_research.services.oxylabs_client import OxylabsClient
+from deep_research.services.prefetcher import SpeculativePrefetcher
 from deep_research.services.query_service import QueryService
-from deep_research.services.trafilatura_document_parser_service import TrafilaturaDocumentParserService
+from deep_research.services.routing_document_parser_service import RoutingDocumentParserService
+from deep_research.services.serp_cache import SerpCache
 from deep_research.services.web_search_service import WebSearchService
 from deep_research.utils import load_config_from_json
 from deep_research.workflows.research.searcher.prompts import build_research_system_prompt
@@ -22,7 +31,80 @@ cfg = load_config_from_json(
 )
 
 
-def build_searcher_agent() -> FunctionAgent:
+@cache
+def get_web_search_service() -> WebSearchService:
+    """Process-wide WebSearchService, so all searcher agents share one pooled Oxylabs client."""
+    settings = cfg.settings
+    client = OxylabsClient.from_env(settings=settings.oxylabs)
+    serp_cache = SerpCache.from_settings(settings.serp_cache) if settings.serp_cache.enabled else None
+    download_cache = DownloadCache.from_settings(settings.download_cache) if settings.download_cache.enabled else None
+    circuit_breaker = (
+        DomainCircuitBreaker.from_settings(settings.circuit_breaker) if settings.circuit_breaker.enabled else None
+    )
+    return WebSearchService(
+        client=client,
+        serp_cache=serp_cache,
+        download_cache=download_cache,
+        download_settings=settings.downloads,
+        circuit_breaker=circuit_breaker,
+    )
+
+
+@cache
+def get_document_parser_service() -> RoutingDocumentParserService:
+    """Process-wide parser, so all searcher agents share one warm extraction pool."""
+    settings = cfg.settings.parser
+    return RoutingDocumentParserService.from_settings(
+        settings,
+        file_service=FileService() if settings.llamaparse_enabled else None,
+    )
+
+
+@cache
+def get_negative_cache() -> NegativeCache | None:
+    """Process-wide cache of recently failed URLs, shared by web_search and generate_evidence."""
+    settings = cfg.settings.negative_cache
+    return NegativeCache.from_settings(settings) if settings.enabled else None
+
+
+async def close_web_search_service() -> None:
+    """Close the shared WebSearchService connections, if it was ever created."""
+    if get_web_search_service.cache_info().currsize:
+        await get_web_search_service().aclose()
+
+
+def build_evidence_service() -> EvidenceService:
+    """A new EvidenceService for one research turn; its background work ends with the turn."""
+    web_search_service = get_web_search_service()
+    document_parser_service = get_document_parser_service()
+    precheck_settings = cfg.settings.content_precheck
+    content_precheck = ContentPrecheck.from_settings(precheck_settings) if precheck_settings.enabled else None
+    prefetcher = (
+        SpeculativePrefetcher.from_settings(
+            cfg.settings.prefetch,
+            web_search_service=web_search_service,
+            document_parser_service=document_parser_service,
+            content_precheck=content_precheck,
+        )
+        if cfg.settings.prefetch.enabled
+        else None
+    )
+
+    return EvidenceService(
+        content_analysis_service=ContentAnalysisService(llm_config=cfg.searcher.weak_llm),
+        document_parser_service=document_parser_service,
+        file_service=FileService(),
+        web_search_service=web_search_service,
+        content_precheck=content_precheck,
+        negative_cache=get_negative_cache(),
+        prefetcher=prefetcher,
+        batch_settings=cfg.settings.evidence_batch,
+        pipeline_settings=cfg.settings.evidence_pipeline,
+    )
+
+
+def build_searcher_agent(evidence_service: EvidenceService | None = None) -> FunctionAgent:
+    """Pass `evidence_service` to end its background work (`cancel_stragglers`) when the run is over."""
     searcher_cfg = cfg.searcher
 
     llm = GoogleGenAI(
@@ -31,25 +113,16 @@ def build_searcher_agent() -> FunctionAgent:
         reasoning={"thinking_level": "MEDIUM"},
     )
 
-    web_search_service = WebSearchService()
-    file_service = FileService()
-    document_parser_service = TrafilaturaDocumentParserService()
-
     query_service = QueryService(llm_config=searcher_cfg.main_llm)
-    content_analysis_service = ContentAnalysisService(llm_config=searcher_cfg.weak_llm)
-
-    evidence_service = EvidenceService(
-        content_analysis_service=content_analysis_service,
-        document_parser_service=document_parser_service,
-        file_service=file_service,
-        web_search_service=web_search_service,
-    )
+    evidence_service = evidence_service or build_evidence_service()
 
     tools_spec = SearcherTools(
         config=cfg,
-        web_search_service=web_search_service,
+        web_search_service=evidence_service.web_search_service,
         query_service=query_service,
         evidence_service=evidence_service,
+        negative_cache=evidence_service.negative_cache,
+        prefetcher=evidence_service.prefetcher,
     )
     tools = tools_spec.to_tool_list()
 
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from deep_research.services.models import ParsedDocumentAsset
-from typing import Any
+from typing import Any, Literal
 
 
 class EvidenceItem(BaseModel):
@@ -13,6 +13,10 @@ class EvidenceItem(BaseModel):
     )
     content: str = Field(default="", description="Full raw text content of the source.")
     assets: list[ParsedDocumentAsset] = Field(default_factory=list, description="Selected rich assets (images, tables) from the source.")
+    source_type: Literal["document", "serp"] = Field(
+        default="document",
+        description="'serp' items come straight from search result features (snippets, panels) and were never downloaded.",
+    )
 
 
 class EvidenceBundle(BaseModel):
@@ -27,7 +31,8 @@ class EvidenceBundle(BaseModel):
         lines = [f"Gathered {len(self.items)} evidence items:"]
         for i, item in enumerate(self.items, 1):
             title = item.title if item.title else item.url
-            lines.append(f"{i}. [{title}]({item.url})")
+            published = item.metadata.get("published_date")
+            lines.append(f"{i}. [{title}]({item.url})" + (f" (published {published})" if published else ""))
             lines.append(f"   Summary: {item.summary}")
         return "\n".join(lines)
 
@@ -40,6 +45,8 @@ class EvidenceBundle(BaseModel):
         for item in self.items:
             title = item.title if item.title else item.url
             header = f"### Source: [{title}]({item.url})"
+            if item.source_type == "serp":
+                header += " (search result snippet)"
 
             meta_section = ""
             if item.metadata:
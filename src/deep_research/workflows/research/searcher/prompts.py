@@ -19,6 +19,7 @@ How to use the tools:
   Call web_search for each query. You can make multiple calls in parallel.
   Copy/paste it into web_search. Do not reword it.
   You MUST execute the search even if the query seems unlikely to yield results.
+  web_search may also add short answers from the results page (featured snippets, knowledge panels, "people also ask") straight to the evidence. For simple factual questions these can be enough; you do not need to read the page again.
 
 - After web_search, read sources.
   Pick URLs from the web_search outputs and call generate_evidences. Don’t keep searching without processing sources.
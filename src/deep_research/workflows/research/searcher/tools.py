@@ -7,9 +7,16 @@ from pydantic import Field
 
 from deep_research.config import ResearchConfig
 from deep_research.services.evidence_service import EvidenceService
+from deep_research.services.metrics import metrics
+from deep_research.services.negative_cache import NegativeCache
+from deep_research.services.prefetcher import SpeculativePrefetcher
 from deep_research.services.query_service import QueryService
+from deep_research.services.serp_features import serp_features_to_evidence
+from deep_research.services.serp_reranker import SerpReranker
 from deep_research.services.web_search_service import WebSearchService
 from deep_research.services.token_counting_service import TokenCountingService
+from deep_research.services.url_utils import canonicalize_url
+from deep_research.workflows.research.searcher.models import EvidenceItem
 from deep_research.workflows.research.state import ResearchStateAccessor
 
 logger = logging.getLogger(__name__)
@@ -29,11 +36,19 @@ class SearcherTools(BaseToolSpec):
         web_search_service: WebSearchService,
         query_service: QueryService,
         evidence_service: EvidenceService,
+        negative_cache: NegativeCache | None = None,
+        prefetcher: SpeculativePrefetcher | None = None,
     ):
         self.config = config
         self.web_search_service = web_search_service
         self.query_service = query_service
         self.evidence_service = evidence_service
+        self.negative_cache = negative_cache
+        self.prefetcher = prefetcher
+        self.reranker = SerpReranker(
+            domain_priors=config.searcher.rerank.domain_priors,
+            position_weight=config.searcher.rerank.position_weight,
+        )
 
     async def plan_search_queries(
         self,
@@ -65,8 +80,8 @@ class SearcherTools(BaseToolSpec):
         Performs a web search and returns a list of 10 results.
         """
         state = await ResearchStateAccessor.get(ctx)
-        seen_urls = set(map(str, state.research_turn.seen_urls))
-        failed_urls = set(map(str, state.research_turn.failed_urls))
+        seen_urls = {canonicalize_url(str(u)) for u in state.research_turn.seen_urls}
+        failed_urls = {canonicalize_url(str(u)) for u in state.research_turn.failed_urls}
         no_new_results_count = int(getattr(state.research_turn, "no_new_results_count", 0))
 
         if no_new_results_count >= 3:
@@ -79,30 +94,66 @@ class SearcherTools(BaseToolSpec):
             )
 
         try:
-            search_data, _requests_made = await self.web_search_service.search_google(
+            searcher_cfg = self.config.searcher
+            response = await self.web_search_service.search(
                 query=query,
-                max_results=self.config.searcher.max_results_per_query,
+                max_results=searcher_cfg.max_results_per_query,
+                max_pages=searcher_cfg.max_serp_pages,
+                min_new_results=searcher_cfg.serp_min_new_results,
+                page_wave=searcher_cfg.serp_page_wave,
+                exclude_urls=seen_urls | failed_urls,
             )
         except BaseException as e:
             async with ResearchStateAccessor.edit(ctx) as edit_state:
                 edit_state.research_turn.no_new_results_count += 1
             return f"TOOL_ERROR\nweb_search failed: {e}"
 
+        search_data = response.results
+        serp_note = ""
+        if searcher_cfg.serp_features_as_evidence and response.features:
+            serp_items = await self._add_serp_evidence(ctx, query=query, features=response.features)
+            serp_note = self._format_serp_evidence(serp_items)
+
         if not search_data:
             async with ResearchStateAccessor.edit(ctx) as edit_state:
                 edit_state.research_turn.no_new_results_count += 1
-            return "No results found for this query."
+            return "No results found for this query." + serp_note
+
+        known_bad: dict[str, str] = {}
+        if self.negative_cache is not None:
+            known_bad = await self.negative_cache.get_many(
+                (item.get("url") or "").strip() for item in search_data if item.get("url")
+            )
 
         new_results: list[dict] = []
         ignored_count = 0
         for item in search_data:
-            if not (url := item.get("url").strip()):
+            if not (url := (item.get("url") or "").strip()):
                 continue
-            if url in seen_urls or url in failed_urls:
+            canonical = canonicalize_url(url)
+            if url in known_bad:
+                ignored_count += 1
+                continue
+            if canonical in seen_urls or canonical in failed_urls:
+                # seen/failed URLs are stored canonicalized: only a different raw form is a variant.
+                if url != canonical:
+                    metrics.incr("urls.canonical_duplicates")
                 ignored_count += 1
                 continue
             new_results.append(item)
 
+        # Rerank locally and show only the best results; hidden ones stay unseen and may come back later.
+        rerank_cfg = searcher_cfg.rerank
+        scores: list[float] | None = None
+        hidden_count = 0
+        if rerank_cfg.enabled and new_results:
+            ranked = self.reranker.rerank(query, new_results)
+            shown = ranked[: rerank_cfg.top_k] if rerank_cfg.top_k else ranked
+            hidden_count = len(new_results) - len(shown)
+            new_results = [r.item for r in shown]
+            if rerank_cfg.show_scores:
+                scores = [r.score for r in shown]
+
         if new_results:
             async with ResearchStateAccessor.edit(ctx) as state:
                 state.research_turn.add_seen_urls([r["url"] for r in new_results])
@@ -120,14 +171,51 @@ class SearcherTools(BaseToolSpec):
             return self._format_no_new_results_message(
                 seen_urls=seen_count,
                 failed_urls=len(failed_urls),
-            )
+            ) + serp_note
 
         async with ResearchStateAccessor.edit(ctx) as edit_state:
             edit_state.research_turn.no_new_results_count = 0
 
+        if self.prefetcher is not None:
+            self.prefetcher.schedule(r["url"] for r in new_results)
+
         return self._format_search_results(
             results=new_results,
             ignored_count=ignored_count,
+            scores=scores,
+            hidden_count=hidden_count,
+        ) + serp_note
+
+    async def _add_serp_evidence(self, ctx: Context, *, query: str, features: list[dict]) -> list[EvidenceItem]:
+        """Add SERP features as evidence items, skipping duplicates and respecting the token budget."""
+        candidates = serp_features_to_evidence(query, features)
+        added: list[EvidenceItem] = []
+        async with ResearchStateAccessor.edit(ctx) as state:
+            pending = state.research_turn.evidence.items
+            known = {(i.url, i.content) for i in pending}
+            total_tokens = TokenCountingService.count_tokens("\n\n".join(i.content or "" for i in pending))
+            for item in candidates:
+                if (item.url, item.content) in known:
+                    continue
+                tokens = TokenCountingService.count_tokens(item.content)
+                if total_tokens + tokens > self.config.settings.max_pending_evidence_tokens:
+                    break
+                known.add((item.url, item.content))
+                total_tokens += tokens
+                added.append(item)
+            state.research_turn.add_evidence_items(added)
+        if added:
+            metrics.incr("serp.feature_evidence", len(added))
+        return added
+
+    @staticmethod
+    def _format_serp_evidence(items: list[EvidenceItem]) -> str:
+        if not items:
+            return ""
+        lines = [f"- [{i.metadata.get('serp_feature')}] {i.content} ({i.url})" for i in items]
+        return (
+            "\n\nAnswers taken directly from the results page (already added as evidence, "
+            "no need to read these URLs for this fact):\n" + "\n".join(lines)
         )
 
     @staticmethod
@@ -149,15 +237,22 @@ class SearcherTools(BaseToolSpec):
         )
 
     @staticmethod
-    def _format_search_results(*, results: list[dict], ignored_count: int) -> str:
+    def _format_search_results(
+        *,
+        results: list[dict],
+        ignored_count: int,
+        scores: list[float] | None = None,
+        hidden_count: int = 0,
+    ) -> str:
         formatted_results: list[str] = []
         for idx, item in enumerate(results, 1):
             title = (item.get("title") or "").strip()
             url = (item.get("url") or "").strip()
             snippet = (item.get("desc") or item.get("snippet") or "").strip()
+            score = f" (Score: {scores[idx - 1]:.2f})" if scores else ""
 
             formatted_results.append(
-                f"[{idx}] Title: {title}\n"
+                f"[{idx}] Title: {title}{score}\n"
                 f"    URL: {url}\n"
                 f"    Snippet: {snippet}"
             )
@@ -167,6 +262,11 @@ class SearcherTools(BaseToolSpec):
                 f"(Ignored {ignored_count} already seen/failed results)"
             )
 
+        if hidden_count:
+            formatted_results.append(
+                f"(Hid {hidden_count} lower-ranked or duplicate results)"
+            )
+
         return "\n\n".join(formatted_results)
 
     async def generate_evidences(
@@ -214,8 +314,17 @@ class SearcherTools(BaseToolSpec):
 
             all_summaries.append(f"--- Analysis for {item.url} ---\n{summary_text}")
 
+        pending_urls = self.evidence_service.pending_urls
+        pending_note = ""
+        if pending_urls:
+            pending_note = (
+                "\n\n[PENDING] Still reading these URLs; what finishes is added with your next "
+                "generate_evidences or finalize_research call, the rest is dropped at finalize_research:\n"
+                + "\n".join(f"- {url}" for url in pending_urls)
+            )
+
         if not all_summaries:
-            return "No content could be analyzed from the provided URLs."
+            return "No content could be analyzed from the provided URLs." + pending_note
 
         msg = "\n\n".join(all_summaries)
         if budget_exhausted:
@@ -223,12 +332,24 @@ class SearcherTools(BaseToolSpec):
                 "\n\n[NOTE] Reached the configured max pending evidence token budget for this turn. "
                 "Additional sources were not added."
             )
-        return msg
+        return msg + pending_note
 
     # in order to return direct, it doesn't go in spec_functions
-    @staticmethod
-    async def finalize_research(ctx: Context) -> str:
+    async def finalize_research(self, ctx: Context) -> str:
         state = await ResearchStateAccessor.get(ctx)
+        existing_total_tokens = TokenCountingService.count_tokens(
+            "\n\n".join([(i.content or "") for i in state.research_turn.evidence.items])
+        )
+        # Background reads that finished are kept; the rest must not outlive the research turn.
+        new_items, failures, _ = await self.evidence_service.collect_stragglers(
+            max_total_tokens=self.config.settings.max_pending_evidence_tokens,
+            existing_total_tokens=existing_total_tokens,
+        )
+        async with ResearchStateAccessor.edit(ctx) as state:
+            state.research_turn.add_failed_urls(list(failures))
+            state.research_turn.add_seen_urls([i.url for i in new_items] + list(failures))
+            state.research_turn.add_evidence_items(new_items)
+
         items = state.research_turn.evidence.items
 
         total_items = len(items)
@@ -5,6 +5,7 @@ from typing import AsyncIterator
 from pydantic import BaseModel, Field
 from workflows import Context
 
+from deep_research.services.url_utils import canonicalize_url
 from deep_research.workflows.research.searcher.models import EvidenceBundle, EvidenceItem
 
 
@@ -33,13 +34,15 @@ class ResearchTurnState(BaseModel):
         self.no_new_results_count = 0
 
     def add_seen_urls(self, urls: list[str]) -> None:
+        """Record URLs in canonical form (see `canonicalize_url`)."""
         merged = set(self.seen_urls)
-        merged.update(map(str, urls))
+        merged.update(canonicalize_url(str(url)) for url in urls)
         self.seen_urls = sorted(merged)
 
     def add_failed_urls(self, urls: list[str]) -> None:
+        """Record URLs in canonical form (see `canonicalize_url`)."""
         merged = set(self.failed_urls)
-        merged.update(map(str, urls))
+        merged.update(canonicalize_url(str(url)) for url in urls)
         self.failed_urls = sorted(merged)
 
     def add_evidence_items(self, items: list[EvidenceItem]) -> None:
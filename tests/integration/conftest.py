@@ -13,7 +13,8 @@ from llama_index.llms.google_genai import GoogleGenAI
 from deep_research.services.document_parser_service import DocumentParserService
 from deep_research.services.file_service import FileService
 from deep_research.services.models import ParsedDocument
-from deep_research.services.web_search_service import WebSearchService
+from deep_research.services.web_search_service import DownloadResult, SearchResponse, WebSearchService
+from deep_research.workflows.research.searcher import agent as searcher_agent_module
 from deep_research.workflows.research.searcher.agent import build_searcher_agent
 from deep_research.workflows.research.writer.agent import build_writer_agent
 from deep_research.workflows.research.orchestrator.agent import build_orchestrator_agent
@@ -541,9 +542,28 @@ def canned_pages(world_name: str, canned_pages_all: dict[str, bytes], canned_ser
     return pages
 
 
+def _isolate_persistent_caches(monkeypatch: pytest.MonkeyPatch, cache_dir: Path) -> None:
+    """Keep the on-disk caches of this test in `cache_dir`, so failures never leak into other tests or runs."""
+    settings = searcher_agent_module.cfg.settings
+    monkeypatch.setattr(settings.negative_cache, "path", str(cache_dir / "negative_cache.sqlite3"))
+    monkeypatch.setattr(settings.circuit_breaker, "path", str(cache_dir / "circuit_breaker.json"))
+    monkeypatch.setattr(settings.serp_cache, "path", str(cache_dir / "serp_cache.sqlite3"))
+    monkeypatch.setattr(settings.download_cache, "directory", str(cache_dir / "downloads"))
+    # The process-wide services were built from the old paths; rebuild them for this test.
+    searcher_agent_module.get_web_search_service.cache_clear()
+    searcher_agent_module.get_negative_cache.cache_clear()
+
+
 @pytest.fixture
-def mock_external_calls(monkeypatch: pytest.MonkeyPatch, canned_serp: list[dict[str, Any]], canned_pages: dict[str, bytes]):
-    async def _mock_search_google(self: WebSearchService, query: str, max_results: int = 10):
+def mock_external_calls(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    canned_serp: list[dict[str, Any]],
+    canned_pages: dict[str, bytes],
+):
+    _isolate_persistent_caches(monkeypatch, tmp_path / "cache")
+
+    async def _mock_search_google(self: WebSearchService, query: str, max_results: int = 10, **_kwargs):
         query_terms = [t.lower() for t in query.split() if len(t) > 3]
 
         if not query_terms:
@@ -566,9 +586,16 @@ def mock_external_calls(monkeypatch: pytest.MonkeyPatch, canned_serp: list[dict[
 
         return filtered[:max_results], 1
 
-    async def _mock_download_url_bytes(self: WebSearchService, url: str, use_render: bool = True, timeout: int = 10) -> bytes:
+    async def _mock_search(self: WebSearchService, query: str, max_results: int = 10, **_kwargs) -> SearchResponse:
+        results, requests_made = await _mock_search_google(self, query, max_results)
+        return SearchResponse(results=results, features=[], requests_made=requests_made)
+
+    async def _mock_download_url_bytes(self: WebSearchService, url: str, use_render: bool | None = None, timeout: float | None = None) -> bytes:
         return canned_pages.get(url, b"")
 
+    async def _mock_download_url(self: WebSearchService, url: str, use_render: bool | None = None, timeout: float | None = None) -> DownloadResult:
+        return DownloadResult(url=url, content=canned_pages.get(url, b""))
+
     async def _mock_upload_bytes(self: FileService, content: bytes, filename: str) -> str:
         return f"file_{abs(hash((filename, len(content))))}"
 
@@ -603,10 +630,17 @@ def mock_external_calls(monkeypatch: pytest.MonkeyPatch, canned_serp: list[dict[
         return parsed, failed
 
     monkeypatch.setattr(WebSearchService, "search_google", _mock_search_google)
+    monkeypatch.setattr(WebSearchService, "search", _mock_search)
     monkeypatch.setattr(WebSearchService, "download_url_bytes", _mock_download_url_bytes)
+    monkeypatch.setattr(WebSearchService, "download_url", _mock_download_url)
     monkeypatch.setattr(FileService, "upload_bytes", _mock_upload_bytes)
     monkeypatch.setattr(DocumentParserService, "parse_files", _mock_parse_files)
 
+    yield
+
+    searcher_agent_module.get_web_search_service.cache_clear()
+    searcher_agent_module.get_negative_cache.cache_clear()
+
 
 @pytest.fixture
 def judge_llm() -> GoogleGenAI:
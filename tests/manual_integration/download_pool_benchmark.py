@@ -0,0 +1,122 @@
+"""Per-download latency with a pooled Oxylabs client vs a fresh client per download.
+
+Requires OXYLABS_USERNAME / OXYLABS_PASSWORD. Every download is a billed Oxylabs request.
+
+    python tests/manual_integration/download_pool_benchmark.py --rounds 3 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from deep_research.config import DownloadSettings, OxylabsClientSettings
+from deep_research.services.oxylabs_client import OxylabsClient
+from deep_research.services.web_search_service import WebSearchService
+
+DEFAULT_URLS = [
+    "https://en.wikipedia.org/wiki/Solid-state_battery",
+    "https://en.wikipedia.org/wiki/Lithium-ion_battery",
+    "https://en.wikipedia.org/wiki/Thermal_runaway",
+    "https://en.wikipedia.org/wiki/Sodium-ion_battery",
+    "https://en.wikipedia.org/wiki/Energy_density",
+    "https://en.wikipedia.org/wiki/Electric_vehicle_battery",
+    "https://en.wikipedia.org/wiki/Battery_recycling",
+    "https://en.wikipedia.org/wiki/Electrolyte",
+]
+
+
+def _benchmark_settings(concurrency: int, use_render: bool) -> DownloadSettings:
+    """Scheduler settings that leave connection reuse as the only difference between the runs.
+
+    Every default URL is on one domain, so the per-domain limits would throttle the shared
+    scheduler of the pooled run but not the fresh one of each unpooled download.
+    """
+    return DownloadSettings(
+        render_mode="always" if use_render else "never",
+        max_concurrent_downloads=concurrency,
+        adaptive_concurrency=False,
+        max_concurrent_per_domain=concurrency,
+        per_domain_requests_per_second=1_000_000.0,
+        per_domain_burst=concurrency,
+        coalesce_in_flight=False,
+    )
+
+
+async def _timed_download(service: WebSearchService, url: str, *, use_render: bool) -> float:
+    started = time.perf_counter()
+    await service.download_url_bytes(url, use_render=use_render)
+    return time.perf_counter() - started
+
+
+async def _run_pooled(urls: list[str], rounds: int, concurrency: int, use_render: bool) -> list[float]:
+    client = OxylabsClient.from_env(settings=OxylabsClientSettings(max_connections=concurrency))
+    service = WebSearchService(client=client, download_settings=_benchmark_settings(concurrency, use_render))
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _one(url: str) -> None:
+        async with semaphore:
+            latencies.append(await _timed_download(service, url, use_render=use_render))
+
+    try:
+        for _ in range(rounds):
+            await asyncio.gather(*(_one(url) for url in urls))
+    finally:
+        await service.aclose()
+    return latencies
+
+
+async def _run_unpooled(urls: list[str], rounds: int, concurrency: int, use_render: bool) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _one(url: str) -> None:
+        async with semaphore:
+            # Mirrors the old behaviour: a brand-new client (and TLS handshake) per download.
+            service = WebSearchService(
+                client=OxylabsClient.from_env(),
+                download_settings=_benchmark_settings(concurrency, use_render),
+            )
+            try:
+                latencies.append(await _timed_download(service, url, use_render=use_render))
+            finally:
+                await service.aclose()
+
+    for _ in range(rounds):
+        await asyncio.gather(*(_one(url) for url in urls))
+    return latencies
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:<10} n={len(latencies):<4} "
+        f"p50={_percentile(latencies, 50):.3f}s  p95={_percentile(latencies, 95):.3f}s  "
+        f"mean={statistics.fmean(latencies):.3f}s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--render", action="store_true", help="Use JS rendering for every download.")
+    parser.add_argument("urls", nargs="*", default=DEFAULT_URLS)
+    args = parser.parse_args()
+
+    unpooled = await _run_unpooled(args.urls, args.rounds, args.concurrency, args.render)
+    pooled = await _run_pooled(args.urls, args.rounds, args.concurrency, args.render)
+
+    print("\n--- Download latency per URL ---")
+    _report("unpooled", unpooled)
+    _report("pooled", pooled)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
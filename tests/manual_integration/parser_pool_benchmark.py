@@ -0,0 +1,130 @@
+"""Trafilatura extraction throughput and event-loop lag: inline (old behaviour) vs thread vs process pool.
+
+Runs offline. Uses the .html files in --html-dir when given, otherwise a synthetic corpus.
+
+    python tests/manual_integration/parser_pool_benchmark.py --pages 100 --concurrency 4
+    python tests/manual_integration/parser_pool_benchmark.py --html-dir ./pages --modes inline process
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from pathlib import Path
+
+from deep_research.services.extraction_pool import ExtractionPool
+from deep_research.services.trafilatura_document_parser_service import TrafilaturaDocumentParserService
+
+_WORDS = (
+    "battery lithium energy density cell anode cathode electrolyte solid state charge cycle thermal "
+    "vehicle grid storage cost capacity research market safety performance voltage material"
+).split()
+
+
+def _synthetic_page(rng: random.Random, index: int) -> bytes:
+    def sentence() -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 24))).capitalize() + "."
+
+    paragraphs = "\n".join(
+        f"<p>{' '.join(sentence() for _ in range(rng.randint(3, 8)))}</p>" for _ in range(rng.randint(20, 120))
+    )
+    rows = "\n".join(
+        f"<tr><td>{rng.choice(_WORDS)}</td><td>{rng.randint(1, 999)}</td></tr>" for _ in range(rng.randint(0, 30))
+    )
+    nav = "\n".join(f'<li><a href="/p/{i}">{rng.choice(_WORDS)}</a></li>' for i in range(60))
+    return (
+        f"<html><head><title>Page {index}</title></head><body>"
+        f"<nav><ul>{nav}</ul></nav>"
+        f"<article><h1>Report {index}</h1>{paragraphs}<table>{rows}</table></article>"
+        f"<footer>{sentence()}</footer></body></html>"
+    ).encode()
+
+
+def _load_corpus(html_dir: str | None, pages: int) -> list[tuple[str, bytes]]:
+    if html_dir:
+        files = sorted(Path(html_dir).glob("*.htm*"))[:pages]
+        return [(f"file://{f.name}", f.read_bytes()) for f in files]
+    rng = random.Random(42)
+    return [(f"https://example.com/page/{i}", _synthetic_page(rng, i)) for i in range(pages)]
+
+
+async def _measure_lag(stop: asyncio.Event, lags: list[float], interval: float = 0.005) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - started - interval)
+
+
+async def _run(parser: TrafilaturaDocumentParserService, corpus: list[tuple[str, bytes]], concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(url: str, content: bytes) -> int:
+        async with semaphore:
+            parsed, _failed = await parser.parse_files([(None, url, content)])
+            return len(parsed)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    monitor = asyncio.create_task(_measure_lag(stop, lags))
+    started = time.perf_counter()
+    parsed = sum(await asyncio.gather(*(_one(url, content) for url, content in corpus)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+    return parsed, elapsed, lags
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--html-dir", default=None)
+    parser.add_argument("--concurrency", type=int, default=4, help="Parses in flight (evidence_pipeline.parse_concurrency).")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: min(4, CPUs)).")
+    parser.add_argument("--thread-max-bytes", type=int, default=32 * 1024)
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"])
+    args = parser.parse_args()
+
+    corpus = _load_corpus(args.html_dir, args.pages)
+    total_mb = sum(len(content) for _url, content in corpus) / 1e6
+    print(f"Corpus: {len(corpus)} pages, {total_mb:.1f} MB")
+
+    print("\n--- Trafilatura extraction ---")
+    for mode in args.modes:
+        pool = ExtractionPool(
+            executor=mode,
+            max_workers=args.workers,
+            thread_max_bytes=args.thread_max_bytes if mode == "process" else 0,
+        )
+        service = TrafilaturaDocumentParserService(pool=pool)
+        if mode == "process":
+            pool.warm_up()
+            # Let the workers finish starting so pool start-up is not part of the measurement.
+            await _run(service, corpus[:1], 1)
+        try:
+            parsed, elapsed, lags = await _run(service, corpus, args.concurrency)
+        finally:
+            pool.close()
+        print(
+            f"{mode:<8} parsed={parsed:<4} wall={elapsed:.2f}s  {len(corpus) / elapsed:.1f} pages/s  "
+            f"loop lag p50={_percentile(lags, 50) * 1000:.1f}ms  p95={_percentile(lags, 95) * 1000:.1f}ms  "
+            f"max={max(lags, default=0.0) * 1000:.1f}ms"
+        )
+
+    print("\n--- Extraction tiers (all modes) ---")
+    for tier, stats in TrafilaturaDocumentParserService.tier_report().items():
+        print(
+            f"{tier:<9} attempts={stats['attempts']:<5} hits={stats['hits']:<5} "
+            f"hit_rate={stats['hit_rate']:.0%}  avg={stats['avg_ms']:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+import pytest
+
+from deep_research.services.circuit_breaker import DomainCircuitBreaker
+
+
+def _breaker(**overrides) -> DomainCircuitBreaker:
+    settings = dict(
+        window_size=4,
+        min_calls=3,
+        failure_rate_threshold=0.75,
+        slow_call_seconds=10.0,
+        cooldown_seconds=60.0,
+        path=None,
+    )
+    settings.update(overrides)
+    return DomainCircuitBreaker(**settings)
+
+
+async def _fail(breaker: DomainCircuitBreaker, count: int, domain: str = "bad.com") -> None:
+    for i in range(count):
+        await breaker.record(f"https://{domain}/page-{i}", ok=False)
+
+
+@pytest.mark.asyncio
+async def test_opens_after_enough_failures_and_fails_fast():
+    breaker = _breaker()
+
+    await _fail(breaker, 2)
+    assert breaker.allow("https://bad.com/next")
+
+    await _fail(breaker, 3)
+    assert breaker.state("https://bad.com/") == "open"
+    assert not breaker.allow("https://bad.com/next")
+    assert breaker.allow("https://good.com/next")
+
+
+@pytest.mark.asyncio
+async def test_slow_success_counts_as_failure():
+    breaker = _breaker()
+
+    for i in range(3):
+        await breaker.record(f"https://slow.com/{i}", ok=True, latency=30.0)
+
+    assert breaker.state("https://slow.com/") == "open"
+
+
+@pytest.mark.asyncio
+async def test_later_outcome_of_a_url_replaces_the_earlier_one():
+    breaker = _breaker()
+
+    await breaker.record("https://mixed.com/a", ok=True)
+    await breaker.record("https://mixed.com/a", ok=False)  # the page downloaded but did not parse
+    await _fail(breaker, 2, domain="mixed.com")
+
+    assert breaker.state("https://mixed.com/") == "open"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("probe_ok", "expected_state"), [(True, "closed"), (False, "open")])
+async def test_half_open_lets_one_probe_through(monkeypatch, probe_ok, expected_state):
+    breaker = _breaker()
+    await _fail(breaker, 3)
+
+    now = [1_000_000.0]
+    monkeypatch.setattr("deep_research.services.circuit_breaker.time.time", lambda: now[0])
+    breaker._circuits["bad.com"].opened_at = now[0]
+    assert not breaker.allow("https://bad.com/probe")
+
+    now[0] += 61
+    assert breaker.allow("https://bad.com/probe")
+    assert not breaker.allow("https://bad.com/other")  # only one probe at a time
+
+    await breaker.record("https://bad.com/probe", ok=probe_ok)
+    assert breaker.state("https://bad.com/") == expected_state
+
+
+@pytest.mark.asyncio
+async def test_released_probe_allows_another():
+    breaker = _breaker(cooldown_seconds=0.0)
+    await _fail(breaker, 3)
+
+    assert breaker.allow("https://bad.com/probe")
+    breaker.release("https://bad.com/probe")
+
+    assert breaker.allow("https://bad.com/probe-again")
+
+
+@pytest.mark.asyncio
+async def test_open_circuits_persist_across_instances(tmp_path):
+    path = tmp_path / "circuits.json"
+    await _fail(_breaker(path=path), 3)
+
+    assert _breaker(path=path).state("https://bad.com/") == "open"
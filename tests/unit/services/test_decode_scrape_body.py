@@ -0,0 +1,50 @@
+import base64
+import json
+
+import pytest
+
+from deep_research.services.web_search_service import _decode_scrape_body
+
+PAGE = b"<html><body>" + b"x" * 300 + b"</body></html>"
+ENCODED = base64.b64encode(PAGE).decode()
+
+
+def _body(payload: dict) -> bytearray:
+    return bytearray(json.dumps(payload).encode())
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"results": [{"content": ENCODED, "status_code": 200, "headers": {"ETag": "abc"}}]},
+        {"results": [{"headers": {"ETag": "abc"}, "status_code": 200, "content": ENCODED}]},
+        # an earlier metadata field with the same name must not be mistaken for the page
+        {"job": {"content": "bm90IHRoZSBwYWdl"}, "results": [{"content": ENCODED, "status_code": 200, "headers": {"ETag": "abc"}}]},
+        {"results": [{"meta": {"content": "bm90IHRoZSBwYWdl"}, "content": ENCODED, "status_code": 200, "headers": {"ETag": "abc"}}]},
+        {"results": [{"content": ENCODED.replace("/", "\\/"), "status_code": 200, "headers": {"ETag": "abc"}}]},
+    ],
+)
+def test_decodes_first_result_content(payload):
+    body = bytearray(json.dumps(payload).encode().replace(b"\\\\/", b"\\/"))
+
+    page = _decode_scrape_body(body, truncated=False)
+
+    assert page.content == PAGE
+    assert page.status_code == 200
+    assert page.headers == {"etag": "abc"}
+
+
+def test_truncated_body_yields_decodable_prefix():
+    body = _body({"results": [{"content": ENCODED, "status_code": 200}]})[:120]
+
+    page = _decode_scrape_body(body, truncated=True)
+
+    assert page.truncated
+    assert PAGE.startswith(page.content) and page.content
+    assert page.status_code is None
+
+
+def test_empty_results():
+    page = _decode_scrape_body(_body({"results": []}), truncated=False)
+
+    assert page.content == b"" and page.status_code is None
@@ -0,0 +1,34 @@
+import io
+import zipfile
+
+import pytest
+
+from deep_research.services.routing_document_parser_service import sniff_document_kind
+
+
+def _zip(*names: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name in names:
+            archive.writestr(name, "<x/>")
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("content", "url", "expected"),
+    [
+        (b"%PDF-1.7\n...", "https://example.com/download?id=1", "pdf"),
+        (_zip("[Content_Types].xml", "word/document.xml"), "https://example.com/file", "docx"),
+        (_zip("[Content_Types].xml", "ppt/slides/slide1.xml"), "https://example.com/deck.pdf", "pptx"),
+        (_zip("[Content_Types].xml", "xl/workbook.xml"), "https://example.com/sheet", "office"),
+        (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1rest", "https://example.com/old.doc", "office"),
+        (b"\xef\xbb\xbf  <!DOCTYPE html><html>", "https://example.com/report.pdf", "html"),
+        (b"<?xml version='1.0'?><html xmlns='http://www.w3.org/1999/xhtml'>", "https://example.com/", "html"),
+        (b"PK\x03\x04truncated", "https://example.com/report.docx", "docx"),
+        (b"not really a pdf", "https://example.com/report.pdf", "pdf"),
+        (b"plain notes", "https://example.com/notes", "text"),
+        (b"\x00\x01\x02", "https://example.com/blob", "unknown"),
+    ],
+)
+def test_sniff_document_kind(content, url, expected):
+    assert sniff_document_kind(content, url) == expected
@@ -0,0 +1,76 @@
+import pytest
+
+from deep_research.services.download_cache import DownloadCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr("deep_research.services.download_cache.time.time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DownloadCache(directory=tmp_path / "downloads", max_bytes=25, fresh_seconds=60)
+    yield cache
+    cache.close()
+
+
+def _blobs(cache: DownloadCache) -> list:
+    return [p for p in cache._blob_dir.rglob("*") if p.is_file()]
+
+
+@pytest.mark.asyncio
+async def test_roundtrip_keeps_validators_and_render_mode(cache, clock):
+    await cache.put("https://example.com/a", "none", b"plain page", etag='"v1"', last_modified="Mon")
+
+    cached = await cache.get("https://example.com/a", "none")
+
+    assert bytes(cached.content) == b"plain page"
+    assert cached.validators == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+    assert await cache.get("https://example.com/a", "html") is None
+
+
+@pytest.mark.asyncio
+async def test_freshness_expires_and_revalidation_renews_it(cache, clock):
+    await cache.put("https://example.com/a", "none", b"page")
+
+    clock[0] += 61
+    assert not (await cache.get("https://example.com/a", "none")).is_fresh(60)
+
+    await cache.mark_revalidated("https://example.com/a", "none")
+    assert (await cache.get("https://example.com/a", "none")).is_fresh(60)
+
+
+@pytest.mark.asyncio
+async def test_identical_content_is_stored_once(cache, clock):
+    await cache.put("https://example.com/a", "none", b"same bytes")
+    await cache.put("https://mirror.example.org/a", "none", b"same bytes")
+
+    assert len(_blobs(cache)) == 1
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted_over_max_bytes(cache, clock):
+    await cache.put("https://example.com/a", "none", b"a" * 10)
+    clock[0] += 1
+    await cache.put("https://example.com/b", "none", b"b" * 10)
+    clock[0] += 1
+    await cache.get("https://example.com/a", "none")
+    clock[0] += 1
+
+    await cache.put("https://example.com/c", "none", b"c" * 10)
+
+    assert await cache.get("https://example.com/b", "none") is None
+    assert await cache.get("https://example.com/a", "none") is not None
+    assert len(_blobs(cache)) == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_blob_drops_the_entry(cache, clock):
+    await cache.put("https://example.com/a", "none", b"page")
+    for blob in _blobs(cache):
+        blob.unlink()
+
+    assert await cache.get("https://example.com/a", "none") is None
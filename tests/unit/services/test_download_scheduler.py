@@ -0,0 +1,139 @@
+import asyncio
+import random
+
+import pytest
+
+from deep_research.services.download_scheduler import AimdLimiter, DownloadScheduler, TokenBucket
+
+
+def _limiter(**overrides) -> AimdLimiter:
+    settings = dict(initial=8, min_limit=2, max_limit=64, decrease_factor=0.5, latency_tolerance=2.0, cooldown=0.0)
+    settings.update(overrides)
+    return AimdLimiter(**settings)
+
+
+def test_mixed_request_classes_are_not_congestion():
+    limiter = _limiter()
+    rng = random.Random(7)
+    classes = {"serp": 0.6, "plain": 1.5, "rendered": 12.0}
+    windows = []
+
+    for _ in range(500):
+        request_class = rng.choices(list(classes), weights=[1, 6, 3])[0]
+        limiter.on_success(classes[request_class] * rng.uniform(0.8, 1.25), request_class)
+        windows.append(limiter.limit)
+
+    assert windows == sorted(windows)  # no multiplicative decrease without errors
+    assert limiter.limit > 8
+
+
+def test_latency_spike_within_a_class_is_congestion():
+    limiter = _limiter()
+    for _ in range(50):
+        limiter.on_success(1.0, "plain")
+    before = limiter.limit
+
+    for _ in range(5):
+        limiter.on_success(10.0, "plain")
+
+    assert limiter.limit < before
+
+
+def test_congestion_halves_the_window_once_per_cooldown():
+    limiter = _limiter(initial=16, cooldown=60.0)
+
+    limiter.on_congestion("429")
+    limiter.on_congestion("429")
+
+    assert limiter.limit == 8
+
+
+def test_window_stays_within_bounds():
+    limiter = _limiter(initial=4, min_limit=3, max_limit=5)
+
+    for _ in range(200):
+        limiter.on_success(1.0)
+    assert limiter.limit == 5
+
+    for _ in range(5):
+        limiter.on_congestion("503")
+    assert limiter.limit == 3
+
+
+def test_fixed_window_when_not_adaptive():
+    limiter = _limiter(adaptive=False)
+
+    limiter.on_congestion("429")
+    for _ in range(100):
+        limiter.on_success(1.0)
+
+    assert limiter.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_a_free_slot_and_survives_cancelled_waiters():
+    limiter = _limiter(initial=1, min_limit=1, adaptive=False)
+    await limiter.acquire()
+
+    cancelled = asyncio.create_task(limiter.acquire())
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiting, timeout=1)
+    limiter.release()
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_waiter_cancelled_in_the_same_tick_as_a_release():
+    limiter = _limiter(initial=1, min_limit=1, adaptive=False)
+    await limiter.acquire()
+
+    cancelled = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    # _wake() drops the cancelled waiter before its task gets to run.
+    limiter.release()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_a_burst_then_paces():
+    bucket = TokenBucket(rate=50.0, burst=3)
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    for _ in range(3):
+        await bucket.acquire()
+    burst_elapsed = loop.time() - started
+    for _ in range(2):
+        await bucket.acquire()
+    paced_elapsed = loop.time() - started
+
+    assert burst_elapsed < 0.01
+    assert paced_elapsed >= 0.03
+
+
+@pytest.mark.asyncio
+async def test_per_domain_concurrency_is_bounded():
+    scheduler = DownloadScheduler(max_concurrent=10, max_concurrent_per_domain=2, per_domain_rate=1000.0, per_domain_burst=10)
+    in_flight = peak = 0
+
+    async def download(url: str) -> None:
+        nonlocal in_flight, peak
+        async with scheduler.slot(url, request_class="plain"):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(download(f"https://example.com/{i}") for i in range(6)))
+
+    assert peak == 2
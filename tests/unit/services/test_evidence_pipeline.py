@@ -0,0 +1,254 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from deep_research.config import EvidenceBatchSettings
+from deep_research.services.evidence_service import EvidenceService, _Stage, _TokenBudget
+from deep_research.services.metrics import metrics
+from deep_research.services.models import ParsedDocument
+from deep_research.services.web_search_service import DownloadResult
+
+
+class FakeWebSearch:
+    """Downloads take the number of seconds given as the URL's last path segment."""
+
+    circuit_breaker = None
+
+    async def download_url(self, url: str) -> DownloadResult:
+        await asyncio.sleep(float(url.rsplit("/", 1)[1]))
+        return DownloadResult(url=url, content=b"<html></html>")
+
+
+class FakeParser:
+    def __init__(self, markdown: dict[str, str] | None = None) -> None:
+        self.markdown = markdown or {}
+
+    async def parse_files(self, files):
+        docs = [
+            ParsedDocument(source_url=url, markdown=self.markdown.get(url, "short page"), metadata={})
+            for _, url, _ in files
+        ]
+        return docs, []
+
+
+class FakeAnalysis:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.analyzed: list[str] = []
+
+    async def analyze_parsed_document(self, evidence, directive):
+        self.analyzed.append(evidence.source_url)
+        await asyncio.sleep(self.delay)
+        insight = SimpleNamespace(content="insight", relevance_score=1.0, topic_density_score=1.0)
+        return SimpleNamespace(insights=[insight], selected_asset_ids=[])
+
+
+def _service(
+    *, parser: FakeParser | None = None, analysis_delay: float = 0.0, **batch
+) -> tuple[EvidenceService, FakeAnalysis]:
+    analysis = FakeAnalysis(analysis_delay)
+    service = EvidenceService(
+        content_analysis_service=analysis,
+        document_parser_service=parser or FakeParser(),
+        file_service=None,
+        web_search_service=FakeWebSearch(),
+        batch_settings=EvidenceBatchSettings(**batch),
+    )
+    return service, analysis
+
+
+def test_token_budget_reserve_and_release():
+    budget = _TokenBudget(limit=10, used=4)
+
+    assert budget.reserve(6)
+    assert not budget.reserve(1)
+    budget.release(6)
+    assert budget.reserve(5)
+    assert _TokenBudget(limit=None, used=0).reserve(10**9)
+
+
+@pytest.mark.asyncio
+async def test_stage_hands_workers_out_by_priority():
+    stage = _Stage("test", workers=1, queue_size=10)
+    order: list[str] = []
+    busy = asyncio.Event()
+
+    async def job(name: str, priority: float, hold: asyncio.Event | None = None) -> None:
+        place = await stage.put()
+        async with stage.work(place, priority=priority):
+            order.append(name)
+            if hold is not None:
+                busy.set()
+                await hold.wait()
+
+    release = asyncio.Event()
+    first = asyncio.create_task(job("first", 0.0, release))
+    await busy.wait()
+    rest = [asyncio.create_task(job(name, p)) for name, p in (("low", 0.1), ("high", 0.9), ("mid", 0.5))]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *rest)
+
+    assert order == ["first", "high", "mid", "low"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_stalls_put_until_an_item_gets_a_worker():
+    stage = _Stage("test", workers=1, queue_size=1)
+    first = await stage.put()
+
+    second = asyncio.create_task(stage.put())
+    await asyncio.sleep(0)
+    assert not second.done()
+
+    async with stage.work(first):
+        place = await asyncio.wait_for(second, timeout=1)
+    place.release()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_back_its_queue_place_and_no_worker():
+    stage = _Stage("test", workers=1, queue_size=1)
+    holder_place = await stage.put()
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with stage.work(holder_place):
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    place = await stage.put()
+
+    async def wait_for_worker() -> None:
+        async with stage.work(place):
+            pass
+
+    waiter = asyncio.create_task(wait_for_worker())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    await holder
+
+    # Both the queue place and the single worker are free again.
+    again = await asyncio.wait_for(stage.put(), timeout=1)
+    async with asyncio.timeout(1):
+        async with stage.work(again):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_released_place_frees_the_queue_exactly_once():
+    stage = _Stage("test", workers=1, queue_size=1)
+    place = await stage.put()
+
+    # An error between put() and work(): the holder gives the place back itself.
+    place.release()
+    place.release()
+
+    again = await asyncio.wait_for(stage.put(), timeout=1)
+    blocked = asyncio.create_task(stage.put())
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    again.release()
+    (await blocked).release()
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_stragglers_as_failures():
+    service, _ = _service(deadline_seconds=0.05, straggler_policy="cancel")
+
+    items, failures, _ = await service.generate_evidence(["https://a.com/0", "https://b.com/5"], "directive")
+
+    assert [item.url for item in items] == ["https://a.com/0"]
+    assert failures == ["https://b.com/5"]
+    assert service.pending_urls == []
+
+
+@pytest.mark.asyncio
+async def test_over_budget_outcomes_do_not_count_toward_the_quorum():
+    parser = FakeParser({"https://a.com/0": "word " * 500})
+    service, analysis = _service(parser=parser, quorum=1, deadline_seconds=1)
+    before = metrics.snapshot()
+
+    items, failures, budget_exhausted = await service.generate_evidence(
+        ["https://a.com/0", "https://b.com/0.02"], "directive", max_total_tokens=50
+    )
+
+    assert [item.url for item in items] == ["https://b.com/0.02"]
+    assert failures == []
+    assert budget_exhausted
+    assert analysis.analyzed == ["https://b.com/0.02"]
+    assert metrics.delta(before).get("evidence.llm_calls_saved") == 1
+
+
+@pytest.mark.asyncio
+async def test_straggler_is_charged_to_the_call_that_collects_it():
+    service, _ = _service(deadline_seconds=0.05, straggler_policy="background")
+
+    # The first call's budget is full by the time the straggler is analyzed...
+    items, _, _ = await service.generate_evidence(
+        ["https://a.com/0", "https://b.com/0.1"], "directive", max_total_tokens=20, existing_total_tokens=20
+    )
+    assert items == []
+    assert service.pending_urls == ["https://b.com/0.1"]
+
+    # ...but it reserves from the next call's budget, which has room.
+    items, _, _ = await service.generate_evidence([], "directive", max_total_tokens=20)
+    await asyncio.sleep(0.15)
+    collected, failures, _ = await service.collect_stragglers(max_total_tokens=20)
+
+    assert [item.url for item in items + collected] == ["https://b.com/0.1"]
+    assert failures == []
+
+
+@pytest.mark.asyncio
+async def test_straggler_analyzed_under_an_earlier_budget_counts_against_the_next_call():
+    service, analysis = _service(analysis_delay=0.1, deadline_seconds=0.05, straggler_policy="background")
+
+    # Reserves its tokens from the first call's budget, then outlives the call.
+    items, _, _ = await service.generate_evidence(["https://a.com/0"], "directive", max_total_tokens=3)
+    assert items == []
+
+    # Its 2 tokens move to the second call's budget, which leaves no room for b's 2 tokens.
+    items, _, budget_exhausted = await service.generate_evidence(
+        ["https://b.com/0.01"], "directive", max_total_tokens=3
+    )
+    assert items == []
+    assert budget_exhausted
+    assert analysis.analyzed == ["https://a.com/0"]
+
+    await asyncio.sleep(0.1)
+    collected, _, _ = await service.collect_stragglers(max_total_tokens=3)
+    assert [item.url for item in collected] == ["https://a.com/0"]
+
+
+@pytest.mark.asyncio
+async def test_collect_stragglers_cancels_unfinished_work():
+    service, _ = _service(deadline_seconds=0.01, straggler_policy="background")
+    await service.generate_evidence(["https://a.com/5"], "directive")
+    (task,) = [job.task for job in service._stragglers.values()]
+
+    items, failures, _ = await service.collect_stragglers()
+    await asyncio.sleep(0)
+
+    assert (items, failures) == ([], [])
+    assert task.cancelled()
+    assert service.pending_urls == []
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_straggler_mid_analysis_leaves_it_cancelled():
+    service, analysis = _service(analysis_delay=5, deadline_seconds=0.05, straggler_policy="background")
+    await service.generate_evidence(["https://a.com/0"], "directive")
+    (job,) = service._stragglers.values()
+    assert analysis.analyzed == ["https://a.com/0"]
+
+    await service.collect_stragglers()
+    with pytest.raises(asyncio.CancelledError):
+        await job.task
+
+    assert job.reserved_from is None
@@ -0,0 +1,56 @@
+import pytest
+from trafilatura.utils import load_html
+
+from deep_research.services.trafilatura_document_parser_service import _extract_metadata
+
+HEAD = """
+<title>Battery chemistry explained | Example Energy</title>
+<meta property="og:title" content="Battery chemistry explained">
+<meta name="author" content="Jane Doe">
+<meta property="og:site_name" content="Example Energy">
+<meta property="article:published_time" content="2024-03-05T10:00:00Z">
+"""
+BODY = "<body><article><p>Body text.</p></article></body>"
+
+
+def _metadata(html: str) -> dict:
+    return _extract_metadata(load_html(html), "https://example.com/post")
+
+
+def test_reads_meta_tags():
+    assert _metadata(f"<html lang='en'><head>{HEAD}</head>{BODY}</html>") == {
+        "title": "Battery chemistry explained",
+        "published_date": "2024-03-05",
+        "author": "Jane Doe",
+        "sitename": "Example Energy",
+        "language": "en",
+    }
+
+
+def test_reads_json_ld():
+    json_ld = """<script type="application/ld+json">
+    {"@context": "https://schema.org", "@type": "NewsArticle", "headline": "Grid storage in 2024",
+     "datePublished": "2024-01-15", "author": {"@type": "Person", "name": "Ada Lovelace"},
+     "publisher": {"@type": "Organization", "name": "Energy Daily"}}
+    </script>"""
+
+    metadata = _metadata(f"<html><head>{json_ld}</head>{BODY}</html>")
+
+    assert metadata["title"] == "Grid storage in 2024"
+    assert metadata["published_date"] == "2024-01-15"
+    assert metadata["author"] == "Ada Lovelace"
+    assert metadata["sitename"] == "Energy Daily"
+
+
+@pytest.mark.parametrize(
+    ("html", "language"),
+    [
+        ("<html lang='en_US'><head></head><body></body></html>", "en-us"),
+        ("<html><head><meta http-equiv='content-language' content='fr'></head><body></body></html>", "fr"),
+        ("<html><head><meta http-equiv='Content-Language' content='de'></head><body></body></html>", "de"),
+        ("<html><head><meta property='og:locale' content='de_DE'></head><body></body></html>", "de-de"),
+        ("<html><head></head><body></body></html>", None),
+    ],
+)
+def test_language(html, language):
+    assert _metadata(html).get("language") == language
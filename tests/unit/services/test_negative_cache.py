@@ -0,0 +1,76 @@
+import pytest
+
+from deep_research.services.negative_cache import FAILURE_DOWNLOAD, FAILURE_NOT_TEXT, NegativeCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr("deep_research.services.negative_cache.time.time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = NegativeCache(
+        path=tmp_path / "negative.sqlite3",
+        ttl_seconds={FAILURE_NOT_TEXT: 1000, FAILURE_DOWNLOAD: 100, "never_cached": 0},
+        default_ttl_seconds=10,
+    )
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_hits_are_matched_in_canonical_form(cache, clock):
+    await cache.put_many({"https://example.com/report.pdf": FAILURE_NOT_TEXT})
+
+    hits = await cache.get_many(["http://www.example.com/report.pdf?utm_source=x", "https://example.com/other"])
+
+    assert hits == {"http://www.example.com/report.pdf?utm_source=x": FAILURE_NOT_TEXT}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("reason", "still_cached_after", "expired_after"),
+    [(FAILURE_NOT_TEXT, 999, 1000), (FAILURE_DOWNLOAD, 99, 100), ("unknown_reason", 9, 10)],
+)
+async def test_entries_expire_after_their_reason_ttl(cache, clock, reason, still_cached_after, expired_after):
+    url = "https://example.com/a"
+    await cache.put_many({url: reason})
+    start = clock[0]
+
+    clock[0] = start + still_cached_after
+    assert await cache.get_many([url]) == {url: reason}
+
+    clock[0] = start + expired_after
+    assert await cache.get_many([url]) == {}
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_reasons_are_not_stored(cache, clock):
+    await cache.put_many({"https://example.com/a": "never_cached"})
+
+    assert await cache.get_many(["https://example.com/a"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_newer_failure_replaces_the_older_one(cache, clock):
+    url = "https://example.com/a"
+    await cache.put_many({url: FAILURE_NOT_TEXT})
+    await cache.put_many({url: FAILURE_DOWNLOAD})
+
+    clock[0] += 150
+    assert await cache.get_many([url]) == {}
+
+
+@pytest.mark.asyncio
+async def test_entries_survive_a_new_instance(tmp_path, clock):
+    path = tmp_path / "negative.sqlite3"
+    first = NegativeCache(path=path, ttl_seconds={}, default_ttl_seconds=60)
+    await first.put_many({"https://example.com/a": FAILURE_DOWNLOAD})
+    first.close()
+
+    second = NegativeCache(path=path, ttl_seconds={}, default_ttl_seconds=60)
+    assert await second.get_many(["https://example.com/a"]) == {"https://example.com/a": FAILURE_DOWNLOAD}
+    second.close()
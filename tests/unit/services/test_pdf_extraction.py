@@ -0,0 +1,110 @@
+import pytest
+
+from deep_research.services.extraction_pool import ExtractionPool
+from deep_research.services.local_document_parser_service import LocalDocumentParserService
+from deep_research.services.metrics import metrics
+from deep_research.services.models import ParsedDocument
+from deep_research.services.pdf_extraction import extract_pdf_document
+from deep_research.services.routing_document_parser_service import RoutingDocumentParserService
+
+SENTENCE = "The cells were cycled at twenty five degrees and kept most of their capacity."
+RESULTS_PAGE = [
+    (72, 740, "2. RESULTS"),
+    *((72, 700 - 14 * i, SENTENCE) for i in range(4)),
+    (72, 600, "Cell"), (200, 600, "Capacity"), (330, 600, "Cost"),
+    (72, 586, "NMC"), (200, 586, "250"), (330, 586, "120"),
+    (72, 572, "LFP"), (200, 572, "160"), (330, 572, "90"),
+]
+
+
+def _pdf(pages: list[list[tuple[int, int, str]]]) -> bytes:
+    """A minimal PDF with one Helvetica text run per (x, y, text); an empty list is a blank page."""
+    objects = [b"", b"", b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for runs in pages:
+        ops = b"".join(b"BT /F1 10 Tf %d %d Td (%s) Tj ET\n" % (x, y, text.encode("latin-1")) for x, y, text in runs)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(ops), ops))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class RecordingParser:
+    def __init__(self) -> None:
+        self.urls: list[str] = []
+
+    async def parse_files(self, files):
+        self.urls.extend(url for _, url, _ in files)
+        return [ParsedDocument(source_url=url, markdown="parsed remotely") for _, url, _ in files], []
+
+
+def _router(min_chars_per_page: int) -> tuple[RoutingDocumentParserService, RecordingParser]:
+    fallback = RecordingParser()
+    local = LocalDocumentParserService(pool=ExtractionPool(executor="inline"), pdf_min_chars_per_page=min_chars_per_page)
+    router = RoutingDocumentParserService(
+        routes={"pdf": ["local", "llamaparse"]}, parsers={"local": local, "llamaparse": fallback}
+    )
+    return router, fallback
+
+
+def test_layout_text_becomes_headings_paragraphs_and_tables():
+    extraction = extract_pdf_document(_pdf([RESULTS_PAGE]), "https://example.com/r.pdf", max_pages=60)
+
+    assert extraction.markdown.startswith("<!-- page 1 -->\n\n## 2. RESULTS\n\n" + SENTENCE)
+    assert "| Cell | Capacity | Cost |\n| --- | --- | --- |\n| NMC | 250 | 120 |\n| LFP | 160 | 90 |" in extraction.markdown
+    assert extraction.page_count == extraction.pages_read == 1
+    assert extraction.chars_per_page > 200
+
+
+def test_page_limits_are_recorded():
+    pdf = _pdf([RESULTS_PAGE, [(72, 700, "Second page.")], [(72, 700, "Third page.")]])
+
+    extraction = extract_pdf_document(pdf, "https://example.com/r.pdf", max_pages=1, page_range=(2, 3))
+
+    assert extraction.pages_read == 1
+    assert extraction.metadata == {"page_count": 3, "pages_read": "2-2"}
+    assert "Second page." in extraction.markdown and "RESULTS" not in extraction.markdown
+
+
+@pytest.mark.asyncio
+async def test_dense_pdf_is_parsed_locally():
+    router, fallback = _router(min_chars_per_page=200)
+
+    parsed, failed = await router.parse_files([(None, "https://example.com/r.pdf", _pdf([RESULTS_PAGE]))])
+
+    assert failed == []
+    assert "## 2. RESULTS" in parsed[0].markdown
+    assert fallback.urls == []
+
+
+@pytest.mark.asyncio
+async def test_low_density_pdf_falls_back_to_the_next_parser():
+    # One text page among blank (image-only) ones: too few characters per page, probably scanned.
+    pdf = _pdf([RESULTS_PAGE, [], [], []])
+    assert extract_pdf_document(pdf, "https://example.com/scan.pdf", max_pages=60).chars_per_page < 200
+    router, fallback = _router(min_chars_per_page=200)
+    before = metrics.snapshot()
+
+    parsed, failed = await router.parse_files([(None, "https://example.com/scan.pdf", pdf)])
+
+    assert failed == []
+    assert parsed[0].markdown == "parsed remotely"
+    assert fallback.urls == ["https://example.com/scan.pdf"]
+    delta = metrics.delta(before)
+    assert delta.get("parser.pdf.low_density") == 1
+    assert delta.get("parser.route.fallbacks") == 1
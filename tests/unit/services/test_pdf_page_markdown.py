@@ -0,0 +1,22 @@
+import pytest
+
+from deep_research.services.pdf_extraction import page_markdown
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("2. RESULTS\n\nBody text.", "## 2. RESULTS\n\nBody text."),
+        ("Energy Storage Outlook\n\nBody text.", "### Energy Storage Outlook\n\nBody text."),
+        ("The cells were cycled at\n25 degrees for a long dura-\ntion.", "The cells were cycled at 25 degrees for a long duration."),
+        (
+            "Cell   Capacity   Cost\nNMC    250        120\nLFP    160        90",
+            "| Cell | Capacity | Cost |\n| --- | --- | --- |\n| NMC | 250 | 120 |\n| LFP | 160 | 90 |",
+        ),
+        ("Left     Right\nOnly two rows     here", "Left Right Only two rows here"),
+        ("Some text.\n\n  12  \n\nPage 3 of 9", "Some text."),
+        ("", ""),
+    ],
+)
+def test_page_markdown(text, expected):
+    assert page_markdown(text) == expected
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from deep_research.services.metrics import metrics
+from deep_research.services.models import ParsedDocument
+from deep_research.services.prefetcher import PrefetchedDocument, SpeculativePrefetcher
+
+
+def _done(result: PrefetchedDocument) -> asyncio.Task[PrefetchedDocument]:
+    async def prefetch() -> PrefetchedDocument:
+        return result
+
+    return asyncio.create_task(prefetch())
+
+
+@pytest.mark.asyncio
+async def test_parsed_document_is_a_hit():
+    before = metrics.snapshot()
+    document = ParsedDocument(source_url="https://example.com/a", markdown="text", metadata={})
+
+    prefetched = await SpeculativePrefetcher.resolve(
+        "https://example.com/a?utm_source=x", _done(PrefetchedDocument(url="https://example.com/a", document=document))
+    )
+
+    assert prefetched.document.source_url == "https://example.com/a?utm_source=x"
+    assert metrics.delta(before).get("prefetch.hit") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "result",
+    [
+        PrefetchedDocument(url="https://example.com/a", document=None, download_failed=True, download_error="timeout"),
+        PrefetchedDocument(url="https://example.com/a", document=None),
+    ],
+)
+async def test_failed_prefetch_is_not_a_hit(result):
+    before = metrics.snapshot()
+
+    prefetched = await SpeculativePrefetcher.resolve("https://example.com/a", _done(result))
+
+    assert prefetched is result
+    delta = metrics.delta(before)
+    assert "prefetch.hit" not in delta
+    assert delta.get("prefetch.unusable") == 1
+
+
+@pytest.mark.asyncio
+async def test_raising_prefetch_means_fetch_again():
+    async def prefetch() -> PrefetchedDocument:
+        raise RuntimeError("boom")
+
+    assert await SpeculativePrefetcher.resolve("https://example.com/a", asyncio.create_task(prefetch())) is None
+
+
+@pytest.mark.asyncio
+async def test_claim_many_does_not_wait_for_running_prefetches():
+    release = asyncio.Event()
+
+    class SlowWebSearch:
+        async def download_url(self, url):
+            await release.wait()
+
+    prefetcher = SpeculativePrefetcher(
+        web_search_service=SlowWebSearch(),
+        document_parser_service=None,
+        top_k=2,
+        ttl_seconds=60,
+        max_requests=2,
+        max_bytes=1_000_000,
+    )
+    prefetcher.schedule(["https://example.com/a"])
+
+    claimed = prefetcher.claim_many(["https://example.com/a", "https://example.com/b"])
+
+    assert list(claimed) == ["https://example.com/a"]
+    assert not claimed["https://example.com/a"].done()
+    assert prefetcher.claim_many(["https://example.com/a"]) == {}
+    claimed["https://example.com/a"].cancel()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_unclaimed_prefetches_and_counts_them_wasted():
+    class SlowWebSearch:
+        async def download_url(self, url):
+            await asyncio.sleep(10)
+
+    prefetcher = SpeculativePrefetcher(
+        web_search_service=SlowWebSearch(),
+        document_parser_service=None,
+        top_k=2,
+        ttl_seconds=60,
+        max_requests=2,
+        max_bytes=1_000_000,
+    )
+    prefetcher.schedule(["https://example.com/a", "https://example.com/b"])
+    (task,) = prefetcher.claim_many(["https://example.com/a"]).values()
+    (unclaimed,) = [entry.task for entry in prefetcher._entries.values()]
+    before = metrics.snapshot()
+
+    prefetcher.close()
+    await asyncio.sleep(0)
+
+    assert unclaimed.cancelled()
+    assert metrics.delta(before).get("prefetch.wasted") == 1
+    assert prefetcher.claim_many(["https://example.com/b"]) == {}
+    # A claimed prefetch belongs to its URL task now and is left alone.
+    assert not task.done()
+    task.cancel()
@@ -0,0 +1,106 @@
+import asyncio
+
+import httpx
+import pytest
+
+from deep_research.services.retry_policy import HedgePolicy, RetryableStatusError, RetryPolicy
+
+
+def _flaky(errors: list[BaseException], result: str = "ok"):
+    calls = 0
+
+    async def fn() -> str:
+        nonlocal calls
+        calls += 1
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return fn, lambda: calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("errors", "expected_calls"),
+    [
+        ([], 1),
+        ([RetryableStatusError(503)], 2),
+        ([httpx.ConnectTimeout("slow"), RetryableStatusError(429)], 3),
+    ],
+)
+async def test_retries_transient_errors(errors, expected_calls):
+    fn, calls = _flaky(list(errors))
+
+    assert await RetryPolicy(max_attempts=3, base_delay=0, max_delay=0).run(fn) == "ok"
+    assert calls() == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts():
+    fn, calls = _flaky([RetryableStatusError(503)] * 5)
+
+    with pytest.raises(RetryableStatusError):
+        await RetryPolicy(max_attempts=3, base_delay=0, max_delay=0).run(fn)
+    assert calls() == 3
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_permanent_errors():
+    fn, calls = _flaky([ValueError("bad payload")])
+
+    with pytest.raises(ValueError):
+        await RetryPolicy(max_attempts=3, base_delay=0, max_delay=0).run(fn)
+    assert calls() == 1
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=4.0)
+
+    assert all(0 <= policy.backoff(attempt) <= 4.0 for attempt in range(10))
+
+
+def _warmed_hedge(latency: float = 0.01) -> HedgePolicy:
+    policy = HedgePolicy(enabled=True, percentile=90, min_delay=0.0, min_samples=3)
+    for _ in range(3):
+        policy.latencies.record(latency)
+    return policy
+
+
+def test_hedge_is_off_until_enough_samples():
+    policy = HedgePolicy(enabled=True, percentile=90, min_delay=0.0, min_samples=3)
+
+    assert policy.hedge_delay() is None
+    assert _warmed_hedge().hedge_delay() == pytest.approx(0.01)
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_over_slow_primary_and_cancels_it():
+    policy = _warmed_hedge()
+    calls = 0
+    primary_cancelled = asyncio.Event()
+
+    async def fn() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+        return f"attempt {calls}"
+
+    assert await policy.run(fn) == "attempt 2"
+    await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_hedge_raises_when_both_requests_fail():
+    policy = _warmed_hedge()
+
+    async def fn() -> str:
+        await asyncio.sleep(0.05)
+        raise RetryableStatusError(502)
+
+    with pytest.raises(RetryableStatusError):
+        await policy.run(fn)
@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+from deep_research.services.serp_cache import SerpCache, normalize_query
+
+SNIPPET = {"type": "featured_snippet", "title": "Answer", "text": "42", "url": "https://a.com", "source": ""}
+STORY = {"type": "top_stories", "title": "News", "text": "", "url": "https://b.com", "source": "B"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr("deep_research.services.serp_cache.time.time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SerpCache(path=tmp_path / "serp.sqlite3", ttl_seconds=100, max_entries=3)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("Solid  State Batteries", "solid state batteries"),
+        ("site:x.com Foo  bar", "foo bar site:x.com"),
+        ('"Energy   Density" OR cost', '"energy density" OR cost'),
+        ("filetype:pdf site:a.org report", "report filetype:pdf site:a.org"),
+    ],
+)
+def test_normalize_query(query, expected):
+    assert normalize_query(query) == expected
+
+
+@pytest.mark.asyncio
+async def test_roundtrip_uses_the_normalized_query(cache, clock):
+    await cache.set("Solid State Batteries", 1, [{"url": "https://a.com"}], [])
+
+    assert await cache.get("solid  state batteries", 1) == {"organic": [{"url": "https://a.com"}], "features": []}
+    assert await cache.get("solid state batteries", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_features_are_stored_once_per_query(cache, clock, tmp_path):
+    await cache.set("q", 1, [{"url": "https://a.com/1"}], [SNIPPET])
+    await cache.set("q", 2, [{"url": "https://a.com/2"}], [SNIPPET, STORY])
+
+    assert (await cache.get("q", 1))["features"] == [SNIPPET, STORY]
+    assert (await cache.get("q", 2))["features"] == []
+    with sqlite3.connect(tmp_path / "serp.sqlite3") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM serp_features").fetchone() == (1,)
+
+
+@pytest.mark.asyncio
+async def test_entries_expire(cache, clock):
+    await cache.set("q", 1, [{"url": "https://a.com"}], [SNIPPET])
+
+    clock[0] += 100
+    assert await cache.get("q", 1) is not None
+    clock[0] += 1
+    assert await cache.get("q", 1) is None
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_pages_are_evicted_with_their_features(cache, clock, tmp_path):
+    for i, query in enumerate(["a", "b", "c"]):
+        clock[0] += 1
+        await cache.set(query, 1, [{"url": f"https://{query}.com"}], [SNIPPET] if i == 0 else [])
+    clock[0] += 1
+    await cache.get("b", 1)
+    clock[0] += 1
+    await cache.get("c", 1)
+
+    clock[0] += 1
+    await cache.set("d", 1, [{"url": "https://d.com"}], [])
+
+    assert await cache.get("a", 1) is None
+    assert all([await cache.get(q, 1) for q in ("b", "c", "d")])
+    with sqlite3.connect(tmp_path / "serp.sqlite3") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM serp_features").fetchone() == (0,)
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from deep_research.services.web_search_service import WebSearchService, _SerpPage
+
+
+class FakeSerp:
+    """SERP pages from a {page: number of results} map; records concurrency and requested pages."""
+
+    def __init__(self, sizes: dict[int, int], failing: set[int] = frozenset()) -> None:
+        self.sizes = sizes
+        self.failing = failing
+        self.requested: list[int] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, query: str, page: int) -> _SerpPage:
+        self.requested.append(page)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if page in self.failing:
+                raise RuntimeError(f"page {page} failed")
+            organic = [{"url": f"https://example.com/p{page}/{i}"} for i in range(self.sizes.get(page, 0))]
+            return _SerpPage(organic=organic, features=[], requests_made=1)
+        finally:
+            self.active -= 1
+
+
+def _service(serp: FakeSerp) -> WebSearchService:
+    service = WebSearchService(client=object())
+    service._fetch_serp_page = serp
+    return service
+
+
+@pytest.mark.asyncio
+async def test_pages_after_the_first_are_fetched_in_concurrent_waves():
+    serp = FakeSerp({page: 2 for page in range(1, 6)})
+
+    response = await _service(serp).search("q", max_results=10, max_pages=5, page_wave=2)
+
+    assert serp.requested == [1, 2, 3, 4, 5]
+    assert serp.max_active == 2
+    assert len(response.results) == 10
+    assert response.requests_made == 5
+
+
+@pytest.mark.asyncio
+async def test_stops_after_the_wave_that_collects_enough_new_urls():
+    serp = FakeSerp({page: 3 for page in range(1, 6)})
+
+    response = await _service(serp).search("q", max_results=5, max_pages=5, page_wave=2)
+
+    assert serp.requested == [1, 2, 3]
+    assert len(response.results) == 5
+
+
+@pytest.mark.asyncio
+async def test_excluded_urls_do_not_count_towards_the_early_stop():
+    serp = FakeSerp({1: 3, 2: 3})
+    excluded = [f"https://example.com/p1/{i}" for i in range(3)]
+
+    response = await _service(serp).search("q", max_results=3, max_pages=2, exclude_urls=excluded)
+
+    assert serp.requested == [1, 2]
+    assert len(response.results) == 6
+
+
+@pytest.mark.asyncio
+async def test_empty_page_ends_the_search():
+    serp = FakeSerp({1: 2, 2: 0, 3: 2})
+
+    await _service(serp).search("q", max_results=10, max_pages=5, page_wave=2)
+
+    assert serp.requested == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_a_failed_page_does_not_fail_the_search():
+    serp = FakeSerp({1: 2, 2: 2, 3: 2}, failing={2})
+
+    response = await _service(serp).search("q", max_results=10, max_pages=3, page_wave=2)
+
+    assert len(response.results) == 4
+
+
+@pytest.mark.asyncio
+async def test_first_page_failure_is_raised_when_nothing_succeeded():
+    serp = FakeSerp({}, failing={1})
+
+    with pytest.raises(RuntimeError, match="page 1"):
+        await _service(serp).search("q", max_pages=1)
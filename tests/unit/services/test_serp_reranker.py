@@ -0,0 +1,58 @@
+import pytest
+
+from deep_research.services.serp_reranker import SerpReranker, normalize_title
+
+
+def _result(url: str, title: str, desc: str = "") -> dict:
+    return {"url": url, "title": title, "desc": desc}
+
+
+def test_lexical_overlap_beats_google_position():
+    results = [
+        _result("https://a.com/1", "Top 10 gardening tips", "Grow tomatoes at home"),
+        _result("https://b.com/2", "Solid-state battery energy density", "Energy density of solid-state batteries vs lithium-ion"),
+    ]
+
+    ranked = SerpReranker().rerank("solid-state battery energy density", results)
+
+    assert [r.item["url"] for r in ranked] == ["https://b.com/2", "https://a.com/1"]
+    assert ranked[0].score > ranked[1].score
+
+
+def test_domain_prior_applies_to_subdomains():
+    reranker = SerpReranker(domain_priors={"pinterest.com": -1.0, "wikipedia.org": 0.3})
+    results = [
+        _result("https://www.pinterest.com/pin/1", "Battery chemistry"),
+        _result("https://en.wikipedia.org/wiki/Battery", "Battery chemistry overview"),
+    ]
+
+    ranked = reranker.rerank("battery chemistry", results)
+
+    assert ranked[0].item["url"] == "https://en.wikipedia.org/wiki/Battery"
+    assert reranker.domain_prior("https://en.wikipedia.org/wiki/X") == 0.3
+    assert reranker.domain_prior("https://example.com") == 0.0
+
+
+def test_duplicate_titles_are_suppressed():
+    results = [
+        _result("https://a.com/story", "Battery breakthrough announced - A News"),
+        _result("https://b.com/story", "Battery breakthrough announced | B Daily"),
+        _result("https://c.com/other", "Another battery article"),
+    ]
+
+    ranked = SerpReranker().rerank("battery breakthrough", results)
+
+    assert [r.item["url"] for r in ranked] == ["https://a.com/story", "https://c.com/other"]
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Battery breakthrough - A News", "battery breakthrough"),
+        ("Battery breakthrough | B Daily", "battery breakthrough"),
+        ("What is a battery?", "battery"),
+        ("", ""),
+    ],
+)
+def test_normalize_title(title, expected):
+    assert normalize_title(title) == expected
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from deep_research.services.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flights: SingleFlight[int] = SingleFlight("test")
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert flights.coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_the_shared_work():
+    flights: SingleFlight[str] = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flights.do("key", work))
+    second = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_last_waiter_leaving_cancels_the_work():
+    flights: SingleFlight[str] = SingleFlight("test")
+    cancelled = asyncio.Event()
+
+    async def work() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "never"
+
+    caller = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_caller_joining_while_the_work_is_being_cancelled_starts_fresh():
+    flights: SingleFlight[str] = SingleFlight("test")
+    started = 0
+
+    async def work() -> str:
+        nonlocal started
+        started += 1
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # Slow cleanup keeps the cancelled task alive for a few loop iterations.
+            await asyncio.sleep(0.01)
+            raise
+        return "stale"
+
+    async def fresh_work() -> str:
+        nonlocal started
+        started += 1
+        return "fresh"
+
+    leaving = asyncio.create_task(flights.do("key", work))
+    await asyncio.sleep(0)
+    leaving.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leaving
+
+    # The first task is still unwinding; a new caller must not inherit its cancellation.
+    assert await flights.do("key", fresh_work) == "fresh"
+    assert started == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_runs_every_call():
+    flights: SingleFlight[int] = SingleFlight("test", enabled=False)
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    await asyncio.gather(*(flights.do("key", work) for _ in range(3)))
+
+    assert calls == 3
+    assert flights.coalesced == 0
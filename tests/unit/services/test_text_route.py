@@ -0,0 +1,71 @@
+import codecs
+
+import pytest
+
+from deep_research.services.models import ParsedDocument
+from deep_research.services.routing_document_parser_service import (
+    RoutingDocumentParserService,
+    _TextRoute,
+    decode_text,
+)
+
+
+class RecordingParser:
+    def __init__(self) -> None:
+        self.urls: list[str] = []
+
+    async def parse_files(self, files):
+        self.urls.extend(url for _, url, _ in files)
+        return [ParsedDocument(source_url=url, markdown="parsed") for _, url, _ in files], []
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("café, naïve".encode(), "café, naïve"),
+        (codecs.BOM_UTF8 + "# Notes".encode(), "# Notes"),
+        (codecs.BOM_UTF16_LE + "a,b\n1,2".encode("utf-16-le"), "a,b\n1,2"),
+        ("café".encode("cp1252"), "café"),
+    ],
+)
+def test_decode_text(content, expected):
+    assert decode_text(content) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("url", "content"),
+    [
+        ("https://example.com/notes.txt", b"Plain notes about batteries."),
+        ("https://example.com/README.md", b"# Title\n\nSome *markdown*."),
+        ("https://example.com/data.csv", b"cell,capacity\nNMC,250\n"),
+        ("https://example.com/data.json", b'{"capacity": 250}'),
+    ],
+)
+async def test_text_documents_pass_through(url, content):
+    fallback = RecordingParser()
+    router = RoutingDocumentParserService(
+        routes={"text": ["passthrough", "llamaparse"]},
+        parsers={"passthrough": _TextRoute(), "llamaparse": fallback},
+    )
+
+    parsed, failed = await router.parse_files([(None, url, content)])
+
+    assert failed == []
+    assert parsed[0].markdown == content.decode().strip()
+    assert fallback.urls == []
+
+
+@pytest.mark.asyncio
+async def test_blank_text_falls_back_to_the_next_parser():
+    fallback = RecordingParser()
+    router = RoutingDocumentParserService(
+        routes={"text": ["passthrough", "llamaparse"]},
+        parsers={"passthrough": _TextRoute(), "llamaparse": fallback},
+    )
+
+    parsed, failed = await router.parse_files([(None, "https://example.com/empty.txt", b" \n\t\n")])
+
+    assert failed == []
+    assert parsed[0].markdown == "parsed"
+    assert fallback.urls == ["https://example.com/empty.txt"]
@@ -0,0 +1,58 @@
+import pytest
+
+from deep_research.services.extraction_pool import ExtractionPool
+from deep_research.services.metrics import metrics
+from deep_research.services.trafilatura_document_parser_service import (
+    TIERS,
+    TrafilaturaDocumentParserService,
+    _extract_document,
+)
+
+PARAGRAPH = "<p>" + "Lithium iron phosphate cells trade energy density for cycle life and safety. " * 6 + "</p>"
+ARTICLE = (
+    "<html><head><title>Battery chemistry explained</title></head><body>"
+    "<nav><a href='/'>Home</a></nav>"
+    f"<article><h1>Battery chemistry explained</h1>{PARAGRAPH * 3}</article>"
+    "<footer>Copyright</footer></body></html>"
+).encode()
+THIN = b"<html><body><div><span>Short.</span></div></body></html>"
+
+
+def test_stops_at_the_first_tier_with_enough_text():
+    extraction = _extract_document(ARTICLE, "https://example.com/a", 250)
+
+    assert extraction.tier == "fast"
+    assert list(extraction.timings) == ["fast"]
+    assert "cycle life" in extraction.text
+
+
+def test_thin_pages_try_every_tier_and_keep_the_longest_text():
+    extraction = _extract_document(THIN, "https://example.com/b", 250)
+
+    assert list(extraction.timings) == list(TIERS)
+    assert extraction.text == "Short."
+
+
+def test_zero_min_chars_only_runs_the_fast_tier():
+    assert list(_extract_document(THIN, "https://example.com/b", 0).timings) == ["fast"]
+
+
+@pytest.mark.parametrize("content", [b"", b"<html><body></body></html>"])
+def test_nothing_extracted(content):
+    assert _extract_document(content, "https://example.com/c", 250).tier is None
+
+
+@pytest.mark.asyncio
+async def test_empty_extraction_is_a_parse_failure():
+    parser = TrafilaturaDocumentParserService(pool=ExtractionPool(executor="inline"))
+    before = metrics.snapshot()
+
+    parsed, failed = await parser.parse_files(
+        [(None, "https://example.com/a", ARTICLE), (None, "https://example.com/c", b"<html><body></body></html>")]
+    )
+
+    assert [doc.source_url for doc in parsed] == ["https://example.com/a"]
+    assert failed == ["https://example.com/c"]
+    delta = metrics.delta(before)
+    assert delta.get("parser.fast.hits") == 1
+    assert delta.get("parser.empty") == 1
@@ -0,0 +1,52 @@
+import pytest
+
+from deep_research.services.url_utils import canonicalize_url
+
+
+CANONICAL_URL_CASES = [
+    # scheme, host and port
+    ("http://example.com/article", "https://example.com/article"),
+    ("HTTPS://Example.COM/Article", "https://example.com/Article"),
+    ("https://www.example.com/article", "https://example.com/article"),
+    ("https://example.com:443/article", "https://example.com/article"),
+    ("http://example.com:80/article", "https://example.com/article"),
+    ("https://example.com:8443/article", "https://example.com:8443/article"),
+    ("https://m.example.com/article", "https://example.com/article"),
+    ("  https://example.com/article  ", "https://example.com/article"),
+    # path
+    ("https://example.com", "https://example.com/"),
+    ("https://example.com/", "https://example.com/"),
+    ("https://example.com/article/", "https://example.com/article"),
+    ("https://example.com//blog///post/", "https://example.com/blog/post"),
+    # fragment and query
+    ("https://example.com/article#section-2", "https://example.com/article"),
+    ("https://example.com/article?utm_source=x&utm_medium=y", "https://example.com/article"),
+    ("https://example.com/article?gclid=1&fbclid=2&id=7", "https://example.com/article?id=7"),
+    ("https://example.com/search?b=2&a=1", "https://example.com/search?a=1&b=2"),
+    ("https://example.com/search?q=a+b&utm_campaign=z", "https://example.com/search?q=a+b"),
+    # AMP variants
+    ("https://example.com/news/story/amp", "https://example.com/news/story"),
+    ("https://example.com/news/story/amp/", "https://example.com/news/story"),
+    ("https://example.com/news/story.amp.html", "https://example.com/news/story.html"),
+    ("https://example.com/news/story.html?amp=1", "https://example.com/news/story.html"),
+    ("https://amp.example.com/news/story", "https://example.com/news/story"),
+    ("https://www.google.com/amp/s/example.com/news/story/amp", "https://example.com/news/story"),
+    ("https://example.com/amplifiers", "https://example.com/amplifiers"),
+    # left alone
+    ("mailto:someone@example.com", "mailto:someone@example.com"),
+    ("not a url", "not a url"),
+    ("https://example.com:99999/post", "https://example.com:99999/post"),
+    ("http://example.com:abc/", "http://example.com:abc/"),
+    ("https://[::1/post", "https://[::1/post"),
+    ("", ""),
+]
+
+
+@pytest.mark.parametrize(("url", "expected"), CANONICAL_URL_CASES)
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize(("url", "expected"), CANONICAL_URL_CASES)
+def test_canonicalize_url_is_idempotent(url, expected):
+    assert canonicalize_url(expected) == expected